@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import User, Application, Membership, Club, Match
+from .models import User, Application, Membership, Club, Match, MatchEvent, Tournament, HeadToHead
 
 @admin.register(User)
 class UserAdmin(admin.ModelAdmin):
@@ -41,4 +41,37 @@ class MatchAdmin(admin.ModelAdmin):
         'location',
         'date_time',
         'status',
-    ]
\ No newline at end of file
+    ]
+@admin.register(MatchEvent)
+class MatchEventAdmin(admin.ModelAdmin):
+    list_display = [
+        'club',
+        'match',
+        'kind',
+        'created_at',
+    ]
+
+
+@admin.register(Tournament)
+class TournamentAdmin(admin.ModelAdmin):
+    list_display = [
+        'name',
+        'club',
+        'format',
+        'current_round',
+        'rounds',
+    ]
+
+
+@admin.register(HeadToHead)
+class HeadToHeadAdmin(admin.ModelAdmin):
+    list_display = [
+        'club',
+        'player_1',
+        'player_2',
+        'games',
+        'player_1_wins',
+        'player_2_wins',
+        'draws',
+        'last_played',
+    ]
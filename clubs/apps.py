@@ -1,6 +1,16 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_delete, post_migrate, post_save
 
 
 class ClubsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'clubs'
+
+    def ready(self):
+        from clubs.search import restore_search_triggers
+        post_migrate.connect(restore_search_triggers, sender=self)
+        from clubs.menus import club_changed, membership_changed
+        from clubs.models import Club, Membership
+        post_save.connect(membership_changed, sender=Membership)
+        post_delete.connect(membership_changed, sender=Membership)
+        post_save.connect(club_changed, sender=Club)
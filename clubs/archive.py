@@ -0,0 +1,119 @@
+"""Archival of old finished matches and processed applications.
+
+Rows are moved in batches, each batch in one transaction: the rows are
+copied into the compact archive tables, the player and club summary rows
+are brought up to date, and the originals are deleted. Head-to-head
+records read the archive too, so they need no update.
+
+Pending matches, which are still to be played, and tournament matches,
+which the tournament standings are computed from, are never archived.
+Accepted applications hold the personal statement of a current member and
+stay in place, only rejected ones are archived.
+"""
+
+from collections import Counter
+from datetime import timedelta
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from clubs.models import (Match, Application, ArchivedMatch, ArchivedApplication,
+    PlayerArchiveStats, ClubArchiveStats)
+
+# Rows moved per transaction
+BATCH_SIZE = 1000
+
+MATCH_FIELDS = ['id', 'club_id', 'player_1_id', 'player_2_id', 'location', 'date_time', 'status']
+APPLICATION_FIELDS = ['id', 'user_id', 'club_id', 'status', 'created_at']
+
+def archive_matches(days = None, batch_size = BATCH_SIZE):
+    """Archives the finished matches played more than the given number of days ago, returns how many."""
+    days = settings.ARCHIVE_MATCHES_AFTER_DAYS if days is None else days
+    matches = (Match.objects
+        .exclude(status = Match.PENDING)
+        .filter(tournament__isnull = True, date_time__lt = timezone.now() - timedelta(days = days))
+        .order_by('id'))
+    return _archive(matches, MATCH_FIELDS, batch_size, _move_matches)
+
+def archive_applications(days = None, batch_size = BATCH_SIZE):
+    """Archives the rejected applications made more than the given number of days ago, returns how many."""
+    days = settings.ARCHIVE_APPLICATIONS_AFTER_DAYS if days is None else days
+    applications = (Application.objects
+        .filter(status = Application.REJECTED, created_at__lt = timezone.now() - timedelta(days = days))
+        .order_by('id'))
+    return _archive(applications, APPLICATION_FIELDS, batch_size, _move_applications)
+
+def _archive(queryset, fields, batch_size, move):
+    """Moves the rows of the queryset batch by batch until none are left."""
+    archived = 0
+    while True:
+        with transaction.atomic():
+            rows = list(queryset.values(*fields)[:batch_size])
+            if not rows:
+                return archived
+            move(rows)
+            queryset.model.objects.filter(id__in = [row['id'] for row in rows]).delete()
+        archived += len(rows)
+
+def _move_matches(rows):
+    """Copies a batch of matches into the archive and adds their results to the summary rows."""
+    ArchivedMatch.objects.bulk_create([
+        ArchivedMatch(**{field: row[field] for field in MATCH_FIELDS if field != 'id'}) for row in rows
+    ])
+    player_results = {}
+    club_totals = {}
+    for row in rows:
+        club_counter = club_totals.setdefault(row['club_id'], Counter())
+        club_counter['matches'] += 1
+        club_counter['cancelled'] += row['status'] == Match.CANCELLED
+        club_counter['draws'] += row['status'] == Match.DRAW
+        for player, won, lost in (('player_1_id', Match.PLAYER1, Match.PLAYER2), ('player_2_id', Match.PLAYER2, Match.PLAYER1)):
+            counter = player_results.setdefault((row['club_id'], row[player]), Counter())
+            counter['games'] += 1
+            counter['wins'] += row['status'] == won
+            counter['losses'] += row['status'] == lost
+            counter['draws'] += row['status'] == Match.DRAW
+    _add_player_results(player_results)
+    _add_club_totals(club_totals)
+
+def _move_applications(rows):
+    """Copies a batch of applications into the archive and counts them in the club summary rows."""
+    ArchivedApplication.objects.bulk_create([
+        ArchivedApplication(**{field: row[field] for field in APPLICATION_FIELDS if field != 'id'}) for row in rows
+    ])
+    club_totals = {}
+    for row in rows:
+        club_totals.setdefault(row['club_id'], Counter())['rejected_applications'] += 1
+    _add_club_totals(club_totals)
+
+def _add_player_results(player_results):
+    """Adds the counters to the stats of each (club, player), reading and writing them in bulk."""
+    club_ids = {club_id for club_id, user_id in player_results}
+    user_ids = {user_id for club_id, user_id in player_results}
+    existing = {
+        (stats.club_id, stats.user_id): stats
+        for stats in PlayerArchiveStats.objects.select_for_update().filter(club_id__in = club_ids, user_id__in = user_ids)
+    }
+    created = []
+    for (club_id, user_id), counter in player_results.items():
+        stats = existing.get((club_id, user_id))
+        if stats is None:
+            created.append(PlayerArchiveStats(club_id = club_id, user_id = user_id, **counter))
+            continue
+        for name, value in counter.items():
+            setattr(stats, name, getattr(stats, name) + value)
+    PlayerArchiveStats.objects.bulk_update(existing.values(), ['games', 'wins', 'losses', 'draws'])
+    PlayerArchiveStats.objects.bulk_create(created)
+
+def _add_club_totals(club_totals):
+    """Adds the counters to the archive totals of each club."""
+    existing = ClubArchiveStats.objects.select_for_update().in_bulk(list(club_totals))
+    created = []
+    for club_id, counter in club_totals.items():
+        stats = existing.get(club_id)
+        if stats is None:
+            created.append(ClubArchiveStats(club_id = club_id, **counter))
+            continue
+        for name, value in counter.items():
+            setattr(stats, name, getattr(stats, name) + value)
+    ClubArchiveStats.objects.bulk_update(existing.values(), ['matches', 'draws', 'cancelled', 'rejected_applications'])
+    ClubArchiveStats.objects.bulk_create(created)
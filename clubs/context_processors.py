@@ -0,0 +1,28 @@
+"""Context processors adding the data every page of the site may need."""
+
+from django.utils.functional import SimpleLazyObject
+from clubs.menus import club_menu
+from clubs.views.helpers import _is_member, _is_officer, _is_owner
+
+def club_roles(request):
+    """Adds the role flags of the logged in user in the club of the page.
+
+    The flags are lazy, a page only queries the membership when its template
+    uses one, and all of them share that single query. Officers include the
+    owner and members include both.
+    """
+    resolver_match = getattr(request, 'resolver_match', None)
+    club_id = resolver_match.kwargs.get('club_id') if resolver_match else None
+    if club_id is None:
+        return {}
+    return {
+        'logged_in_user_is_member': SimpleLazyObject(lambda: _is_member(request, club_id)),
+        'logged_in_user_is_officer': SimpleLazyObject(lambda: _is_officer(request, club_id)),
+        'logged_in_user_is_owner': SimpleLazyObject(lambda: _is_owner(request, club_id)),
+    }
+
+def my_clubs(request):
+    """Adds the clubs of the logged in user for the "My clubs" menu, loaded from the cache when used."""
+    if not request.user.is_authenticated:
+        return {}
+    return {'my_clubs': SimpleLazyObject(lambda: club_menu(request.user.id))}
@@ -0,0 +1,185 @@
+"""Deletion of clubs and closure of accounts in the background.
+
+Deleting a club only marks it as deleted, which hides it from Club.objects
+and so from every page, and queues a DeletionJob. The purge_deleted command
+then emails the members and deletes the rows of the club table by table, a
+batch per transaction, recording its progress on the job after each batch.
+A purge that is stopped resumes from the table it was at. Children are
+purged before their parents, so each batch only cascades to rows that are
+already gone, and the club row goes last.
+
+Closing an account deactivates the user at once, which stops them logging
+in and hides them from searches, and queues a DeletionJob in the same way.
+Their applications are then purged, but the user row is kept and
+anonymized: it stays as the tombstone player of their matches, so the
+history, head-to-head records and statistics of their opponents and clubs
+are left as they were.
+
+Several purge_deleted runs can overlap. A run claims each job with a
+conditional update before purging it and renews the claim with every batch,
+so a job is only run by one of them. The claim of a run that was killed
+expires after CLAIM_TIMEOUT and the job is then taken over.
+"""
+
+from datetime import timedelta
+from django.core.mail import EmailMessage
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from clubs.models import (Club, Membership, Application, Match, MatchEvent, Tournament, TournamentEntry,
+    HeadToHead, ArchivedMatch, ArchivedApplication, PlayerArchiveStats, ClubArchiveStats, User, DeletionJob)
+
+# Rows deleted per transaction
+BATCH_SIZE = 1000
+
+# Time after which the claim of a run that stopped renewing it can be taken over
+CLAIM_TIMEOUT = timedelta(minutes = 10)
+
+def delete_club(club):
+    """Hides the club at once and queues the purge of its rows, returns the job."""
+    with transaction.atomic():
+        club.deleted_at = timezone.now()
+        club.save(update_fields = ['deleted_at'])
+        return DeletionJob.objects.create(kind = DeletionJob.CLUB, target_id = club.id)
+
+def close_account(user):
+    """Deactivates the user at once and queues the purge of their rows, returns the job."""
+    with transaction.atomic():
+        user.is_active = False
+        user.save(update_fields = ['is_active'])
+        return DeletionJob.objects.create(kind = DeletionJob.USER, target_id = user.id)
+
+def run_deletion_jobs(batch_size = BATCH_SIZE):
+    """Runs the unfinished deletion jobs no other run holds, in the order they were queued, returns how many."""
+    finished = 0
+    for job_id in list(DeletionJob.objects.filter(finished_at__isnull = True).values_list('id', flat = True)):
+        job = _claim(job_id)
+        if job is None:
+            continue
+        try:
+            PURGES[job.kind](job, batch_size)
+        finally:
+            if not job.is_finished():
+                _release(job)
+        finished += 1
+    return finished
+
+def purge_club(job, batch_size = BATCH_SIZE):
+    """Emails the members of the deleted club, then deletes its rows and the club itself."""
+    club = Club.all_objects.filter(id = job.target_id).first()
+    if club is not None:
+        if not job.notified:
+            _send_deletion_email(club)
+            job.notified = True
+            job.save(update_fields = ['notified'])
+        _purge_stages(job, _club_rows(club.id), batch_size)
+    with transaction.atomic():
+        if club is not None:
+            club.delete()
+        _finish(job)
+
+def purge_user(job, batch_size = BATCH_SIZE):
+    """Deletes the memberships and applications of the closed account, then anonymizes the user."""
+    user = User.objects.filter(id = job.target_id).first()
+    if user is not None:
+        _purge_stages(job, _user_rows(user.id), batch_size)
+    with transaction.atomic():
+        if user is not None:
+            _anonymize(user)
+        _finish(job)
+
+def _claim(job_id):
+    """Takes the job for this run with a conditional update, returns it or None if another run holds it."""
+    now = timezone.now()
+    claimed = (DeletionJob.objects
+        .filter(id = job_id, finished_at__isnull = True)
+        .filter(Q(claimed_at__isnull = True) | Q(claimed_at__lt = now - CLAIM_TIMEOUT))
+        .update(claimed_at = now))
+    return DeletionJob.objects.get(id = job_id) if claimed else None
+
+def _release(job):
+    """Gives up the claim on a job that was stopped, so the next run takes it at once."""
+    job.claimed_at = None
+    job.save(update_fields = ['claimed_at'])
+
+def _club_rows(club_id):
+    """Returns the rows of a club by table, in the order they are purged."""
+    return [
+        ('match_events', MatchEvent.objects.filter(club_id = club_id)),
+        ('matches', Match.objects.filter(club_id = club_id)),
+        ('tournament_entries', TournamentEntry.objects.filter(tournament__club_id = club_id)),
+        ('tournaments', Tournament.objects.filter(club_id = club_id)),
+        ('head_to_heads', HeadToHead.objects.filter(club_id = club_id)),
+        ('archived_matches', ArchivedMatch.objects.filter(club_id = club_id)),
+        ('archived_applications', ArchivedApplication.objects.filter(club_id = club_id)),
+        ('player_archive_stats', PlayerArchiveStats.objects.filter(club_id = club_id)),
+        ('club_archive_stats', ClubArchiveStats.objects.filter(club_id = club_id)),
+        ('applications', Application.objects.filter(club_id = club_id)),
+        ('memberships', Membership.objects.filter(club_id = club_id)),
+    ]
+
+def _user_rows(user_id):
+    """Returns the rows of a closed account by table, in the order they are purged."""
+    return [
+        ('memberships', Membership.objects.filter(user_id = user_id)),
+        ('applications', Application.objects.filter(user_id = user_id)),
+        ('archived_applications', ArchivedApplication.objects.filter(user_id = user_id)),
+    ]
+
+def _purge_stages(job, stages, batch_size):
+    """Purges the rows of each stage in turn, from the stage the job was at."""
+    names = [stage for stage, rows in stages]
+    start = names.index(job.stage) if job.stage in names else 0
+    for stage, rows in stages[start:]:
+        _purge(job, stage, rows, batch_size)
+
+def _purge(job, stage, rows, batch_size):
+    """Deletes the rows a batch per transaction, recording the progress on the job with each batch."""
+    while True:
+        with transaction.atomic():
+            keys = list(rows.order_by('pk').values_list('pk', flat = True)[:batch_size])
+            if not keys:
+                return
+            job.deleted_rows += rows.model.objects.filter(pk__in = keys).delete()[0]
+            job.stage = stage
+            fields = ['stage', 'deleted_rows']
+            if job.claimed_at is not None:
+                job.claimed_at = timezone.now()
+                fields.append('claimed_at')
+            job.save(update_fields = fields)
+
+def _anonymize(user):
+    """Replaces the personal details of a closed account, which stays as a tombstone player."""
+    user.username = f'deleted_{user.id}'
+    user.email = f'deleted_{user.id}@deleted.invalid'
+    user.first_name = 'Deleted'
+    user.last_name = 'player'
+    user.bio = ''
+    user.is_active = False
+    user.set_unusable_password()
+    user.save()
+
+def _finish(job):
+    job.finished_at = timezone.now()
+    job.save(update_fields = ['finished_at'])
+
+def _send_deletion_email(club):
+    """Sends the members of the club an email about its deletion."""
+    emails = list(User.objects.filter(membership__club = club).values_list('email', flat = True))
+    email = EmailMessage(
+        'Club Deleted',
+        f'You are recieving this email because the {club.name} club was recently deleted.'
+        '\nAs a former member of this club, you will no longer be able to access its home page.'
+        '\nWe are sorry if this causes any inconveniences.'
+        '\n'
+        '\nThe Polecat Chess Team',
+        'polecatchess@gmail.com',
+        bcc = emails
+    )
+    email.send()
+
+# Purge run for each kind of deletion job
+PURGES = {
+    DeletionJob.CLUB: purge_club,
+    DeletionJob.USER: purge_user,
+}
@@ -0,0 +1,95 @@
+"""Streaming exports of a club's members, applications and matches as CSV or JSON lines.
+
+Rows are read with QuerySet.iterator so that only one chunk is held in
+memory at a time, and every related object a row needs is joined with
+select_related so each chunk is a single query.
+
+Text a spreadsheet would run as a formula is prefixed with a quote in the
+CSV exports, since names and personal statements are typed in by users.
+"""
+
+import csv
+import json
+from clubs.models import Membership, Application, Match
+
+CSV = 'csv'
+JSONL = 'jsonl'
+
+FORMATS = {
+    CSV: 'text/csv',
+    JSONL: 'application/x-ndjson',
+}
+
+# Number of rows fetched from the database at a time
+CHUNK_SIZE = 2000
+
+# First characters that make a spreadsheet read a cell as a formula
+FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+def _members(club_id):
+    return Membership.objects.filter(club_id=club_id).select_related('user').order_by('id')
+
+def _applications(club_id):
+    return Application.objects.filter(club_id=club_id).select_related('user').order_by('id')
+
+def _matches(club_id):
+    return Match.objects.filter(club_id=club_id).select_related('player_1', 'player_2', 'tournament').order_by('id')
+
+# The exports with the queryset of a club and the (column, value) of each row
+EXPORTS = {
+    'members': (_members, [
+        ('user_id', lambda membership: membership.user_id),
+        ('username', lambda membership: membership.user.username),
+        ('first_name', lambda membership: membership.user.first_name),
+        ('last_name', lambda membership: membership.user.last_name),
+        ('email', lambda membership: membership.user.email),
+        ('experience_level', lambda membership: membership.user.experience_level),
+        ('role', lambda membership: membership.role),
+    ]),
+    'applications': (_applications, [
+        ('application_id', lambda application: application.id),
+        ('username', lambda application: application.user.username),
+        ('first_name', lambda application: application.user.first_name),
+        ('last_name', lambda application: application.user.last_name),
+        ('email', lambda application: application.user.email),
+        ('experience_level', lambda application: application.user.experience_level),
+        ('status', lambda application: application.status),
+        ('personal_statement', lambda application: application.personal_statement),
+        ('created_at', lambda application: application.created_at.isoformat()),
+    ]),
+    'matches': (_matches, [
+        ('match_id', lambda match: match.id),
+        ('date_time', lambda match: match.date_time.isoformat()),
+        ('location', lambda match: match.location),
+        ('player_1', lambda match: match.player_1.username),
+        ('player_2', lambda match: match.player_2.username),
+        ('status', lambda match: match.status),
+        ('tournament', lambda match: match.tournament.name if match.tournament else ''),
+        ('round', lambda match: match.round or ''),
+    ]),
+}
+
+def _csv_cell(value):
+    """Returns the value with a quote in front if a spreadsheet would read it as a formula."""
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+class _Echo:
+    """File-like object that returns what is written, so csv.writer can format one row at a time."""
+
+    def write(self, value):
+        return value
+
+def export_rows(kind, club_id, export_format):
+    """Yields the export of a club as lines of text, the CSV header first."""
+    queryset, columns = EXPORTS[kind]
+    rows = queryset(club_id).iterator(chunk_size=CHUNK_SIZE)
+    if export_format == CSV:
+        writer = csv.writer(_Echo())
+        yield writer.writerow([name for name, value in columns])
+        for row in rows:
+            yield writer.writerow([_csv_cell(value(row)) for name, value in columns])
+    else:
+        for row in rows:
+            yield json.dumps({name: value(row) for name, value in columns}) + '\n'
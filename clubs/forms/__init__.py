@@ -3,3 +3,5 @@ from .authentication_forms import *
 from .account_forms import *
 from .club_forms import *
 from .match_froms import *
+from .tournament_forms import *
+from .import_forms import *
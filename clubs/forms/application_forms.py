@@ -1,7 +1,9 @@
 """Forms to send an application to a given club."""
 
 from django import forms
-from clubs.models import Application, Club
+from django.db import IntegrityError
+from clubs.models import Application, Club, has_open_application
+from clubs.forms.widgets import AutocompleteWidget
 
 class MyModelChoiceField(forms.ModelChoiceField):
     """A choice field that contains the possible list of clubs."""
@@ -11,7 +13,7 @@ class MyModelChoiceField(forms.ModelChoiceField):
 class ApplicationForm(forms.ModelForm):
     """Form enabling users to apply to a club."""
 
-    club = MyModelChoiceField(queryset=Club.objects.all(), to_field_name = "name")
+    club = MyModelChoiceField(queryset=Club.objects.all(), widget=AutocompleteWidget('club_autocomplete'))
 
     class Meta:
         """Form options."""
@@ -20,11 +22,17 @@ class ApplicationForm(forms.ModelForm):
         widgets = {'personal_statement': forms.Textarea()}
 
     def save(self, userIn):
-        """Returns newly created application if possible."""
+        """Returns newly created application if possible, or None if the user
+        already has a pending or accepted application to the club."""
         super().save(commit=False)
-        application = Application.objects.create(
-            personal_statement = self.cleaned_data.get('personal_statement'),
-            club = self.cleaned_data.get('club'),
-            user = userIn
-        )
-        return application
+        club = self.cleaned_data.get('club')
+        if has_open_application(userIn, club):
+            return None
+        try:
+            return Application.objects.create(
+                personal_statement = self.cleaned_data.get('personal_statement'),
+                club = club,
+                user = userIn
+            )
+        except IntegrityError:
+            return None
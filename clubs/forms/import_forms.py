@@ -0,0 +1,15 @@
+"""Form to import members or matches into a club."""
+
+from django import forms
+from clubs.imports import MEMBERS, MATCHES
+
+class ImportForm(forms.Form):
+    """Form enabling officers to upload a CSV file of members or matches."""
+
+    KINDS = [
+        (MEMBERS, "Members"),
+        (MATCHES, "Matches"),
+    ]
+
+    kind = forms.ChoiceField(choices=KINDS)
+    file = forms.FileField(help_text='A CSV file with a header row.')
@@ -1,10 +1,37 @@
 """Forms to create and update matches between two memebers of the same club."""
 
 from django import forms
-from clubs.models import Match, User, Membership
+from django.core.exceptions import ValidationError
+from django.db.models import Model, Q
+from clubs.models import Match, User
+from clubs.forms.widgets import AutocompleteWidget
+from clubs.search import member_label
 from datetime import datetime
 import pytz
 
+class MemberChoiceField(forms.ModelChoiceField):
+    """A choice of member picked with an autocomplete, cleaned to the id of the member.
+
+    The id is not looked up here, CreateMatchForm.clean loads both players
+    with a single query.
+    """
+
+    def to_python(self, value):
+        if value in self.empty_values:
+            return None
+        if isinstance(value, Model):
+            return value.pk
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            raise ValidationError(self.error_messages['invalid_choice'], code='invalid_choice')
+
+    def validate(self, value):
+        forms.Field.validate(self, value)
+
+    def label_from_instance(self, user):
+        return member_label(user)
+
 class CreateMatchForm(forms.ModelForm):
     """Form enabling officers to create a new match."""
     
@@ -12,16 +39,39 @@ class CreateMatchForm(forms.ModelForm):
         """Form options."""
         model = Match
         fields = ['player_1', 'player_2', 'location', 'date_time']
-        widgets = {'date_time': forms.DateTimeInput(format='%Y-%m-%d %H:%M:%S',
-         attrs={'class': 'datetimepicker', 'placeholder': 'yyyy-MM-dd HH:mm'})}
+        field_classes = {'player_1': MemberChoiceField, 'player_2': MemberChoiceField}
+        widgets = {
+            'player_1': AutocompleteWidget('member_autocomplete'),
+            'player_2': AutocompleteWidget('member_autocomplete'),
+            'date_time': forms.DateTimeInput(format='%Y-%m-%d %H:%M:%S',
+                attrs={'class': 'datetimepicker', 'placeholder': 'yyyy-MM-dd HH:mm'}),
+        }
 
     def __init__(self, club, *args, **kwargs):
-        """Initialises form choices."""
+        """Initialises form choices, the players are picked among the members of the club."""
         super(CreateMatchForm, self).__init__(*args, **kwargs)
-        membership = Membership.objects.filter(club=club)
-        queryset = User.objects.filter(membership__in = membership)
-        self.fields['player_1'].queryset = queryset
-        self.fields['player_2'].queryset = queryset
+        queryset = User.objects.filter(membership__club = club)
+        for field in ('player_1', 'player_2'):
+            self.fields[field].queryset = queryset
+            self.fields[field].widget.url_kwargs = {'club_id': club.id}
+
+    def clean(self):
+        """Replaces the ids of the players with the members they belong to, loaded with one query."""
+        cleaned_data = super().clean()
+        ids = [cleaned_data[field] for field in ('player_1', 'player_2') if cleaned_data.get(field) is not None]
+        members = self.fields['player_1'].queryset.in_bulk(ids)
+        for field in ('player_1', 'player_2'):
+            if cleaned_data.get(field) is None:
+                continue
+            if cleaned_data[field] in members:
+                cleaned_data[field] = members[cleaned_data[field]]
+            else:
+                self.add_error(field, ValidationError(self.fields[field].error_messages['invalid_choice'], code='invalid_choice'))
+        return cleaned_data
+
+    def _get_validation_exclusions(self):
+        """Leaves the players out of the model validation, clean already loaded them."""
+        return super()._get_validation_exclusions() + ['player_1', 'player_2']
 
     def save(self, club):
         """Save and returns a match object if possible."""
@@ -77,11 +127,8 @@ class CreateMatchForm(forms.ModelForm):
         player_1 = form.cleaned_data.get('player_1')
         player_2 = form.cleaned_data.get('player_2')
         date_time = form.cleaned_data.get('date_time')
-        a = Match.objects.filter(player_1=player_1, date_time=date_time).exists() 
-        b = Match.objects.filter(player_2=player_1, date_time=date_time).exists()  
-        c = Match.objects.filter(player_1=player_2, date_time=date_time).exists()  
-        d = Match.objects.filter(player_2=player_2, date_time=date_time).exists()
-        return a or b or c or d
+        players = [player_1, player_2]
+        return Match.objects.in_open_clubs().filter(date_time=date_time).filter(Q(player_1__in=players) | Q(player_2__in=players)).exists()
 
 class UpdateMatchOutcomeForm(forms.ModelForm):
     """Form enabling officers to update an outcome of a match."""
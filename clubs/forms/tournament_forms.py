@@ -0,0 +1,78 @@
+"""Forms to create tournaments and pair their rounds."""
+
+from django import forms
+from django.db import transaction
+from clubs.models import Tournament, enter_club_members
+from django.utils import timezone
+
+class CreateTournamentForm(forms.ModelForm):
+    """Form enabling officers to create a new tournament for the members of their club."""
+
+    class Meta:
+        """Form options."""
+        model = Tournament
+        fields = ['name', 'location', 'format', 'rounds', 'starts_at', 'days_between_rounds']
+        widgets = {'starts_at': forms.DateTimeInput(format='%Y-%m-%d %H:%M:%S',
+         attrs={'class': 'datetimepicker', 'placeholder': 'yyyy-MM-dd HH:mm'})}
+        help_texts = {
+            'rounds': 'Only needed for Swiss tournaments, the other formats play as many rounds as they need.',
+            'starts_at': 'Needed for round robin and knockout tournaments, which are scheduled straight away.',
+        }
+
+    def __init__(self, *args, **kwargs):
+        """Makes the fields that only some formats use optional."""
+        super().__init__(*args, **kwargs)
+        self.fields['format'].required = False
+        self.fields['rounds'].required = False
+        self.fields['days_between_rounds'].required = False
+
+    def clean(self):
+        """Check the fields needed by the chosen format."""
+        super().clean()
+        tournament_format = self.cleaned_data.get('format') or Tournament.SWISS
+        self.cleaned_data['format'] = tournament_format
+        if self.cleaned_data.get('days_between_rounds') is None and 'days_between_rounds' not in self.errors:
+            self.cleaned_data['days_between_rounds'] = Tournament._meta.get_field('days_between_rounds').default
+        if tournament_format == Tournament.SWISS:
+            if not self.cleaned_data.get('rounds') and 'rounds' not in self.errors:
+                self.add_error('rounds', 'Swiss tournaments need a number of rounds!')
+        else:
+            starts_at = self.cleaned_data.get('starts_at')
+            if starts_at is None:
+                if 'starts_at' not in self.errors:
+                    self.add_error('starts_at', 'Round robin and knockout tournaments need a start date/time!')
+            elif starts_at <= timezone.now():
+                self.add_error('starts_at', 'Date/time must be in future!')
+        return self.cleaned_data
+
+    def save(self, club):
+        """Save the tournament, enter every member of the club, schedule its rounds and return it.
+
+        Raises PairingError, without saving anything, if a round cannot be scheduled.
+        """
+        super().save(commit=False)
+        with transaction.atomic():
+            tournament = Tournament.objects.create(
+                club = club,
+                name = self.cleaned_data.get('name'),
+                location = self.cleaned_data.get('location'),
+                format = self.cleaned_data.get('format'),
+                rounds = self.cleaned_data.get('rounds') or 1,
+                starts_at = self.cleaned_data.get('starts_at'),
+                days_between_rounds = self.cleaned_data.get('days_between_rounds'),
+            )
+            enter_club_members(tournament)
+            tournament.schedule()
+        return tournament
+
+class PairRoundForm(forms.Form):
+    """Form enabling officers to pair the next round of a tournament."""
+    date_time = forms.DateTimeField(widget=forms.DateTimeInput(format='%Y-%m-%d %H:%M:%S',
+        attrs={'class': 'datetimepicker', 'placeholder': 'yyyy-MM-dd HH:mm'}))
+
+    def clean_date_time(self):
+        """Only allow rounds to be scheduled in the future."""
+        date_time = self.cleaned_data.get('date_time')
+        if date_time <= timezone.now():
+            raise forms.ValidationError('Date/time must be in future!')
+        return date_time
@@ -0,0 +1,37 @@
+"""Widgets shared by the forms."""
+
+from django import forms
+from django.core.exceptions import ValidationError
+from django.urls import reverse
+
+class AutocompleteWidget(forms.Widget):
+    """Text input suggesting the choices of a model choice field as the user types.
+
+    The suggestions are fetched from a JSON endpoint returning the id and name
+    of the matching choices, and the id of the chosen one is submitted. Only
+    the selected choice is ever rendered, never the whole list.
+    """
+    template_name = 'widgets/autocomplete.html'
+
+    def __init__(self, url_name, url_kwargs = None, attrs = None):
+        super().__init__(attrs)
+        self.url_name = url_name
+        self.url_kwargs = url_kwargs or {}
+        self.choices = []
+
+    def get_context(self, name, value, attrs):
+        context = super().get_context(name, value, attrs)
+        context['widget']['url'] = reverse(self.url_name, kwargs = self.url_kwargs)
+        context['widget']['label'] = self.label_of(context['widget']['value'])
+        return context
+
+    def label_of(self, value):
+        """Returns the label of the selected choice, or an empty string if there is none."""
+        queryset = getattr(self.choices, 'queryset', None)
+        if value is None or queryset is None:
+            return ''
+        try:
+            instance = queryset.filter(pk = value).first()
+        except (ValueError, TypeError, ValidationError):
+            return ''
+        return self.choices.field.label_from_instance(instance) if instance else ''
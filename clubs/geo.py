@@ -0,0 +1,100 @@
+"""Offline geocoding of club locations and the grid used to find the clubs nearest to a point.
+
+Locations are looked up in the gazetteer shipped in clubs/data, no network
+geocoder is used. The earth is split into cells of GRID_DEGREES and each
+club stores the integer index of its cell, so the clubs around a point are
+found by reading squares of cells of growing size.
+"""
+
+import csv
+import math
+import re
+from functools import lru_cache
+from pathlib import Path
+
+GAZETTEER_PATH = Path(__file__).resolve().parent / 'data' / 'gazetteer.csv'
+
+GRID_DEGREES = 0.1
+GRID_ROWS = int(180 / GRID_DEGREES)
+GRID_COLUMNS = int(360 / GRID_DEGREES)
+
+EARTH_RADIUS_KM = 6371.0
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180
+
+@lru_cache(maxsize=None)
+def gazetteer():
+    """Returns the places of the gazetteer, by normalised name, as (latitude, longitude)."""
+    with open(GAZETTEER_PATH, newline='', encoding='utf-8') as gazetteer_file:
+        return {
+            normalise(row['name']): (float(row['latitude']), float(row['longitude']))
+            for row in csv.DictReader(gazetteer_file)
+        }
+
+def normalise(place):
+    """Returns the place name in lower case with punctuation and extra spaces removed."""
+    return ' '.join(re.findall(r"[\w']+", place.lower()))
+
+def geocode(location):
+    """Returns the (latitude, longitude) of a free text location, or None if no place in it is known.
+
+    The whole location is looked up first, then the longest run of words
+    that names a known place, so "Chess cafe, Strand, London" finds Strand.
+    """
+    places = gazetteer()
+    words = normalise(location).split()
+    for length in range(len(words), 0, -1):
+        for start in range(len(words) - length + 1):
+            coordinates = places.get(' '.join(words[start:start + length]))
+            if coordinates is not None:
+                return coordinates
+    return None
+
+def grid_cell(latitude, longitude):
+    """Returns the index of the grid cell containing the point."""
+    row, column = _row_and_column(latitude, longitude)
+    return row * GRID_COLUMNS + column
+
+def square_cell_ranges(latitude, longitude, radius):
+    """Returns the (first, last) cell index ranges covering the square of cells around the point.
+
+    Cells are numbered row by row, so each row of the square is one range,
+    split in two where it wraps around the antimeridian.
+    """
+    row, column = _row_and_column(latitude, longitude)
+    ranges = []
+    for cell_row in range(max(row - radius, 0), min(row + radius, GRID_ROWS - 1) + 1):
+        first_column, last_column = column - radius, column + radius
+        if last_column - first_column + 1 >= GRID_COLUMNS:
+            spans = [(0, GRID_COLUMNS - 1)]
+        elif first_column < 0:
+            spans = [(0, last_column), (first_column + GRID_COLUMNS, GRID_COLUMNS - 1)]
+        elif last_column >= GRID_COLUMNS:
+            spans = [(first_column, GRID_COLUMNS - 1), (0, last_column - GRID_COLUMNS)]
+        else:
+            spans = [(first_column, last_column)]
+        ranges += [(cell_row * GRID_COLUMNS + first, cell_row * GRID_COLUMNS + last) for first, last in spans]
+    return ranges
+
+def covered_radius_km(latitude, radius):
+    """Returns the distance from the point within which every place lies in the square read.
+
+    Any point outside the square is at least radius cells away along the
+    latitude or the longitude, and longitude cells narrow towards the poles.
+    """
+    furthest_latitude = min(abs(latitude) + (radius + 1) * GRID_DEGREES, 90)
+    cell_km = GRID_DEGREES * KM_PER_DEGREE * math.cos(math.radians(furthest_latitude))
+    return radius * cell_km
+
+def distance_km(latitude, longitude, other_latitude, other_longitude):
+    """Returns the great circle distance between two points."""
+    latitude, longitude, other_latitude, other_longitude = map(
+        math.radians, (latitude, longitude, other_latitude, other_longitude))
+    a = (math.sin((other_latitude - latitude) / 2) ** 2
+        + math.cos(latitude) * math.cos(other_latitude) * math.sin((other_longitude - longitude) / 2) ** 2)
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+def _row_and_column(latitude, longitude):
+    """Returns the grid row and column of the point."""
+    row = min(int((latitude + 90) // GRID_DEGREES), GRID_ROWS - 1)
+    column = int((longitude + 180) // GRID_DEGREES) % GRID_COLUMNS
+    return row, column
@@ -0,0 +1,346 @@
+"""Bulk imports of members and historical matches into a club from CSV files.
+
+An import reads the file twice. The first pass validates every row and
+collects row-level errors without writing anything. Only a file without
+errors is read again, and rows are then written in chunks, each chunk with
+a few set-based lookups and one bulk_create per model inside its own
+transaction. Matches skip Match.save, their checks are done per chunk.
+
+Imported users get an unusable password, nothing is hashed during the
+import, and they choose their password with the password reset page.
+Users who already have an account only join the club if they applied to
+it; the others get a pending application, which they can cancel, instead
+of being enrolled without their consent. Usernames and emails are matched
+ignoring case.
+"""
+
+import csv
+from datetime import datetime
+from django.core.exceptions import ValidationError
+from django.core.validators import validate_email
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.functions import Lower
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from clubs.menus import invalidate_club_menus
+from clubs.models import User, Membership, Application, Match, rebuild_head_to_heads
+
+MEMBERS = 'members'
+MATCHES = 'matches'
+
+# Rows validated and written together
+CHUNK_SIZE = 1000
+
+# Errors kept for the report, the rest are only counted
+MAX_REPORTED_ERRORS = 100
+
+IMPORTED_STATEMENT = "Imported by an officer of the club."
+INVITED_STATEMENT = "Listed in an import by an officer of the club."
+
+MEMBER_COLUMNS = ['username', 'first_name', 'last_name', 'email']
+MATCH_COLUMNS = ['date_time', 'player_1', 'player_2', 'status']
+
+# Results accepted in the status column as well as the Match statuses
+RESULTS = {
+    '1-0': Match.PLAYER1,
+    '0-1': Match.PLAYER2,
+    '1/2-1/2': Match.DRAW,
+    '½-½': Match.DRAW,
+}
+
+class ImportFileError(ValueError):
+    """Raised when a file cannot be imported at all."""
+
+class ImportResult:
+    """Outcome of an import: the rows created, skipped and left as pending applications, and the errors of the invalid rows."""
+
+    def __init__(self):
+        self.created = 0
+        self.skipped = 0
+        self.invited = 0
+        self.error_count = 0
+        self.errors = []
+
+    def add_error(self, line, message):
+        """Records an error of the row on the given line of the file."""
+        self.error_count += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append((line, message))
+
+    def is_valid(self):
+        """Returns true if no row had an error."""
+        return self.error_count == 0
+
+def import_members(club, csv_file, dry_run = False):
+    """Imports the members listed in the file into the club, creating the users that do not exist yet."""
+    return _import(_MemberImport(club), csv_file, dry_run)
+
+def import_matches(club, csv_file, dry_run = False):
+    """Imports the matches listed in the file, between members of the club."""
+    result = _import(_MatchImport(club), csv_file, dry_run)
+    if result.created:
+        rebuild_head_to_heads(club.id)
+    return result
+
+def _import(importer, csv_file, dry_run):
+    """Validates the whole file, then writes it chunk by chunk if every row is valid."""
+    result = ImportResult()
+    for chunk in _chunks(_rows(csv_file, importer.required_columns)):
+        importer.validate(chunk, result)
+    if dry_run or not result.is_valid():
+        return result
+    csv_file.seek(0)
+    for chunk in _chunks(_rows(csv_file, importer.required_columns)):
+        with transaction.atomic():
+            importer.write(chunk, result)
+    return result
+
+def _rows(csv_file, required_columns):
+    """Yields (line number, row) for every row of the file with its values stripped."""
+    reader = csv.DictReader(csv_file)
+    missing = [column for column in required_columns if column not in (reader.fieldnames or [])]
+    if missing:
+        raise ImportFileError(f"The file is missing the columns: {', '.join(missing)}")
+    for row in reader:
+        yield reader.line_num, {key: (value or '').strip() for key, value in row.items() if key is not None}
+
+def _chunks(rows):
+    """Yields lists of at most CHUNK_SIZE rows."""
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == CHUNK_SIZE:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+class _MemberImport:
+    """Validation and writing of the rows of a members file."""
+    required_columns = MEMBER_COLUMNS
+
+    ROLES = [Membership.MEMBER, Membership.OFFICER]
+    EXPERIENCE_LEVELS = [level for level, label in User.EXPERIENCE_LEVELS]
+
+    def __init__(self, club):
+        self.club = club
+        self.seen_usernames = set()
+        self.seen_emails = set()
+
+    def validate(self, chunk, result):
+        """Checks the rows of a chunk on their own and against the users that already exist."""
+        valid = []
+        for line, row in self._normalised(chunk):
+            error = self._row_error(row)
+            if error:
+                result.add_error(line, error)
+            else:
+                valid.append((line, row))
+        existing = self._existing_users(row for line, row in valid)
+        for line, row in valid:
+            user = existing['by_username'].get(row['username'].lower())
+            if user is not None and user.email.lower() != row['email'].lower():
+                result.add_error(line, f"Username {row['username']} is taken by another user.")
+
+    def write(self, chunk, result):
+        """Creates the missing users with their accepted applications and memberships, and enrolls the
+        existing users who applied to the club. The other existing users get a pending application."""
+        rows = [row for line, row in self._normalised(chunk)]
+        existing = self._existing_users(rows)
+        new_users = [
+            User(
+                username = row['username'],
+                first_name = row['first_name'],
+                last_name = row['last_name'],
+                email = row['email'],
+                bio = row.get('bio', ''),
+                experience_level = row.get('experience_level') or User.BEGINNER,
+            ) for row in rows if row['email'].lower() not in existing['by_email']
+        ]
+        for user in new_users:
+            user.set_unusable_password()
+        User.objects.bulk_create(new_users, batch_size = CHUNK_SIZE)
+        new_emails = {user.email.lower() for user in new_users}
+        users = self._existing_users(rows)['by_email']
+        user_ids = [users[row['email'].lower()].id for row in rows]
+
+        members = set(Membership.objects.filter(club = self.club, user_id__in = user_ids).values_list('user_id', flat = True))
+        outsiders = [row for row in rows if users[row['email'].lower()].id not in members]
+        result.skipped += len(rows) - len(outsiders)
+        applied = set(Application.objects.filter(club = self.club, user_id__in = [users[row['email'].lower()].id for row in outsiders],
+            status__in = Application.OPEN_STATUSES).values_list('user_id', flat = True))
+        joining, invited_ids = [], []
+        for row in outsiders:
+            user_id = users[row['email'].lower()].id
+            if row['email'].lower() in new_emails or user_id in applied:
+                joining.append(row)
+            else:
+                invited_ids.append(user_id)
+        joining_ids = [users[row['email'].lower()].id for row in joining]
+        result.created += len(joining)
+        result.invited += len(invited_ids)
+
+        Application.objects.filter(club = self.club, user_id__in = joining_ids, status = Application.PENDING).update(
+            status = Application.ACCEPTED)
+        Application.objects.bulk_create([
+            Application(user_id = user_id, club = self.club, personal_statement = IMPORTED_STATEMENT, status = Application.ACCEPTED)
+            for user_id in joining_ids if user_id not in applied
+        ] + [
+            Application(user_id = user_id, club = self.club, personal_statement = INVITED_STATEMENT, status = Application.PENDING)
+            for user_id in invited_ids
+        ], batch_size = CHUNK_SIZE)
+        Membership.objects.bulk_create([
+            Membership(user_id = users[row['email'].lower()].id, club = self.club, role = row.get('role') or Membership.MEMBER)
+            for row in joining
+        ], batch_size = CHUNK_SIZE)
+        invalidate_club_menus(joining_ids)
+
+    def _row_error(self, row):
+        """Returns what is wrong with a row on its own, or None."""
+        for column in MEMBER_COLUMNS:
+            if not row[column]:
+                return f"The {column} is missing."
+        try:
+            User._meta.get_field('username').run_validators(row['username'])
+            validate_email(row['email'])
+        except ValidationError as error:
+            return ' '.join(error.messages)
+        for column in ('username', 'first_name', 'last_name', 'bio'):
+            max_length = User._meta.get_field(column).max_length
+            if len(row.get(column, '')) > max_length:
+                return f"The {column} is longer than {max_length} characters."
+        if row.get('experience_level') and row['experience_level'] not in self.EXPERIENCE_LEVELS:
+            return f"The experience level must be one of {', '.join(self.EXPERIENCE_LEVELS)}."
+        if row.get('role') and row['role'] not in self.ROLES:
+            return f"The role must be one of {', '.join(self.ROLES)}."
+        if row['username'].lower() in self.seen_usernames or row['email'].lower() in self.seen_emails:
+            return "The user is listed more than once."
+        self.seen_usernames.add(row['username'].lower())
+        self.seen_emails.add(row['email'].lower())
+        return None
+
+    def _normalised(self, chunk):
+        """Returns the rows of the chunk with the domain of their email in lower case, as the users' emails are."""
+        for line, row in chunk:
+            row['email'] = User.objects.normalize_email(row['email'])
+        return chunk
+
+    def _existing_users(self, rows):
+        """Returns the users already matching the rows' emails or usernames ignoring case, with one query."""
+        rows = list(rows)
+        usernames = [row['username'].lower() for row in rows]
+        emails = [row['email'].lower() for row in rows]
+        users = (User.objects.annotate(username_lower = Lower('username'), email_lower = Lower('email'))
+            .filter(Q(email_lower__in = emails) | Q(username_lower__in = usernames)).only('id', 'username', 'email'))
+        existing = {'by_username': {}, 'by_email': {}}
+        for user in users:
+            existing['by_username'][user.username.lower()] = user
+            existing['by_email'][user.email.lower()] = user
+        return existing
+
+class _MatchImport:
+    """Validation and writing of the rows of a matches file."""
+    required_columns = MATCH_COLUMNS
+
+    STATUSES = [status for status, label in Match.STATUS]
+
+    def __init__(self, club):
+        self.club = club
+        self.seen = set()
+
+    def validate(self, chunk, result):
+        """Checks the rows of a chunk on their own, then that the players are members and matches are new."""
+        players = self._members(chunk)
+        for line, row in chunk:
+            error = self._row_error(row, players)
+            if error:
+                result.add_error(line, error)
+
+    def write(self, chunk, result):
+        """Creates the matches of the chunk that are not in the club yet with a single insert."""
+        players = self._members(chunk)
+        matches = []
+        for line, row in chunk:
+            match = self._match(row, players)
+            key = (match.player_1_id, match.player_2_id, match.date_time)
+            if key in self._existing(players):
+                result.skipped += 1
+            else:
+                matches.append(match)
+        Match.objects.bulk_create(matches, batch_size = CHUNK_SIZE)
+        result.created += len(matches)
+
+    def _row_error(self, row, players):
+        """Returns what is wrong with a row, or None."""
+        for column in MATCH_COLUMNS:
+            if not row[column]:
+                return f"The {column} is missing."
+        if self._date_time(row['date_time']) is None:
+            return "The date_time must look like 2021-09-25 10:30."
+        if self._status(row['status']) is None:
+            return f"The status must be one of {', '.join(self.STATUSES + list(RESULTS))}."
+        for column in ('player_1', 'player_2'):
+            if row[column].lower() not in players:
+                return f"{row[column]} is not a member of the club."
+        if players[row['player_1'].lower()] == players[row['player_2'].lower()]:
+            return "Both players cannot be the same!"
+        if len(row.get('location', '')) > Match._meta.get_field('location').max_length:
+            return "The location is too long."
+        match = self._match(row, players)
+        key = (match.player_1_id, match.player_2_id, match.date_time)
+        if key in self.seen:
+            return "The match is listed more than once."
+        self.seen.add(key)
+        return None
+
+    def _match(self, row, players):
+        """Returns the unsaved match of a valid row."""
+        return Match(
+            player_1_id = players[row['player_1'].lower()],
+            player_2_id = players[row['player_2'].lower()],
+            club = self.club,
+            location = row.get('location') or self.club.location,
+            date_time = self._date_time(row['date_time']),
+            status = self._status(row['status']),
+        )
+
+    def _members(self, chunk):
+        """Returns the ids of the members named in the chunk, by lower case username and email, in one query."""
+        names = {row[column].lower() for line, row in chunk for column in ('player_1', 'player_2') if row[column]}
+        members = (User.objects.filter(membership__club = self.club)
+            .annotate(username_lower = Lower('username'), email_lower = Lower('email'))
+            .filter(Q(username_lower__in = names) | Q(email_lower__in = names)).values_list('id', 'username', 'email'))
+        players = {}
+        for user_id, username, email in members:
+            players[username.lower()] = user_id
+            players[email.lower()] = user_id
+        self.existing = None
+        return players
+
+    def _existing(self, players):
+        """Returns (player 1, player 2, date/time) of the club's matches between the given players, loaded once per chunk."""
+        if self.existing is None:
+            ids = set(players.values())
+            self.existing = set(Match.objects.filter(club = self.club, player_1_id__in = ids, player_2_id__in = ids)
+                .values_list('player_1_id', 'player_2_id', 'date_time'))
+        return self.existing
+
+    def _date_time(self, value):
+        """Returns the aware date/time of a column, or None if it cannot be read."""
+        try:
+            date_time = parse_datetime(value) or datetime.strptime(value, '%Y-%m-%d')
+        except ValueError:
+            return None
+        if timezone.is_naive(date_time):
+            date_time = timezone.make_aware(date_time)
+        return date_time
+
+    def _status(self, value):
+        """Returns the match status of a column, or None if it is not one."""
+        if value in RESULTS:
+            return RESULTS[value]
+        for status in self.STATUSES:
+            if value.lower() == status.lower():
+                return status
+        return None
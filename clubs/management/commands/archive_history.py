@@ -0,0 +1,20 @@
+"""Command to move old matches and applications to the archive."""
+
+from django.core.management.base import BaseCommand
+from clubs.archive import BATCH_SIZE, archive_matches, archive_applications
+
+class Command(BaseCommand):
+    """Archives the finished matches and rejected applications older than the configured horizons."""
+    help = "Moves old finished matches and rejected applications to the archive tables."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--match-days', type=int, default=None,
+            help='Archive matches played more than this many days ago, ARCHIVE_MATCHES_AFTER_DAYS by default')
+        parser.add_argument('--application-days', type=int, default=None,
+            help='Archive applications made more than this many days ago, ARCHIVE_APPLICATIONS_AFTER_DAYS by default')
+        parser.add_argument('--batch-size', type=int, default=BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        matches = archive_matches(options['match_days'], options['batch_size'])
+        applications = archive_applications(options['application_days'], options['batch_size'])
+        self.stdout.write(f"Archived {matches} matches and {applications} applications")
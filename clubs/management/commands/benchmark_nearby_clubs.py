@@ -0,0 +1,52 @@
+"""Benchmark of the nearby clubs query on a large number of clubs."""
+
+import random
+import time
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from clubs.geo import grid_cell
+from clubs.models import Club, nearest_clubs
+
+class Command(BaseCommand):
+    """Times nearest club queries against randomly placed clubs, without keeping them."""
+    help = "Times the nearby clubs query with many clubs, the clubs are rolled back afterwards."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--clubs', type=int, default=100000)
+        parser.add_argument('--queries', type=int, default=200)
+        parser.add_argument('--count', type=int, default=10)
+        parser.add_argument('--seed', type=int, default=2000)
+
+    def handle(self, *args, **options):
+        """Creates the clubs, runs the queries and reports the time per query."""
+        random.seed(options['seed'])
+        with transaction.atomic():
+            Club.objects.bulk_create([
+                self._random_club(index) for index in range(options['clubs'])
+            ], batch_size=1000)
+            points = [self._random_point() for query in range(options['queries'])]
+            start = time.perf_counter()
+            for latitude, longitude in points:
+                nearest_clubs(latitude, longitude, count=options['count'])
+            elapsed = time.perf_counter() - start
+            transaction.set_rollback(True)
+        self.stdout.write(
+            f"{options['queries']} queries for the nearest {options['count']} of {options['clubs']} clubs: "
+            f"{elapsed / options['queries'] * 1000:.2f} ms per query"
+        )
+
+    def _random_club(self, index):
+        """Returns an unsaved club placed at random in Great Britain."""
+        latitude, longitude = self._random_point()
+        return Club(
+            name=f"Benchmark club {index}",
+            location="Benchmark",
+            description="Benchmark club",
+            latitude=latitude,
+            longitude=longitude,
+            grid_cell=grid_cell(latitude, longitude),
+        )
+
+    def _random_point(self):
+        """Returns a random point in Great Britain."""
+        return random.uniform(50.0, 58.5), random.uniform(-5.5, 1.8)
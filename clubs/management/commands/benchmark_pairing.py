@@ -0,0 +1,53 @@
+"""Benchmark of the Swiss pairing engine on a simulated tournament."""
+
+import random
+import time
+from django.core.management.base import BaseCommand
+from clubs.scheduling import SwissPlayer, pair_swiss_round, WHITE, BLACK
+
+class Command(BaseCommand):
+    """Times the pairing of every round of a simulated Swiss tournament."""
+    help = "Times the Swiss pairing engine for a tournament with many entrants."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--players', type=int, default=1000)
+        parser.add_argument('--rounds', type=int, default=9)
+        parser.add_argument('--seed', type=int, default=2000)
+
+    def handle(self, *args, **options):
+        """Pairs every round, plays it with random results and reports the time per round."""
+        random.seed(options['seed'])
+        players = [SwissPlayer(id, rank=id) for id in range(options['players'])]
+        by_id = {player.id: player for player in players}
+        timings = []
+
+        for round_number in range(1, options['rounds'] + 1):
+            start = time.perf_counter()
+            pairs, bye = pair_swiss_round(players)
+            elapsed = time.perf_counter() - start
+            timings.append(elapsed)
+            self.stdout.write(f"Round {round_number}: {len(pairs)} pairs in {elapsed * 1000:.1f} ms")
+            self._play(pairs, by_id.get(bye))
+
+        self.stdout.write(f"Slowest round: {max(timings) * 1000:.1f} ms, "
+                          f"total: {sum(timings) * 1000:.1f} ms for {options['players']} players")
+
+    def _play(self, pairs, bye):
+        """Gives every pair a random result and the bye a point."""
+        for white, black in pairs:
+            white.opponents.add(black.id)
+            black.opponents.add(white.id)
+            white.colour_balance += WHITE
+            black.colour_balance += BLACK
+            white.last_colour, black.last_colour = WHITE, BLACK
+            outcome = random.random()
+            if outcome < 0.45:
+                white.score += 1
+            elif outcome < 0.9:
+                black.score += 1
+            else:
+                white.score += 0.5
+                black.score += 0.5
+        if bye is not None:
+            bye.score += 1
+            bye.had_bye = True
@@ -0,0 +1,44 @@
+"""Benchmark of the queries each session backend makes per request."""
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.urls import reverse
+from clubs.models import User
+
+class Command(BaseCommand):
+    """Counts the queries of logged in requests with every session and message backend, without keeping the user it creates."""
+    help = "Counts the database queries per request, and those on the session table, for each session and message backend."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=50)
+
+    def handle(self, *args, **options):
+        """Runs the requests with each backend and reports the queries per request."""
+        urls = [reverse('dashboard'), reverse('club_home', kwargs={'club_id': 0})]
+        for session_name, session_engine in settings.SESSION_BACKENDS.items():
+            for message_name, message_storage in settings.MESSAGE_BACKENDS.items():
+                with override_settings(SESSION_ENGINE=session_engine, MESSAGE_STORAGE=message_storage), transaction.atomic():
+                    queries, session_queries = self._run(urls, options['requests'])
+                    transaction.set_rollback(True)
+                self.stdout.write(
+                    f"sessions {session_name:<15} messages {message_name:<9} "
+                    f"{queries / options['requests']:6.2f} queries per request, "
+                    f"{session_queries / options['requests']:5.2f} on the session table"
+                )
+
+    def _run(self, urls, requests):
+        """Logs a new user in and makes the requests, a message is added on every other one."""
+        cache.clear()
+        user = User.objects.create(username='sessionbenchmark', email='sessionbenchmark@example.org',
+            first_name='Session', last_name='Benchmark')
+        client = Client(HTTP_HOST='localhost')
+        client.force_login(user)
+        with CaptureQueriesContext(connection) as context:
+            for request in range(requests):
+                client.get(urls[request % len(urls)])
+        session_queries = [query for query in context.captured_queries if 'django_session' in query['sql']]
+        return len(context.captured_queries), len(session_queries)
@@ -0,0 +1,71 @@
+"""Command to extract the critical styles inlined in base.html from bootstrap.css."""
+
+import re
+from pathlib import Path
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+# Selectors of the rules needed to lay out the page and the navbar before bootstrap.css loads
+CRITICAL_SELECTORS = re.compile('^(' + '|'.join([
+    r':root', r'\*', r'\*::before', r'\*::after', r'html', r'body', r'h[1-4]', r'\.h[1-4]', r'p', r'a',
+    r'a:not\(\[href\]\):not\(\[class\]\)', r'\.container(-\w+)?', r'\.navbar[\w-]*( [\w.-]+)*', r'\.bg-primary',
+    r'\.nav', r'\.nav-link', r'\.collapse:not\(\.show\)', r'\.row', r'\.row > \*', r'\.d-flex',
+    r'\.justify-content-between', r'\.align-items-center', r'\.mb-3', r'\.me-1', r'\.my-3',
+]) + ')$')
+
+# Navbar variants the site does not use
+UNUSED_SELECTORS = re.compile(r'navbar-expand-(sm|md|xl|xxl)|navbar-expand(?!-)|navbar-light|navbar-nav-scroll|offcanvas')
+
+HEADER = """/*
+ * Critical styles inlined in base.html: the subset of bootstrap.css that lays out
+ * the page and the navbar, so the first paint does not wait for the full bundle.
+ * Generated by the build_critical_css command, run it again when the theme changes.
+ */
+"""
+
+class Command(BaseCommand):
+    """Writes static/critical.css with the rules of static/bootstrap.css that the first paint needs."""
+    help = "Extracts the critical styles inlined in base.html from bootstrap.css."
+
+    def handle(self, *args, **options):
+        static = Path(settings.BASE_DIR) / 'static'
+        css = (static / 'bootstrap.css').read_text(encoding='utf-8')
+        css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+        css = re.sub(r'@import url\([^)]*\);', '', css)
+        critical = HEADER + self._critical_rules(css) + '\n'
+        (static / 'critical.css').write_text(critical, encoding='utf-8')
+        self.stdout.write(f"Wrote {len(critical)} bytes of critical styles")
+
+    def _critical_rules(self, css):
+        """Returns the rules of the stylesheet keeping only the critical selectors of each."""
+        rules = []
+        for head, body in self._blocks(css):
+            if head.startswith('@media'):
+                inner = self._critical_rules(body)
+                if inner and re.search(r'min-width|prefers-reduced-motion', head):
+                    rules.append(head + ' {\n' + '\n'.join('  ' + line for line in inner.split('\n')) + '\n}')
+                continue
+            if head.startswith('@'):
+                continue
+            selectors = [selector.strip() for selector in head.split(',')]
+            selectors = [selector for selector in selectors
+                if CRITICAL_SELECTORS.match(selector) and not UNUSED_SELECTORS.search(selector)]
+            if selectors:
+                declarations = ';\n'.join('  ' + declaration.strip() for declaration in body.split(';') if declaration.strip())
+                rules.append(',\n'.join(selectors) + ' {\n' + declarations + ';\n}')
+        return '\n'.join(rules)
+
+    def _blocks(self, css):
+        """Returns the (prelude, body) of each top level block of the stylesheet."""
+        blocks = []
+        position = 0
+        while True:
+            start = css.find('{', position)
+            if start < 0:
+                return blocks
+            depth, end = 1, start + 1
+            while depth:
+                depth += {'{': 1, '}': -1}.get(css[end], 0)
+                end += 1
+            blocks.append((css[position:start].strip(), css[start + 1:end - 1]))
+            position = end
@@ -0,0 +1,32 @@
+"""Command to delete the expired sessions in batches."""
+
+from django.conf import settings
+from django.contrib.sessions.models import Session
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+class Command(BaseCommand):
+    """Deletes the expired sessions a batch at a time, so the session table is never locked for long.
+
+    Meant to be run periodically, e.g. by a scheduler once an hour.
+    """
+    help = "Deletes the expired sessions from the database in batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=settings.SESSION_CLEANUP_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        if settings.SESSION_ENGINE.endswith('signed_cookies'):
+            self.stdout.write("Sessions are stored in cookies, there are none to delete")
+            return
+        now = timezone.now()
+        deleted = 0
+        while True:
+            with transaction.atomic():
+                keys = list(Session.objects.filter(expire_date__lt=now)
+                    .values_list('session_key', flat=True)[:options['batch_size']])
+                if not keys:
+                    break
+                deleted += Session.objects.filter(session_key__in=keys).delete()[0]
+        self.stdout.write(f"Deleted {deleted} expired sessions")
@@ -0,0 +1,17 @@
+"""Command to write a snapshot of the database."""
+
+from django.core.management.base import BaseCommand
+from clubs.snapshots import dump_snapshot
+
+class Command(BaseCommand):
+    """Writes the database to a snapshot file that loadsnapshot restores."""
+    help = "Writes a snapshot of the database, with the SQLite backup API when the database is SQLite."
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='Snapshot file to write, replaced if it exists')
+        parser.add_argument('--rows', action='store_true',
+            help='Copy the rows of the clubs tables instead of the pages of the whole database')
+
+    def handle(self, *args, **options):
+        kind = dump_snapshot(options['path'], rows=options['rows'])
+        self.stdout.write(f"Wrote a {kind} snapshot to {options['path']}")
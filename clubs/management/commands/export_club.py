@@ -0,0 +1,26 @@
+"""Command to export the data of a club."""
+
+from django.core.management.base import BaseCommand, CommandError
+from clubs.exports import EXPORTS, FORMATS, CSV, export_rows
+from clubs.models import Club
+
+class Command(BaseCommand):
+    """Streams the members, applications or matches of a club to a file or to the standard output."""
+    help = "Exports the members, applications or matches of a club as CSV or JSON lines."
+
+    def add_arguments(self, parser):
+        parser.add_argument('club', type=int, help='Id of the club')
+        parser.add_argument('kind', choices=list(EXPORTS))
+        parser.add_argument('--format', choices=list(FORMATS), default=CSV)
+        parser.add_argument('--output', default=None, help='File to write, the standard output by default')
+
+    def handle(self, *args, **options):
+        if not Club.objects.filter(id=options['club']).exists():
+            raise CommandError(f"Club {options['club']} does not exist")
+        lines = export_rows(options['kind'], options['club'], options['format'])
+        if options['output'] is None:
+            for line in lines:
+                self.stdout.write(line, ending='')
+        else:
+            with open(options['output'], 'w', newline='', encoding='utf-8') as output:
+                output.writelines(lines)
@@ -0,0 +1,36 @@
+"""Command to import members or matches into a club."""
+
+from django.core.management.base import BaseCommand, CommandError
+from clubs.imports import MEMBERS, MATCHES, ImportFileError, import_members, import_matches
+from clubs.models import Club
+
+class Command(BaseCommand):
+    """Imports a CSV file of members or matches, reporting the rows that are invalid."""
+    help = "Imports the members or the match history of a club from a CSV file."
+
+    def add_arguments(self, parser):
+        parser.add_argument('club', type=int, help='Id of the club')
+        parser.add_argument('kind', choices=[MEMBERS, MATCHES])
+        parser.add_argument('path', help='CSV file to import')
+        parser.add_argument('--dry-run', action='store_true', help='Only validate the file')
+
+    def handle(self, *args, **options):
+        try:
+            club = Club.objects.get(id=options['club'])
+        except Club.DoesNotExist:
+            raise CommandError(f"Club {options['club']} does not exist")
+        importer = import_members if options['kind'] == MEMBERS else import_matches
+        with open(options['path'], newline='', encoding='utf-8-sig') as csv_file:
+            try:
+                result = importer(club, csv_file, dry_run=options['dry_run'])
+            except ImportFileError as error:
+                raise CommandError(str(error))
+        for line, message in result.errors:
+            self.stderr.write(f"Line {line}: {message}")
+        if not result.is_valid():
+            raise CommandError(f"{result.error_count} invalid rows, nothing was imported")
+        if options['dry_run']:
+            self.stdout.write("The file is valid")
+        else:
+            self.stdout.write(f"Imported {result.created} {options['kind']}, skipped {result.skipped}, "
+                f"gave {result.invited} existing users a pending application")
@@ -0,0 +1,24 @@
+"""Command to restore a snapshot of the database."""
+
+from django.core.management.base import BaseCommand, CommandError
+from clubs.snapshots import SnapshotError, load_snapshot
+
+class Command(BaseCommand):
+    """Replaces the data of the database with a snapshot written by dumpsnapshot."""
+    help = "Replaces the data of the database with a snapshot, meant for test and benchmark databases."
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='Snapshot file to load')
+        parser.add_argument('--noinput', '--no-input', action='store_false', dest='interactive',
+            help='Do not ask for confirmation')
+
+    def handle(self, *args, **options):
+        if options['interactive']:
+            answer = input("This replaces the data of the database with the snapshot. Type 'yes' to continue: ")
+            if answer != 'yes':
+                raise CommandError("Snapshot not loaded")
+        try:
+            kind = load_snapshot(options['path'])
+        except SnapshotError as error:
+            raise CommandError(str(error))
+        self.stdout.write(f"Loaded the {kind} snapshot {options['path']}")
@@ -0,0 +1,34 @@
+"""Command to delete the old match events in batches."""
+
+import datetime
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+from clubs.models import MatchEvent
+
+class Command(BaseCommand):
+    """Deletes the match events older than the retention period a batch at a time.
+
+    Events are only read by the pages that were open when they were published,
+    so they are not needed for long. Meant to be run periodically, e.g. by a
+    scheduler once an hour.
+    """
+    help = "Deletes the match events older than MATCH_EVENT_RETENTION_HOURS in batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--hours', type=int, default=settings.MATCH_EVENT_RETENTION_HOURS)
+        parser.add_argument('--batch-size', type=int, default=settings.MATCH_EVENT_CLEANUP_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - datetime.timedelta(hours=options['hours'])
+        deleted = 0
+        while True:
+            with transaction.atomic():
+                # Events are published in id order, so the old ones are found at the start of the primary key
+                ids = list(MatchEvent.objects.filter(created_at__lt=cutoff)
+                    .order_by('id').values_list('id', flat=True)[:options['batch_size']])
+                if not ids:
+                    break
+                deleted += MatchEvent.objects.filter(id__in=ids).delete()[0]
+        self.stdout.write(f"Deleted {deleted} match events")
@@ -0,0 +1,18 @@
+"""Command to purge the rows of deleted clubs and closed accounts in batches."""
+
+from django.core.management.base import BaseCommand
+from clubs.deletion import BATCH_SIZE, run_deletion_jobs
+
+class Command(BaseCommand):
+    """Runs the queued deletion jobs, each resuming from where it was stopped.
+
+    Meant to be run periodically, e.g. by a scheduler every minute.
+    """
+    help = "Purges the rows of deleted clubs and closed accounts in batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        jobs = run_deletion_jobs(options['batch_size'])
+        self.stdout.write(f"Finished {jobs} deletion jobs")
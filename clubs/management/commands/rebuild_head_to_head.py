@@ -0,0 +1,17 @@
+"""Command to rebuild the head-to-head records from the matches."""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from clubs.models import rebuild_head_to_heads
+
+class Command(BaseCommand):
+    """Rebuilds the head-to-head records, of every club or of a single one."""
+    help = "Rebuilds the head-to-head records after matches were changed without Match.save."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--club', type=int, default=None, help='Only rebuild the records of this club id')
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            records = rebuild_head_to_heads(options['club'])
+        self.stdout.write(f"Rebuilt {len(records)} head-to-head records")
@@ -0,0 +1,12 @@
+"""Command to rebuild the full-text search index."""
+
+from django.core.management.base import BaseCommand
+from clubs.search import rebuild_search_index
+
+class Command(BaseCommand):
+    """Rebuilds the search index of clubs and users from their rows."""
+    help = "Rebuilds the full-text search index of clubs and users."
+
+    def handle(self, *args, **options):
+        rebuild_search_index()
+        self.stdout.write("Rebuilt the search index")
@@ -2,9 +2,10 @@
 
 from datetime import datetime
 from django.core.management.base import BaseCommand
+from django.db.models import Q
 from faker import Faker
 import pytz
-from clubs.models import User, Application, Membership, Club, Match
+from clubs.models import User, Application, Membership, Club, Match, have_played
 import random
 
 class Command(BaseCommand):
@@ -103,7 +104,7 @@ class Command(BaseCommand):
             user = self.random_memberships(club).first().user
             other_user = self.random_memberships(club).exclude(user=user).first().user
 
-            while self._has_already_played_match(user, other_user):
+            while self._has_already_played_match(club, user, other_user):
                 user = self.random_memberships(club).first().user
                 other_user = self.random_memberships(club).exclude(user=user).first().user
 
@@ -131,7 +132,7 @@ class Command(BaseCommand):
             user = self.random_memberships(club).first().user
             other_user = self.random_memberships(club).exclude(user=user).first().user
 
-            while self._has_already_played_match(user, other_user):
+            while self._has_already_played_match(club, user, other_user):
                 user = self.random_memberships(club).first().user
                 other_user = self.random_memberships(club).exclude(user=user).first().user
 
@@ -150,7 +151,7 @@ class Command(BaseCommand):
             user = self.random_memberships(club).first().user
             other_user = self.random_memberships(club).exclude(user=user).first().user
 
-            while self._has_already_played_match(user, other_user):
+            while self._has_already_played_match(club, user, other_user):
                 user = self.random_memberships(club).first().user
                 other_user = self.random_memberships(club).exclude(user=user).first().user
 
@@ -166,13 +167,17 @@ class Command(BaseCommand):
                 status=Match.PENDING,
             )
 
-    def _has_already_played_match(self, user, other_user):
-        """Returns weather a match between two users exists already."""
-        return self._exists_in_matches(user, other_user) or self._exists_in_matches(other_user, user)
+    def _has_already_played_match(self, club, user, other_user):
+        """Returns weather two users already have a result or a pending match against each other in the club."""
+        return have_played(club.id, user.id, other_user.id) or self._has_pending_match(club, user, other_user)
 
-    def _exists_in_matches(self, user, other_user):
-        """Returns weather a user is part of a match."""
-        return len(Match.objects.filter(player_1=other_user, player_2=user)) != 0
+    def _has_pending_match(self, club, user, other_user):
+        """Returns weather two users have a match still to play in the club, the head-to-head record only counts results."""
+        return Match.objects.filter(
+            Q(player_1=user, player_2=other_user) | Q(player_1=other_user, player_2=user),
+            club=club,
+            status=Match.PENDING,
+        ).exists()
 
     def _create_club(self, name, location):
         """Create a club in the database."""
@@ -0,0 +1,61 @@
+"""The "My clubs" menu of the navbar, cached per user.
+
+The menu of a user is cached under a key holding a version of their
+memberships. Any change to one of their memberships, or to a club they are
+in, gives them a new version once the change commits, so the next page
+loads the menu again and the old entry simply expires. A page with a warm
+cache draws the menu without querying the database.
+
+Only a cache shared by every worker process is used, see SHARED_CACHE in
+the settings. A local memory cache would keep serving an old menu in the
+workers that never saw the change, so without a shared one the menu is
+loaded once per request instead.
+"""
+
+import time
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from clubs.models import Club, Membership
+
+def club_menu(user_id):
+    """Returns the id and name of every club the user is in, from the cache if possible."""
+    if not settings.SHARED_CACHE:
+        return _load_menu(user_id)
+    version_key = _version_key(user_id)
+    version = cache.get(version_key)
+    if version is None:
+        version = _new_version()
+        cache.set(version_key, version, None)
+    menu_key = f'club_menu:{user_id}:{version}'
+    menu = cache.get(menu_key)
+    if menu is None:
+        menu = _load_menu(user_id)
+        cache.set(menu_key, menu, settings.CLUB_MENU_CACHE_SECONDS)
+    return menu
+
+def invalidate_club_menus(user_ids):
+    """Gives the users a new menu version once the current transaction commits."""
+    if not settings.SHARED_CACHE:
+        return
+    user_ids = list(user_ids)
+    if user_ids:
+        transaction.on_commit(lambda: cache.set_many({_version_key(user_id): _new_version() for user_id in user_ids}, None))
+
+def membership_changed(sender, instance, **kwargs):
+    """Invalidates the menu of the user whose membership was saved or deleted."""
+    invalidate_club_menus([instance.user_id])
+
+def club_changed(sender, instance, created, **kwargs):
+    """Invalidates the menus of the members of a club that was changed."""
+    if not created:
+        invalidate_club_menus(Membership.objects.filter(club_id=instance.id).values_list('user_id', flat=True))
+
+def _load_menu(user_id):
+    return list(Club.objects.filter(membership__user_id=user_id).order_by('name').values('id', 'name'))
+
+def _version_key(user_id):
+    return f'club_menu_version:{user_id}'
+
+def _new_version():
+    return time.time_ns()
@@ -0,0 +1,29 @@
+# Generated by Django 3.2.5 on 2026-10-19 15:07
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clubs', '0015_tournament'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tournament',
+            name='days_between_rounds',
+            field=models.PositiveSmallIntegerField(default=7, validators=[django.core.validators.MinValueValidator(1)]),
+        ),
+        migrations.AddField(
+            model_name='tournament',
+            name='starts_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='tournament',
+            name='format',
+            field=models.CharField(choices=[('Swiss', 'Swiss'), ('Round robin', 'Round robin'), ('Knockout', 'Knockout')], default='Swiss', max_length=12),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 3.2.5 on 2026-10-19 15:11
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import django.db.models.expressions
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clubs', '0016_tournament_schedule'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='HeadToHead',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('games', models.PositiveIntegerField(default=0)),
+                ('player_1_wins', models.PositiveIntegerField(default=0)),
+                ('player_2_wins', models.PositiveIntegerField(default=0)),
+                ('draws', models.PositiveIntegerField(default=0)),
+                ('last_played', models.DateTimeField(blank=True, null=True)),
+                ('club', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='clubs.club')),
+                ('player_1', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('player_2', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='headtohead',
+            constraint=models.UniqueConstraint(fields=('club', 'player_1', 'player_2'), name='one_head_to_head_per_pair'),
+        ),
+        migrations.AddConstraint(
+            model_name='headtohead',
+            constraint=models.CheckConstraint(check=models.Q(('player_1__lt', django.db.models.expressions.F('player_2'))), name='head_to_head_players_ordered'),
+        ),
+    ]
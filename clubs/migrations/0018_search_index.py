@@ -0,0 +1,85 @@
+# Generated by Django 3.2.5 on 2026-10-19 15:13
+
+from django.db import migrations
+
+# Searchable columns of each table with their PostgreSQL ranking weight
+SEARCH_COLUMNS = {
+    'clubs_club': [('name', 'A'), ('location', 'B'), ('description', 'C')],
+    'clubs_user': [('username', 'A'), ('first_name', 'B'), ('last_name', 'B'), ('bio', 'D')],
+}
+
+
+def sqlite_index(table, columns):
+    """FTS5 table with the table as external content, kept in sync by triggers."""
+    names = ', '.join(column for column, weight in columns)
+    new_values = ', '.join(f'new.{column}' for column, weight in columns)
+    old_values = ', '.join(f'old.{column}' for column, weight in columns)
+    fts = f'{table}_fts'
+    return [
+        f"CREATE VIRTUAL TABLE {fts} USING fts5({names}, content='{table}', content_rowid='id', "
+        f"tokenize='unicode61 remove_diacritics 2')",
+        f"CREATE TRIGGER {fts}_insert AFTER INSERT ON {table} BEGIN "
+        f"INSERT INTO {fts}(rowid, {names}) VALUES (new.id, {new_values}); END",
+        f"CREATE TRIGGER {fts}_delete AFTER DELETE ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {names}) VALUES ('delete', old.id, {old_values}); END",
+        f"CREATE TRIGGER {fts}_update AFTER UPDATE OF {names} ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {names}) VALUES ('delete', old.id, {old_values}); "
+        f"INSERT INTO {fts}(rowid, {names}) VALUES (new.id, {new_values}); END",
+        f"INSERT INTO {fts}({fts}) VALUES ('rebuild')",
+    ]
+
+
+def sqlite_drop_index(table):
+    fts = f'{table}_fts'
+    return [f"DROP TRIGGER {fts}_{action}" for action in ('insert', 'delete', 'update')] + [f"DROP TABLE {fts}"]
+
+
+def postgresql_index(table, columns):
+    """Generated tsvector column with a GIN index."""
+    vector = ' || '.join(
+        f"setweight(to_tsvector('simple', coalesce({column}, '')), '{weight}')" for column, weight in columns)
+    return [
+        f"ALTER TABLE {table} ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ({vector}) STORED",
+        f"CREATE INDEX {table}_search_idx ON {table} USING GIN (search_vector)",
+    ]
+
+
+def postgresql_drop_index(table):
+    return [f"DROP INDEX {table}_search_idx", f"ALTER TABLE {table} DROP COLUMN search_vector"]
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    for table, columns in SEARCH_COLUMNS.items():
+        if vendor == 'sqlite':
+            statements = sqlite_index(table, columns)
+        elif vendor == 'postgresql':
+            statements = postgresql_index(table, columns)
+        else:
+            statements = []
+        for statement in statements:
+            schema_editor.execute(statement)
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    for table in SEARCH_COLUMNS:
+        if vendor == 'sqlite':
+            statements = sqlite_drop_index(table)
+        elif vendor == 'postgresql':
+            statements = postgresql_drop_index(table)
+        else:
+            statements = []
+        for statement in statements:
+            schema_editor.execute(statement)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clubs', '0017_headtohead'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 3.2.5 on 2026-10-19 15:16
+
+from django.db import migrations, models
+from clubs.geo import geocode, grid_cell
+
+
+def geocode_clubs(apps, schema_editor):
+    Club = apps.get_model('clubs', 'Club')
+    clubs = []
+    for club in Club.objects.all().only('id', 'location'):
+        coordinates = geocode(club.location)
+        if coordinates is not None:
+            club.latitude, club.longitude = coordinates
+            club.grid_cell = grid_cell(*coordinates)
+            clubs.append(club)
+    Club.objects.bulk_update(clubs, ['latitude', 'longitude', 'grid_cell'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clubs', '0018_search_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='club',
+            name='grid_cell',
+            field=models.IntegerField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='club',
+            name='latitude',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='club',
+            name='longitude',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.RunPython(geocode_clubs, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 3.2.5 on 2026-10-19 15:39
+
+from django.db import migrations, models
+
+
+def reject_duplicate_open_applications(apps, schema_editor):
+    """Keeps one pending or accepted application per user and club, the accepted or else the latest one."""
+    Application = apps.get_model('clubs', 'Application')
+    kept = set()
+    duplicates = []
+    applications = (Application.objects.filter(status__in=['Pending', 'Accepted'])
+        .order_by('user_id', 'club_id', 'status', '-created_at').values_list('id', 'user_id', 'club_id'))
+    for application_id, user_id, club_id in applications.iterator():
+        if (user_id, club_id) in kept:
+            duplicates.append(application_id)
+        else:
+            kept.add((user_id, club_id))
+    for start in range(0, len(duplicates), 500):
+        Application.objects.filter(id__in=duplicates[start:start + 500]).update(status='Rejected')
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clubs', '0020_archive'),
+    ]
+
+    operations = [
+        migrations.RunPython(reject_duplicate_open_applications, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='application',
+            constraint=models.UniqueConstraint(condition=models.Q(('status__in', ['Pending', 'Accepted'])), fields=('user', 'club'), name='one_open_application_per_club'),
+        ),
+    ]
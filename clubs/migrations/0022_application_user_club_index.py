@@ -0,0 +1,17 @@
+# Generated by Django 3.2.5 on 2026-10-19 15:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clubs', '0021_application_unique_open'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['user', 'club', 'status'], name='application_user_club_idx'),
+        ),
+    ]
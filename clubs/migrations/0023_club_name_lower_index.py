@@ -0,0 +1,18 @@
+# Generated by Django 3.2.5 on 2026-10-19 15:44
+
+from django.db import migrations, models
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clubs', '0022_application_user_club_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='club',
+            index=models.Index(django.db.models.functions.text.Lower('name'), name='club_name_lower_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 3.2.5 on 2026-10-19 15:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clubs', '0024_user_name_lower_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['club', 'status', '-created_at', '-id'], name='application_queue_idx'),
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 3.2.5 on 2026-10-19 15:52
+
+from django.db import migrations, models
+import django.db.models.functions.text
+import django.db.models.manager
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clubs', '0025_application_queue_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DeletionJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('Club', 'Club')], max_length=10)),
+                ('target_id', models.BigIntegerField()),
+                ('stage', models.CharField(blank=True, max_length=30)),
+                ('deleted_rows', models.PositiveIntegerField(default=0)),
+                ('notified', models.BooleanField(default=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'ordering': ['id'],
+            },
+        ),
+        migrations.AlterModelOptions(
+            name='club',
+            options={'default_manager_name': 'all_objects'},
+        ),
+        migrations.AlterModelManagers(
+            name='club',
+            managers=[
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+        # SQLite rebuilds the table to add the column, which it cannot do with
+        # an expression index on it, so the index is recreated afterwards.
+        migrations.RemoveIndex(
+            model_name='club',
+            name='club_name_lower_idx',
+        ),
+        migrations.AddField(
+            model_name='club',
+            name='deleted_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='club',
+            index=models.Index(django.db.models.functions.text.Lower('name'), name='club_name_lower_idx'),
+        ),
+    ]
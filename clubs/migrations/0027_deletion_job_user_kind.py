@@ -0,0 +1,18 @@
+# Generated by Django 3.2.5 on 2026-10-19 15:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clubs', '0026_club_soft_delete'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='deletionjob',
+            name='kind',
+            field=models.CharField(choices=[('Club', 'Club'), ('User', 'User')], max_length=10),
+        ),
+    ]
@@ -1,3 +1,8 @@
 from .user_membership_models import *
 from .application_models import *
-from .match_models import *
\ No newline at end of file
+from .match_models import *
+from .match_event_models import *
+from .archive_models import *
+from .head_to_head_models import *
+from .tournament_models import *
+from .deletion_models import *
\ No newline at end of file
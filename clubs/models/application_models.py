@@ -1,9 +1,9 @@
 """The models that map to the application between a user and a club."""
 
-from django.db import models
+from datetime import datetime, timezone
+from django.db import models, transaction
 from clubs.models import User
 from clubs.models import Club
-from django.db.utils import IntegrityError
 
 class Application(models.Model):
     """Application model used for creating an application to club for a given user."""
@@ -36,6 +36,9 @@ class Application(models.Model):
 
     status = models.CharField(max_length = 8, choices = STATUS, default = PENDING, blank = False)
 
+    # A user can have one application in these statuses per club
+    OPEN_STATUSES = [PENDING, ACCEPTED]
+
     created_at = models.DateTimeField(auto_now_add = True, editable = False)
 
     def is_pending(self):
@@ -50,28 +53,88 @@ class Application(models.Model):
         """Returns true if the application is rejected else returns false."""
         return self.status == self.REJECTED
 
-    def cannot_be_created(self):
-        """Returns true if a given user already has a 
-        non-rejected application in a club else return false."""
-        return ((user_has_pending_application_to_the_same_club(self.user, self.club)) or
-                (user_has_accepted_application_to_the_same_club(self.user, self.club)))
-
     def save(self, *args, **kwargs):
-        """Saves the application to the database."""
-        if (self.status == self.PENDING) and (self.cannot_be_created()):
-            raise IntegrityError("User can have only one panding/accepted application to the same club")
-        super().save(*args, **kwargs)
+        """Saves the application to the database, in a savepoint so that a duplicate
+        rejected by the database leaves the surrounding transaction usable."""
+        with transaction.atomic():
+            super().save(*args, **kwargs)
 
     class Meta:
-        """Model options, provides an ordering to the applications."""
+        """Model options, provides an ordering to the applications and states
+        that a user can have at most 1 pending or accepted application per club.
+        The first index answers has_open_application, the partial unique index
+        cannot serve a query whose statuses are parameters, the second one reads
+        the pending queue of a club in order."""
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields = ['user', 'club', 'status'], name = 'application_user_club_idx'),
+            models.Index(fields = ['club', 'status', '-created_at', '-id'], name = 'application_queue_idx'),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields = ['user', 'club'],
+                condition = models.Q(status__in = ["Pending", "Accepted"]),
+                name = 'one_open_application_per_club'
+            )
+        ]
+
+def has_open_application(user, club):
+    """Returns true if the user has a pending or accepted application to the club, with one indexed query."""
+    return Application.objects.filter(user = user, club = club, status__in = Application.OPEN_STATUSES).exists()
+
+# Pending applications shown per page of the queue of a club
+APPLICATION_QUEUE_PAGE_SIZE = 25
+
+# Format of the creation time in a queue cursor
+CURSOR_TIME_FORMAT = '%Y%m%d%H%M%S%f'
+
+class ApplicationQueuePage:
+    """A page of the pending applications of a club, newest first."""
+
+    def __init__(self, applications, pending_count, next_cursor):
+        self.applications = applications
+        self.pending_count = pending_count
+        self.next_cursor = next_cursor
+
+    def has_next(self):
+        """Returns true if there are older applications after this page."""
+        return self.next_cursor is not None
+
+def application_queue(club_id, cursor = None, experience_level = None, size = None):
+    """Returns the page of pending applications of a club after the cursor.
 
-def user_has_pending_application_to_the_same_club(user, club):
-    """Return true if a user already has pending application in a given
-     club else returns false."""
-    return (Application.objects.filter(user = user, status = Application.PENDING, club = club)).exists()
+    Pages are read with keyset pagination: the cursor holds the creation time
+    and id of the last application of the previous page, so a page reads the
+    queue index from that point instead of skipping every earlier row. Each
+    row carries the count of pending applications, worked out by the same query.
+    """
+    size = size or APPLICATION_QUEUE_PAGE_SIZE
+    pending = Application.objects.filter(club_id = club_id, status = Application.PENDING)
+    if experience_level:
+        pending = pending.filter(user__experience_level = experience_level)
+    count = pending.order_by().values('club_id').annotate(count = models.Count('id')).values('count')
+    applications = pending.select_related('user', 'club').annotate(pending_count = models.Subquery(count)).order_by('-created_at', '-id')
+    position = _cursor_position(cursor)
+    if position:
+        created_at, application_id = position
+        applications = applications.filter(
+            models.Q(created_at__lt = created_at) | models.Q(created_at = created_at, id__lt = application_id))
+    applications = list(applications[:size + 1])
+    next_cursor = None
+    if len(applications) > size:
+        applications = applications[:size]
+        last = applications[-1]
+        next_cursor = f"{last.created_at.astimezone(timezone.utc).strftime(CURSOR_TIME_FORMAT)}-{last.id}"
+    if applications:
+        pending_count = applications[0].pending_count
+    else:
+        pending_count = pending.count() if position else 0
+    return ApplicationQueuePage(applications, pending_count, next_cursor)
 
-def user_has_accepted_application_to_the_same_club(user, club):
-    """Return true if a user already has an accepted application in a given
-     club else returns false."""
-    return (Application.objects.filter(user = user, status = Application.ACCEPTED, club = club)).exists()
\ No newline at end of file
+def _cursor_position(cursor):
+    """Returns the creation time and id held by a cursor, or None if it is missing or malformed."""
+    try:
+        created_at, application_id = cursor.split('-')
+        return datetime.strptime(created_at, CURSOR_TIME_FORMAT).replace(tzinfo = timezone.utc), int(application_id)
+    except (AttributeError, ValueError):
+        return None
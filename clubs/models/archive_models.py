@@ -0,0 +1,128 @@
+"""The models that keep old matches and processed applications out of the live tables."""
+
+from django.db import models
+from django.db.models import Q, Sum
+from clubs.models import User, Club, Match, Application
+
+class ArchivedMatch(models.Model):
+    """Compact copy of a finished match moved out of the match table by archival."""
+    club = models.ForeignKey(
+        Club,
+        on_delete = models.CASCADE,
+        blank = False,
+        null = False,
+        related_name = '+',
+    )
+
+    player_1 = models.ForeignKey(
+        User,
+        on_delete = models.CASCADE,
+        blank = False,
+        null = False,
+        related_name = '+',
+    )
+
+    player_2 = models.ForeignKey(
+        User,
+        on_delete = models.CASCADE,
+        blank = False,
+        null = False,
+        related_name = '+',
+    )
+
+    location = models.CharField(unique = False, max_length = 100, blank = False)
+    date_time = models.DateTimeField(blank = False)
+    status = models.CharField(max_length = 15, choices = Match.STATUS, blank = False)
+
+    class Meta:
+        """Model options, provides the same ordering as the matches."""
+        ordering = ["-date_time"]
+
+class ArchivedApplication(models.Model):
+    """Compact copy of a processed application, without its personal statement."""
+    user = models.ForeignKey(
+        User,
+        on_delete = models.CASCADE,
+        blank = False,
+        null = False,
+        related_name = '+',
+    )
+
+    club = models.ForeignKey(
+        Club,
+        on_delete = models.CASCADE,
+        blank = False,
+        null = False,
+        related_name = '+',
+    )
+
+    status = models.CharField(max_length = 8, choices = Application.STATUS, blank = False)
+    created_at = models.DateTimeField(blank = False)
+
+    class Meta:
+        """Model options, provides the same ordering as the applications."""
+        ordering = ["-created_at"]
+
+class PlayerArchiveStats(models.Model):
+    """Results of the archived matches of a player in a club, kept so their totals stay right.
+
+    Games counts every archived match of the player, cancelled ones included.
+    """
+    club = models.ForeignKey(
+        Club,
+        on_delete = models.CASCADE,
+        blank = False,
+        null = False,
+        related_name = '+',
+    )
+
+    user = models.ForeignKey(
+        User,
+        on_delete = models.CASCADE,
+        blank = False,
+        null = False,
+        related_name = '+',
+    )
+
+    games = models.PositiveIntegerField(default = 0)
+    wins = models.PositiveIntegerField(default = 0)
+    losses = models.PositiveIntegerField(default = 0)
+    draws = models.PositiveIntegerField(default = 0)
+
+    class Meta:
+        """Model options, states that a player has one row per club."""
+        constraints = [
+            models.UniqueConstraint(
+                fields = ['club', 'user'],
+                name = 'one_archive_stats_per_player'
+            ),
+        ]
+
+class ClubArchiveStats(models.Model):
+    """Totals of the matches and applications of a club that have been archived."""
+    club = models.OneToOneField(
+        Club,
+        on_delete = models.CASCADE,
+        primary_key = True,
+        related_name = '+',
+    )
+
+    matches = models.PositiveIntegerField(default = 0)
+    draws = models.PositiveIntegerField(default = 0)
+    cancelled = models.PositiveIntegerField(default = 0)
+    rejected_applications = models.PositiveIntegerField(default = 0)
+
+def archived_matches_of(user, club = None):
+    """Returns the archived matches of a user, in one club or in all of them that are not deleted."""
+    matches = ArchivedMatch.objects.filter(Q(player_1 = user) | Q(player_2 = user), club__deleted_at__isnull = True)
+    if club is not None:
+        matches = matches.filter(club = club)
+    return matches.select_related('player_1', 'player_2', 'club')
+
+def archived_results(user, club = None):
+    """Returns the games, wins, losses and draws of the archived matches of a user outside deleted clubs, with one query."""
+    stats = PlayerArchiveStats.objects.filter(user = user, club__deleted_at__isnull = True)
+    if club is not None:
+        stats = stats.filter(club = club)
+    totals = stats.aggregate(games = Sum('games'), wins = Sum('wins'), losses = Sum('losses'), draws = Sum('draws'))
+    return {name: total or 0 for name, total in totals.items()}
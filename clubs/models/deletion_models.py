@@ -0,0 +1,44 @@
+"""The models that track the purge of deleted rows in the background."""
+
+from django.db import models
+
+class DeletionJob(models.Model):
+    """Deletion job model used to purge the rows of a deleted club or closed account a batch at a time.
+
+    The job only holds the id of its target, which it may outlive. The stage
+    is the table being purged, so a stopped purge resumes from it. The claim
+    time is set while a run of purge_deleted holds the job.
+    """
+
+    # Kind options for the different targets of a deletion
+    CLUB = "Club"
+    USER = "User"
+
+    KINDS = [
+        (CLUB, "Club"),
+        (USER, "User"),
+    ]
+
+    kind = models.CharField(max_length = 10, choices = KINDS, blank = False)
+
+    target_id = models.BigIntegerField(blank = False, null = False)
+
+    stage = models.CharField(max_length = 30, blank = True)
+
+    deleted_rows = models.PositiveIntegerField(default = 0)
+
+    notified = models.BooleanField(default = False)
+
+    created_at = models.DateTimeField(auto_now_add = True, editable = False)
+
+    claimed_at = models.DateTimeField(blank = True, null = True)
+
+    finished_at = models.DateTimeField(blank = True, null = True)
+
+    def is_finished(self):
+        """Returns true if every row of the target has been purged."""
+        return self.finished_at is not None
+
+    class Meta:
+        """Model options, jobs are run in the order they were queued."""
+        ordering = ["id"]
@@ -0,0 +1,156 @@
+"""The models that keep a running head-to-head record between two players of a club."""
+
+from django.db import models
+from django.db.models import Count, F, Max, Q
+from django.db.models.functions import Greatest, Least
+from clubs.models import User, Club, Match, ArchivedMatch
+
+# Statuses of a match that has been played and counts towards the record
+PLAYED = [Match.PLAYER1, Match.PLAYER2, Match.DRAW]
+
+class HeadToHead(models.Model):
+    """Head-to-head model holding the results of every match between two players of a club.
+
+    The pair is unordered, player_1 is always the player with the lower id so
+    that each pair has a single row which can be found with one index lookup.
+    """
+    club = models.ForeignKey(
+        Club,
+        on_delete = models.CASCADE,
+        blank = False,
+        null = False,
+    )
+
+    player_1 = models.ForeignKey(
+        User,
+        on_delete = models.CASCADE,
+        blank = False,
+        null = False,
+        related_name = '+',
+    )
+
+    player_2 = models.ForeignKey(
+        User,
+        on_delete = models.CASCADE,
+        blank = False,
+        null = False,
+        related_name = '+',
+    )
+
+    games = models.PositiveIntegerField(default = 0)
+    player_1_wins = models.PositiveIntegerField(default = 0)
+    player_2_wins = models.PositiveIntegerField(default = 0)
+    draws = models.PositiveIntegerField(default = 0)
+    last_played = models.DateTimeField(blank = True, null = True)
+
+    def wins_for(self, user_id):
+        """Returns the number of matches the given player won."""
+        return self.player_1_wins if user_id == self.player_1_id else self.player_2_wins
+
+    def losses_for(self, user_id):
+        """Returns the number of matches the given player lost."""
+        return self.player_2_wins if user_id == self.player_1_id else self.player_1_wins
+
+    class Meta:
+        """Model options, states that every pair of players has one record per club."""
+        constraints = [
+            models.UniqueConstraint(
+                fields = ['club', 'player_1', 'player_2'],
+                name = 'one_head_to_head_per_pair'
+            ),
+            models.CheckConstraint(
+                check = Q(player_1__lt = F('player_2')),
+                name = 'head_to_head_players_ordered'
+            ),
+        ]
+
+def head_to_head(club_id, user_id, opponent_id):
+    """Returns the record between two players of a club, an empty unsaved one if they never played."""
+    player_1_id, player_2_id = sorted((user_id, opponent_id))
+    record = HeadToHead.objects.filter(club_id = club_id, player_1_id = player_1_id, player_2_id = player_2_id).first()
+    return record or HeadToHead(club_id = club_id, player_1_id = player_1_id, player_2_id = player_2_id)
+
+def have_played(club_id, user_id, opponent_id):
+    """Returns true if the two players have a result against each other in the club."""
+    player_1_id, player_2_id = sorted((user_id, opponent_id))
+    return HeadToHead.objects.filter(club_id = club_id, player_1_id = player_1_id, player_2_id = player_2_id).exists()
+
+def club_opponents(club_id):
+    """Returns every player of a club mapped to the set of players they have played, with one query."""
+    opponents = {}
+    for player_1_id, player_2_id in HeadToHead.objects.filter(club_id = club_id).values_list('player_1_id', 'player_2_id'):
+        opponents.setdefault(player_1_id, set()).add(player_2_id)
+        opponents.setdefault(player_2_id, set()).add(player_1_id)
+    return opponents
+
+def refresh_head_to_head(club_id, user_id, opponent_id):
+    """Recomputes the record between two players from their matches, after one of the results changed."""
+    if user_id == opponent_id:
+        return
+    player_1_id, player_2_id = sorted((user_id, opponent_id))
+    pair = Q(player_1_id = player_1_id, player_2_id = player_2_id) | Q(player_1_id = player_2_id, player_2_id = player_1_id)
+    totals = _combined_totals(Match.objects.filter(pair, club_id = club_id), ArchivedMatch.objects.filter(pair, club_id = club_id))
+    lookup = {'club_id': club_id, 'player_1_id': player_1_id, 'player_2_id': player_2_id}
+    if not totals:
+        HeadToHead.objects.filter(**lookup).delete()
+    else:
+        HeadToHead.objects.update_or_create(defaults = _record_fields(totals[0]), **lookup)
+
+def rebuild_head_to_heads(club_id = None):
+    """Rebuilds every record, or those of one club, with a grouped query over the matches and one over the archive.
+
+    Used after changes that bypass Match.save, like queryset updates and imports.
+    """
+    matches = Match.objects.all() if club_id is None else Match.objects.filter(club_id = club_id)
+    archived = ArchivedMatch.objects.all() if club_id is None else ArchivedMatch.objects.filter(club_id = club_id)
+    records = [
+        HeadToHead(club_id = totals['club_id'], player_1_id = totals['low_id'], player_2_id = totals['high_id'], **_record_fields(totals))
+        for totals in _combined_totals(matches, archived)
+    ]
+    existing = HeadToHead.objects.all() if club_id is None else HeadToHead.objects.filter(club_id = club_id)
+    existing.delete()
+    return HeadToHead.objects.bulk_create(records, batch_size = 500)
+
+def _combined_totals(matches, archived_matches):
+    """Adds up the grouped totals of the live and the archived matches of each pair."""
+    combined = {}
+    for totals in list(_head_to_head_totals(matches).iterator()) + list(_head_to_head_totals(archived_matches).iterator()):
+        key = (totals['club_id'], totals['low_id'], totals['high_id'])
+        if key not in combined:
+            combined[key] = totals
+        else:
+            pair = combined[key]
+            for counter in ('games', 'low_wins', 'high_wins', 'draws'):
+                pair[counter] += totals[counter]
+            pair['last_played'] = max(pair['last_played'], totals['last_played'])
+    return list(combined.values())
+
+def _head_to_head_totals(matches):
+    """Groups the played matches by club and unordered pair of players and counts their results."""
+    low_won = (Q(status = Match.PLAYER1, player_1_id__lt = F('player_2_id'))
+        | Q(status = Match.PLAYER2, player_2_id__lt = F('player_1_id')))
+    high_won = (Q(status = Match.PLAYER1, player_1_id__gt = F('player_2_id'))
+        | Q(status = Match.PLAYER2, player_2_id__gt = F('player_1_id')))
+    return (matches
+        .filter(status__in = PLAYED)
+        .exclude(player_1_id = F('player_2_id'))
+        .annotate(low_id = Least('player_1_id', 'player_2_id'), high_id = Greatest('player_1_id', 'player_2_id'))
+        .values('club_id', 'low_id', 'high_id')
+        .annotate(
+            games = Count('id'),
+            low_wins = Count('id', filter = low_won),
+            high_wins = Count('id', filter = high_won),
+            draws = Count('id', filter = Q(status = Match.DRAW)),
+            last_played = Max('date_time'),
+        )
+        .order_by())
+
+def _record_fields(totals):
+    """Returns the counters of a record from a row of grouped totals."""
+    return {
+        'games': totals['games'],
+        'player_1_wins': totals['low_wins'],
+        'player_2_wins': totals['high_wins'],
+        'draws': totals['draws'],
+        'last_played': totals['last_played'],
+    }
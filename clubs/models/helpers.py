@@ -1,6 +1,7 @@
 """Helper classes for the rest of the models."""
 
 from django.contrib.auth.base_user import BaseUserManager
+from django.db import models
 
 class UserManager(BaseUserManager):
     """Define a model manager for User model with no username field."""
@@ -26,3 +27,10 @@ class UserManager(BaseUserManager):
         user.set_password(password)
         user.save(using=self._db)
         return user
+
+class ClubManager(models.Manager):
+    """Define a model manager for Club model that leaves out the deleted clubs."""
+
+    def get_queryset(self):
+        """Return the clubs that have not been deleted."""
+        return super().get_queryset().filter(deleted_at__isnull=True)
@@ -0,0 +1,68 @@
+"""The models that record match changes so they can be pushed to a club's live stream."""
+
+from django.db import models
+from clubs.models import Club, Match
+
+class MatchEvent(models.Model):
+    """Match event model used to publish match changes to the members of a club."""
+    club = models.ForeignKey(
+        Club,
+        on_delete = models.CASCADE,
+        blank = False,
+        null = False,
+    )
+
+    match = models.ForeignKey(
+        Match,
+        on_delete = models.CASCADE,
+        blank = False,
+        null = False,
+    )
+
+    # Kind options for the different changes of a match
+    CREATED = "Created"
+    UPDATED = "Updated"
+    CANCELLED = "Cancelled"
+    FORFEITED = "Forfeited"
+
+    KINDS = [
+        (CREATED, "Created"),
+        (UPDATED, "Updated"),
+        (CANCELLED, "Cancelled"),
+        (FORFEITED, "Forfeited"),
+    ]
+
+    kind = models.CharField(max_length = 10, choices = KINDS, blank = False)
+
+    created_at = models.DateTimeField(auto_now_add = True, editable = False)
+
+    @classmethod
+    def publish(cls, match, kind):
+        """Records a change of the given match for the subscribers of its club."""
+        return cls.objects.create(club_id = match.club_id, match = match, kind = kind)
+
+    @classmethod
+    def publish_all(cls, matches, kind):
+        """Records the same change of many saved matches with a single insert."""
+        return cls.objects.bulk_create(
+            [cls(club_id = match.club_id, match_id = match.id, kind = kind) for match in matches],
+            batch_size = 500,
+        )
+
+    class Meta:
+        """Model options, events are read in the order they were published."""
+        ordering = ["id"]
+        indexes = [
+            models.Index(fields = ['club', 'id'], name = 'match_event_club_id_idx'),
+        ]
+
+def match_events_after(club_id, last_event_id):
+    """Returns the events of a club published after the given event id."""
+    return (MatchEvent.objects
+        .filter(club_id = club_id, id__gt = last_event_id)
+        .select_related('match__player_1', 'match__player_2'))
+
+def latest_match_event_id(club_id):
+    """Returns the id of the last event published in a club, or 0 if there is none."""
+    last_event = MatchEvent.objects.filter(club_id = club_id).order_by('-id').values_list('id', flat = True).first()
+    return last_event or 0
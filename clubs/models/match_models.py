@@ -1,10 +1,22 @@
 """The models that encapsulate a match between two users in the same club."""
 
-from django.db import models
+from django.db import models, transaction
+from django.utils import timezone
 from clubs.models import User, Club
 from django.db.utils import IntegrityError
-from datetime import datetime
-import pytz
+
+class MatchQuerySet(models.QuerySet):
+    """Queries of matches."""
+
+    def for_display(self):
+        """Returns the matches with everything a match card shows, the players
+        joined in and whether each match is overdue worked out by the database."""
+        return self.select_related('player_1', 'player_2').annotate(
+            overdue = models.ExpressionWrapper(models.Q(date_time__lte = timezone.now()), output_field = models.BooleanField()))
+
+    def in_open_clubs(self):
+        """Returns the matches of clubs that are not deleted, a deleted club keeps its matches until it is purged."""
+        return self.filter(club__deleted_at__isnull = True)
 
 class Match(models.Model):
     """Match model used for creating a match between two users of the same club."""
@@ -31,6 +43,15 @@ class Match(models.Model):
         null = False,
     )
 
+    tournament = models.ForeignKey(
+        'Tournament',
+        on_delete = models.CASCADE,
+        blank = True,
+        null = True,
+    )
+
+    round = models.PositiveSmallIntegerField(blank = True, null = True)
+
     location = models.CharField(unique = False, max_length = 100, blank = False)
     date_time = models.DateTimeField(blank = False)
 
@@ -51,6 +72,8 @@ class Match(models.Model):
 
     status = models.CharField(max_length = 15, choices = STATUS, default = PENDING, blank = False)
 
+    objects = MatchQuerySet.as_manager()
+
     def is_pending(self):
         """Returns true if match is pending else returns false."""
         return self.status == self.PENDING
@@ -74,16 +97,34 @@ class Match(models.Model):
         return self.status == self.CANCELLED
 
     def is_overdue(self):
-        """Returns true if the match is overdue else returns false."""
-        utc = pytz.UTC
-        current_time = utc.localize(datetime.today()).strftime("%Y-%m-%d %H:%M:%S")
-        return current_time >= str(self.date_time)
+        """Returns true if the match is overdue else returns false, as annotated by for_display if it was."""
+        if hasattr(self, 'overdue'):
+            return self.overdue
+        return timezone.now() >= self.date_time
+
+    # Status the match had when it was loaded, to tell when its result changes
+    _saved_status = PENDING
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Loads the match and remembers its status."""
+        match = super().from_db(db, field_names, values)
+        match._saved_status = match.__dict__.get('status', cls.PENDING)
+        return match
 
     def save(self, *args, **kwargs):
         """Saves the match into the database or generates errors if any."""
         if (not self.members_from_same_club() or (self.player_1 is self.player_2) or self.is_a_duplicate()) and self.is_pending():
             raise IntegrityError("Matches are only for two distinct members who must be in the same club!")
         super().save(*args, **kwargs)
+        if self.status != self._saved_status:
+            self.result_changed()
+        self._saved_status = self.status
+
+    def result_changed(self):
+        """Brings the head-to-head record of the players up to date with the result."""
+        from clubs.models import refresh_head_to_head
+        refresh_head_to_head(self.club_id, self.player_1_id, self.player_2_id)
 
     class Meta:
         """Model options, provides ordering for our matches."""
@@ -106,4 +147,34 @@ class Match(models.Model):
             location=self.location,
             date_time=self.date_time,
             status = Match.PENDING)
-        ).exists()  
+        ).exists()
+
+def withdraw_from_club_matches(club_id, user_id):
+    """Resolves the pending matches of a member leaving a club, returns how many there were.
+
+    The matches still to be played are cancelled and the overdue ones are
+    forfeited by the member, with one update each, in the transaction that
+    removes the membership. The changes are published to the club and the
+    head-to-head records of the forfeits are brought up to date.
+    """
+    from clubs.models import MatchEvent, refresh_head_to_head
+    now = timezone.now()
+    with transaction.atomic():
+        pending = Match.objects.select_for_update().filter(
+            models.Q(player_1_id = user_id) | models.Q(player_2_id = user_id), club_id = club_id, status = Match.PENDING)
+        matches = list(pending.values_list('id', 'player_1_id', 'player_2_id', 'date_time'))
+        if not matches:
+            return 0
+        pending.filter(date_time__gt = now).update(status = Match.CANCELLED)
+        pending.filter(date_time__lte = now).update(status = models.Case(
+            models.When(player_1_id = user_id, then = models.Value(Match.PLAYER2)),
+            default = models.Value(Match.PLAYER1)))
+        MatchEvent.objects.bulk_create([
+            MatchEvent(club_id = club_id, match_id = match_id, kind = MatchEvent.CANCELLED if date_time > now else MatchEvent.FORFEITED)
+            for match_id, player_1_id, player_2_id, date_time in matches
+        ])
+        forfeited_opponents = {player_2_id if player_1_id == user_id else player_1_id
+            for match_id, player_1_id, player_2_id, date_time in matches if date_time <= now}
+        for opponent_id in forfeited_opponents:
+            refresh_head_to_head(club_id, user_id, opponent_id)
+    return len(matches)
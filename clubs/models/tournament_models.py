@@ -0,0 +1,281 @@
+"""The models that group the matches of a club into a tournament."""
+
+from datetime import timedelta
+from django.core.validators import MinValueValidator
+from django.db import models, transaction
+from django.db.models import Q
+from clubs.models import User, Club, Membership, Match, MatchEvent, club_opponents
+from clubs.scheduling import SwissPlayer, pair_swiss_round, PairingError, WHITE, BLACK
+from clubs.scheduling import berger_rounds, seeded_bracket, knockout_rounds, next_knockout_pairs
+
+KNOCKOUT_TOO_FEW_ENTRANTS = "A knockout tournament needs at least two entrants."
+
+class Tournament(models.Model):
+    """Tournament model used for pairing whole rounds of matches between the entrants."""
+    club = models.ForeignKey(
+        Club,
+        on_delete = models.CASCADE,
+        blank = False,
+        null = False,
+    )
+
+    players = models.ManyToManyField(User, through = 'TournamentEntry')
+
+    name = models.CharField(max_length = 50, blank = False)
+    location = models.CharField(max_length = 100, blank = False)
+
+    # Format options for the pairing system of the tournament
+    SWISS = "Swiss"
+    ROUND_ROBIN = "Round robin"
+    KNOCKOUT = "Knockout"
+
+    FORMATS = [
+        (SWISS, "Swiss"),
+        (ROUND_ROBIN, "Round robin"),
+        (KNOCKOUT, "Knockout"),
+    ]
+
+    format = models.CharField(max_length = 12, choices = FORMATS, default = SWISS, blank = False)
+    rounds = models.PositiveSmallIntegerField(blank = False, validators = [MinValueValidator(1)])
+    current_round = models.PositiveSmallIntegerField(default = 0)
+
+    # Dates of scheduled rounds, round n is played (n - 1) * days_between_rounds after the start
+    starts_at = models.DateTimeField(blank = True, null = True)
+    days_between_rounds = models.PositiveSmallIntegerField(default = 7, validators = [MinValueValidator(1)])
+
+    created_at = models.DateTimeField(auto_now_add = True, editable = False)
+
+    # Points given for each result
+    WIN_POINTS = 1
+    DRAW_POINTS = 0.5
+    BYE_POINTS = 1
+
+    # Number of matches sent to the database in a single insert
+    MATCH_BATCH_SIZE = 500
+
+    def __str__(self):
+        """Returns the name of the tournament for the admin interface."""
+        return self.name
+
+    def is_finished(self):
+        """Returns true if every round of the tournament has been paired."""
+        return self.current_round >= self.rounds
+
+    def has_pending_matches(self):
+        """Returns true if a match of the tournament is still waiting for a result."""
+        return self.match_set.filter(status = Match.PENDING).exists()
+
+    def standings(self):
+        """Returns the entries ordered by score, each annotated with its score."""
+        entries = list(self.tournamententry_set.select_related('user'))
+        players = self._swiss_players(entries)
+        for entry in entries:
+            entry.score = players[entry.user_id].score
+        return sorted(entries, key = lambda entry: (-entry.score, entry.id))
+
+    def round_date(self, round_number):
+        """Returns the date/time of a round from the start of the tournament."""
+        if self.starts_at is None:
+            return None
+        return self.starts_at + timedelta(days = self.days_between_rounds * (round_number - 1))
+
+    def schedule(self):
+        """Sets the number of rounds from the entrants and creates the matches known up front.
+
+        Round robins are scheduled in full and knockouts get their first
+        round, Swiss rounds are only paired once the previous one is played.
+        """
+        entrants = self.tournamententry_set.count()
+        if self.format == self.ROUND_ROBIN:
+            with transaction.atomic():
+                rounds = berger_rounds(self._playing_user_ids())
+                self._create_matches({
+                    round_number: pairs for round_number, pairs in enumerate(rounds, start = 1)
+                })
+                self.rounds = self.current_round = max(len(rounds), 1)
+                self.save(update_fields = ['rounds', 'current_round'])
+        elif self.format == self.KNOCKOUT:
+            if entrants < 2:
+                raise PairingError(KNOCKOUT_TOO_FEW_ENTRANTS)
+            self.rounds = max(knockout_rounds(entrants), 1)
+            self.save(update_fields = ['rounds'])
+            self.pair_next_round()
+
+    def pair_next_round(self, date_time = None):
+        """Creates all matches of the next round in batched inserts and returns them."""
+        with transaction.atomic():
+            self.current_round = (Tournament.objects.select_for_update()
+                .values_list('current_round', flat = True).get(id = self.id))
+            if self.is_finished():
+                raise PairingError("Every round of this tournament has already been paired.")
+            if self.has_pending_matches():
+                raise PairingError("Every match of the current round needs a result before the next round.")
+
+            round_number = self.current_round + 1
+            if self.format == self.KNOCKOUT:
+                pairs = self._knockout_pairs()
+            else:
+                players = self._swiss_players(self.tournamententry_set.filter(user__membership__club_id = self.club_id))
+                met_before = club_opponents(self.club_id)
+                for player in players.values():
+                    player.met_before = met_before.get(player.id, set())
+                pairs, bye = pair_swiss_round(players.values())
+                pairs = [(white.id, black.id) for white, black in pairs]
+                if bye is not None:
+                    TournamentEntry.objects.filter(tournament = self, user_id = bye).update(byes = models.F('byes') + 1)
+            matches = self._create_matches({round_number: pairs}, date_time)
+            self.current_round = round_number
+            self.save(update_fields = ['current_round'])
+        return matches
+
+    def _playing_user_ids(self):
+        """Returns the ids of the entrants who are still members of the club, best seed first."""
+        return list(self.tournamententry_set
+            .filter(user__membership__club_id = self.club_id)
+            .order_by('id').values_list('user_id', flat = True))
+
+    def _create_matches(self, rounds, date_time = None):
+        """Inserts the pairs of each round after checking them against the players' other matches, and publishes them.
+
+        The pending matches of every entrant are loaded once and conflicts are
+        found in memory, so the per-row checks of Match.save are not needed.
+        """
+        booked = self._booked_date_times()
+        matches = []
+        for round_number, pairs in rounds.items():
+            round_date_time = date_time or self.round_date(round_number)
+            if round_date_time is None:
+                raise PairingError("The tournament needs a start date/time to schedule its rounds.")
+            for white_id, black_id in pairs:
+                if (white_id, round_date_time) in booked or (black_id, round_date_time) in booked:
+                    raise PairingError("One or both players have a scheduled match at this date/time!")
+                matches.append(Match(
+                    player_1_id = white_id,
+                    player_2_id = black_id,
+                    club_id = self.club_id,
+                    tournament = self,
+                    round = round_number,
+                    location = self.location,
+                    date_time = round_date_time,
+                ))
+        Match.objects.bulk_create(matches, batch_size = self.MATCH_BATCH_SIZE)
+        # Not every database returns the ids of bulk inserted rows, the new matches are read back for their events
+        matches = list(Match.objects.filter(tournament = self, round__in = list(rounds)).order_by('id'))
+        MatchEvent.publish_all(matches, MatchEvent.CREATED)
+        return matches
+
+    def _booked_date_times(self):
+        """Returns (player id, date/time) for every pending match of the entrants, in a single query."""
+        entrants = self.tournamententry_set.values('user_id')
+        pending = Match.objects.in_open_clubs().filter(status = Match.PENDING).filter(
+            Q(player_1_id__in = entrants) | Q(player_2_id__in = entrants)
+        ).values_list('player_1_id', 'player_2_id', 'date_time')
+        booked = set()
+        for player_1_id, player_2_id, date_time in pending:
+            booked.add((player_1_id, date_time))
+            booked.add((player_2_id, date_time))
+        return booked
+
+    def _knockout_pairs(self):
+        """Returns the pairs of the next knockout round by replaying the bracket with the results so far.
+
+        Draws and cancelled matches are won by the better seed, and a player
+        who has left the club loses their next match without it being played.
+        """
+        seeds = list(self.tournamententry_set.order_by('id').values_list('user_id', flat = True))
+        if len(seeds) < 2:
+            raise PairingError(KNOCKOUT_TOO_FEW_ENTRANTS)
+        seed_of = {user_id: seed for seed, user_id in enumerate(seeds)}
+        playing = set(self._playing_user_ids())
+        results = {
+            frozenset((player_1_id, player_2_id)): (player_1_id, player_2_id, status)
+            for player_1_id, player_2_id, status in self.match_set.values_list('player_1_id', 'player_2_id', 'status')
+        }
+
+        def winner_of(first, second):
+            player_1_id, player_2_id, status = results.get(frozenset((first, second)), (first, second, None))
+            if status == Match.PLAYER1:
+                return player_1_id
+            if status == Match.PLAYER2:
+                return player_2_id
+            if status is None and not (first in playing and second in playing):
+                return first if first in playing else second
+            if status == Match.PENDING or status is None:
+                return None
+            return min(first, second, key = seed_of.get)
+
+        bracket = seeded_bracket(seeds)
+        for round_number in range(self.current_round + 1):
+            bracket, pairs = next_knockout_pairs(bracket, winner_of)
+        return [(first, second) for first, second in pairs if first in playing and second in playing]
+
+    def _swiss_players(self, entries):
+        """Returns the standing of each entry computed from the results of the tournament's matches."""
+        players = {
+            entry.user_id: SwissPlayer(
+                entry.user_id,
+                score = entry.byes * self.BYE_POINTS,
+                rank = entry.id,
+                had_bye = entry.byes > 0,
+            ) for entry in entries
+        }
+        results = self.match_set.exclude(status = Match.CANCELLED).order_by('round', 'id').values_list(
+            'player_1_id', 'player_2_id', 'status')
+        for white_id, black_id, status in results:
+            white, black = players.get(white_id), players.get(black_id)
+            for player, colour, opponent_id in ((white, WHITE, black_id), (black, BLACK, white_id)):
+                if player is not None:
+                    player.opponents.add(opponent_id)
+                    player.colour_balance += colour
+                    player.last_colour = colour
+            if status == Match.DRAW:
+                self._add_points(white, self.DRAW_POINTS)
+                self._add_points(black, self.DRAW_POINTS)
+            elif status == Match.PLAYER1:
+                self._add_points(white, self.WIN_POINTS)
+            elif status == Match.PLAYER2:
+                self._add_points(black, self.WIN_POINTS)
+        return players
+
+    def _add_points(self, player, points):
+        """Adds points to a player who is still entered in the tournament."""
+        if player is not None:
+            player.score += points
+
+    class Meta:
+        """Model options, provides an ordering to the tournaments."""
+        ordering = ["-created_at"]
+
+
+class TournamentEntry(models.Model):
+    """Tournament entry model used for the players taking part in a tournament."""
+    tournament = models.ForeignKey(
+        Tournament,
+        on_delete = models.CASCADE,
+        blank = False,
+        null = False,
+    )
+
+    user = models.ForeignKey(
+        User,
+        on_delete = models.CASCADE,
+        blank = False,
+        null = False,
+    )
+
+    byes = models.PositiveSmallIntegerField(default = 0)
+
+    class Meta:
+        """Model options, states that a user can enter a tournament only once."""
+        constraints = [
+            models.UniqueConstraint(
+                fields = ['tournament', 'user'],
+                name = 'one_entry_per_tournament'
+            )
+        ]
+
+def enter_club_members(tournament):
+    """Enters every current member of the tournament's club into the tournament."""
+    members = Membership.objects.filter(club_id = tournament.club_id).order_by('id').values_list('user_id', flat = True)
+    return TournamentEntry.objects.bulk_create(
+        [TournamentEntry(tournament = tournament, user_id = user_id) for user_id in members])
@@ -1,10 +1,13 @@
 """The models that represent the users and their membership in a club."""
 
 from django.db import models
+from django.db.models import Q
+from django.db.models.functions import Lower
 from django.contrib.auth.models import AbstractUser
 from django.core.validators import RegexValidator
 from libgravatar import Gravatar
-from clubs.models.helpers import UserManager
+from clubs.models.helpers import ClubManager, UserManager
+from clubs.geo import geocode, grid_cell, square_cell_ranges, covered_radius_km, distance_km
 
 class User(AbstractUser):
     """User model used for authentication and is used to keep track applications/memberships."""
@@ -58,16 +61,16 @@ class User(AbstractUser):
         return f'{self.first_name} {self.last_name}'
 
     def is_member(self):
-        """Returns whether the user is a member in at least one club."""
-        return len(Membership.objects.filter(user=self, role=Membership.MEMBER)) != 0
+        """Returns whether the user is a member in at least one club that is not deleted."""
+        return Membership.objects.filter(user=self, role=Membership.MEMBER, club__deleted_at__isnull=True).exists()
 
     def is_owner(self):
-        """Returns whether the user is an owner in at least one club."""
-        return len(Membership.objects.filter(user=self, role=Membership.OWNER)) != 0
+        """Returns whether the user is an owner in at least one club that is not deleted."""
+        return Membership.objects.filter(user=self, role=Membership.OWNER, club__deleted_at__isnull=True).exists()
 
     def is_officer(self):
-        """Returns whether the user is an officer in at least one club."""
-        return len(Membership.objects.filter(user=self, role=Membership.OFFICER)) != 0
+        """Returns whether the user is an officer in at least one club that is not deleted."""
+        return Membership.objects.filter(user=self, role=Membership.OFFICER, club__deleted_at__isnull=True).exists()
 
     def is_member_of(self, club):
         """Returns whether the user is a member in a given club."""
@@ -87,8 +90,14 @@ class User(AbstractUser):
         return Club.objects.filter(membership__in=membership)
 
     class Meta:
-        """Model options, to provide ordering for the user model."""
+        """Model options, to provide ordering for the user model, and indexes
+        of the lower case names for case insensitive prefix searches."""
         ordering = ['first_name', 'last_name']
+        indexes = [
+            models.Index(Lower('username'), name='user_username_lower_idx'),
+            models.Index(Lower('first_name'), name='user_first_name_lower_idx'),
+            models.Index(Lower('last_name'), name='user_last_name_lower_idx'),
+        ]
 
 
 class Club(models.Model):
@@ -97,10 +106,47 @@ class Club(models.Model):
     location = models.CharField(max_length=180, unique=False, blank=False)
     description = models.CharField(max_length=520, blank=False)
 
+    # Coordinates geocoded from the location, and the grid cell they are in
+    latitude = models.FloatField(blank=True, null=True)
+    longitude = models.FloatField(blank=True, null=True)
+    grid_cell = models.IntegerField(blank=True, null=True, db_index=True)
+
+    # Set when the club is deleted, its rows are then purged in the background
+    deleted_at = models.DateTimeField(blank=True, null=True)
+
+    # Hides the deleted clubs, all_objects still finds them.
+    objects = ClubManager()
+    all_objects = models.Manager()
+
+    # Location the coordinates were geocoded from
+    _geocoded_location = None
+
     def __str__(self):
         """Returns the name of the club for the admin interface"""
         return self.name 
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Loads the club and remembers the location its coordinates belong to."""
+        club = super().from_db(db, field_names, values)
+        club._geocoded_location = club.__dict__.get('location')
+        return club
+
+    def save(self, *args, **kwargs):
+        """Geocodes the location if it changed, then saves the club."""
+        if self.location != self._geocoded_location:
+            self.set_coordinates(geocode(self.location))
+            self._geocoded_location = self.location
+        super().save(*args, **kwargs)
+
+    def set_coordinates(self, coordinates):
+        """Sets the latitude and longitude of the club, and its grid cell, from a pair or None."""
+        if coordinates is None:
+            self.latitude = self.longitude = self.grid_cell = None
+        else:
+            self.latitude, self.longitude = coordinates
+            self.grid_cell = grid_cell(self.latitude, self.longitude)
+
     def get_owner(self):
         """Returns the user of the club."""
         return Membership.objects.get(club=self,role=Membership.OWNER).user
@@ -109,6 +155,50 @@ class Club(models.Model):
         """Returns how many members there are in the club."""
         return len(Membership.objects.filter(club=self))
 
+    class Meta:
+        """Model options, indexes the lower case name for case insensitive prefix searches.
+        Deleted clubs keep their name until purged, so the uniqueness of names is
+        validated against all clubs."""
+        default_manager_name = 'all_objects'
+        indexes = [
+            models.Index(Lower('name'), name='club_name_lower_idx'),
+        ]
+
+# Largest square of grid cells, in cells from the centre, read when looking for nearby clubs
+NEARBY_MAX_RADIUS = 128
+
+def nearest_clubs(latitude, longitude, count = 10, clubs = None):
+    """Returns the given number of clubs closest to a point, each with its distance_km set.
+
+    Squares of grid cells twice as wide as the last are read until the
+    furthest club found is closer than anything outside the square can be.
+    When the largest square is not enough, every club with coordinates is
+    read instead, so far away clubs are still found.
+    """
+    clubs = Club.objects.all() if clubs is None else clubs
+    radius = 1
+    while radius <= NEARBY_MAX_RADIUS:
+        cells = Q()
+        for first, last in square_cell_ranges(latitude, longitude, radius):
+            cells |= Q(grid_cell__range=(first, last))
+        found = _closest_clubs(latitude, longitude, count, clubs.filter(cells))
+        if len(found) >= count and found[-1][0] <= covered_radius_km(latitude, radius):
+            break
+        radius *= 2
+    else:
+        found = _closest_clubs(latitude, longitude, count, clubs.filter(grid_cell__isnull=False))
+    nearest = Club.objects.in_bulk([club_id for distance, club_id in found])
+    for distance, club_id in found:
+        nearest[club_id].distance_km = distance
+    return [nearest[club_id] for distance, club_id in found]
+
+def _closest_clubs(latitude, longitude, count, clubs):
+    """Returns (distance, id) of the given number of clubs closest to a point, closest first."""
+    return sorted(
+        (distance_km(latitude, longitude, club_latitude, club_longitude), club_id)
+        for club_id, club_latitude, club_longitude in clubs.values_list('id', 'latitude', 'longitude')
+    )[:count]
+
 class Membership(models.Model):
     """Membership model used for roles within a club."""
     user = models.ForeignKey(
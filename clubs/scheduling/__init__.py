@@ -0,0 +1,3 @@
+from .swiss import *
+from .round_robin import *
+from .knockout import *
@@ -0,0 +1,41 @@
+"""Knockout brackets where the best seeds can only meet in the last rounds."""
+
+def seeded_bracket(players):
+    """Returns the players placed in bracket order, None marking a bye for the seed next to it.
+
+    The players must be given best seed first. The bracket is padded to a
+    power of two and seeds are placed so that seed 1 and 2 can only meet in
+    the final, byes going to the best seeds.
+    """
+    size = 1
+    while size < len(players):
+        size *= 2
+    order = [1]
+    while len(order) < size:
+        order = [seed for top in order for seed in (top, 2 * len(order) + 1 - top)]
+    return [players[seed - 1] if seed <= len(players) else None for seed in order]
+
+def knockout_rounds(size):
+    """Returns the number of rounds needed to decide a knockout between the given number of players."""
+    rounds = 0
+    while (1 << rounds) < size:
+        rounds += 1
+    return rounds
+
+def next_knockout_pairs(bracket, winner_of):
+    """Returns the bracket of the next round and the pairs that still need to be played.
+
+    Pairs next to each other in the bracket play each other, a player drawn
+    against None goes through, and winner_of is asked for the winner of
+    every other pair and may return None while the result is not known.
+    """
+    next_bracket = []
+    pairs = []
+    for index in range(0, len(bracket), 2):
+        first, second = bracket[index], bracket[index + 1]
+        if first is None or second is None:
+            next_bracket.append(first if second is None else second)
+        else:
+            next_bracket.append(winner_of(first, second))
+            pairs.append((first, second))
+    return next_bracket, pairs
@@ -0,0 +1,26 @@
+"""Round-robin schedules built from Berger tables."""
+
+def berger_rounds(players):
+    """Returns the (white, black) pairs of every round so that each player meets every other once.
+
+    With an odd number of players a missing opponent is added and whoever
+    is drawn against it sits the round out. The fixed last player alternates
+    colours every round and the others rotate by half the table, which is
+    what the Berger tables used by chess arbiters do.
+    """
+    players = list(players)
+    if len(players) < 2:
+        return []
+    if len(players) % 2:
+        players.append(None)
+    size = len(players)
+    half = size // 2
+    rotating, fixed = players[:-1], players[-1]
+    rounds = []
+    for round_number in range(size - 1):
+        first = rotating[0]
+        pairs = [(fixed, first) if round_number % 2 else (first, fixed)]
+        pairs += [(rotating[index], rotating[-index]) for index in range(1, half)]
+        rounds.append([pair for pair in pairs if None not in pair])
+        rotating = rotating[half:] + rotating[:half]
+    return rounds
@@ -0,0 +1,173 @@
+"""Swiss-system pairing engine which pairs a round of a tournament from the standings."""
+
+WHITE = 1
+BLACK = -1
+
+class PairingError(ValueError):
+    """Raised when a round cannot be paired without repeating a pairing."""
+
+class SwissPlayer:
+    """A player's standing in the tournament, as needed for pairing the next round."""
+    __slots__ = ['id', 'score', 'rank', 'colour_balance', 'last_colour', 'opponents', 'had_bye', 'met_before']
+
+    def __init__(self, id, score=0, rank=0, colour_balance=0, last_colour=None, opponents=None, had_bye=False, met_before=None):
+        self.id = id
+        self.score = score
+        self.rank = rank
+        self.colour_balance = colour_balance
+        self.last_colour = last_colour
+        self.opponents = opponents if opponents is not None else set()
+        self.had_bye = had_bye
+        self.met_before = met_before if met_before is not None else set()
+
+    def can_play(self, other):
+        """Returns true if the players have not met in the tournament yet."""
+        return other.id not in self.opponents
+
+    def prefers(self, other):
+        """Returns true if the players have not met outside the tournament either."""
+        return other.id not in self.met_before
+
+def pair_swiss_round(players):
+    """Returns the (white, black) pairs of the round and the id of the player with a bye.
+
+    Players are ranked by score and seed and split into score groups. Every
+    group pairs its top half against its bottom half, players who cannot be
+    paired there float down into the next group, and anything left at the
+    bottom is repaired by swapping opponents with already made pairs. Only
+    if that fails too, which happens in small fields late in a tournament, is
+    the whole round searched for a pairing without repeats.
+    """
+    ranked = sorted(players, key=lambda player: (-player.score, player.rank))
+    if len(ranked) % 2 == 0:
+        return _pair_players(ranked), None
+    for bye in _bye_candidates(ranked):
+        try:
+            return _pair_players([player for player in ranked if player is not bye]), bye.id
+        except PairingError:
+            continue
+    raise PairingError("Every remaining pairing has already been played in this tournament.")
+
+def _pair_players(ranked):
+    """Returns the (white, black) pairs for an even number of ranked players."""
+    pairs = []
+    floaters = []
+    for group in _score_groups(ranked):
+        floaters = _pair_group(floaters + group, pairs)
+    if floaters and not _repair(floaters, pairs):
+        pairs = _search(ranked)
+    return [_assign_colours(first, second) for first, second in pairs]
+
+def _bye_candidates(ranked):
+    """Yields the players from the lowest ranked up, those who have not had a bye yet first."""
+    yield from (player for player in reversed(ranked) if not player.had_bye)
+    yield from (player for player in reversed(ranked) if player.had_bye)
+
+def _score_groups(ranked):
+    """Yields the ranked players grouped by equal score."""
+    group = []
+    for player in ranked:
+        if group and group[-1].score != player.score:
+            yield group
+            group = []
+        group.append(player)
+    if group:
+        yield group
+
+def _pair_group(group, pairs):
+    """Pairs the top half of a group against its bottom half and returns the players left over."""
+    half = len(group) // 2
+    top, bottom = group[:half], group[half:]
+    left_over = []
+    for player in top:
+        opponent = _find_opponent(player, bottom)
+        if opponent is None:
+            left_over.append(player)
+        else:
+            bottom.remove(opponent)
+            pairs.append((player, opponent))
+    floaters = []
+    remaining = left_over + bottom
+    while remaining:
+        player = remaining.pop(0)
+        opponent = _find_opponent(player, remaining)
+        if opponent is None:
+            floaters.append(player)
+        else:
+            remaining.remove(opponent)
+            pairs.append((player, opponent))
+    return floaters
+
+def _find_opponent(player, candidates):
+    """Returns the first candidate the player has not met yet, preferring those they never played in the club."""
+    allowed = None
+    for candidate in candidates:
+        if player.can_play(candidate):
+            if player.prefers(candidate):
+                return candidate
+            allowed = allowed or candidate
+    return allowed
+
+def _repair(left_over, pairs):
+    """Pairs the players left at the bottom by swapping opponents with the lowest made pairs."""
+    while left_over:
+        player = left_over.pop(0)
+        opponent = _find_opponent(player, left_over)
+        if opponent is not None:
+            left_over.remove(opponent)
+            pairs.append((player, opponent))
+        elif not _swap_into_pairs(player, left_over.pop(0), pairs):
+            return False
+    return True
+
+def _search(ranked, limit=100000):
+    """Returns pairs for all ranked players found by backtracking, trying the best ranked opponents first."""
+    pairs = []
+    unpaired = list(ranked)
+    steps = 0
+
+    def backtrack():
+        nonlocal steps
+        if not unpaired:
+            return True
+        player = unpaired.pop(0)
+        for index, opponent in enumerate(unpaired):
+            steps += 1
+            if steps > limit:
+                break
+            if player.can_play(opponent):
+                unpaired.pop(index)
+                pairs.append((player, opponent))
+                if backtrack():
+                    return True
+                pairs.pop()
+                unpaired.insert(index, opponent)
+        unpaired.insert(0, player)
+        return False
+
+    if not backtrack():
+        raise PairingError("Every remaining pairing has already been played in this tournament.")
+    return pairs
+
+def _swap_into_pairs(player, other, pairs):
+    """Breaks up an existing pair so that both players can be paired without a repeat."""
+    for index in range(len(pairs) - 1, -1, -1):
+        first, second = pairs[index]
+        if player.can_play(first) and other.can_play(second):
+            pairs[index] = (player, first)
+            pairs.append((other, second))
+            return True
+        if player.can_play(second) and other.can_play(first):
+            pairs[index] = (player, second)
+            pairs.append((other, first))
+            return True
+    return False
+
+def _assign_colours(first, second):
+    """Returns the pair as (white, black), evening out the colours each player had."""
+    if first.colour_balance != second.colour_balance:
+        return (first, second) if first.colour_balance < second.colour_balance else (second, first)
+    if first.last_colour != second.last_colour:
+        first_is_due_white = first.last_colour == BLACK or second.last_colour == WHITE
+        return (first, second) if first_is_due_white else (second, first)
+    return (first, second) if first.rank < second.rank else (second, first)
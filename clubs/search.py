@@ -0,0 +1,210 @@
+"""Full-text search over clubs and users, and prefix search of club and member names.
+
+PostgreSQL searches a generated tsvector column through a GIN index and
+SQLite an FTS5 table kept in sync by triggers, both created by migration
+0018_search_index. Any other database falls back to case insensitive
+substring matching. Results are ranked by relevance and fetched one page
+at a time without counting every match. Rows that are not shown, closed
+accounts and deleted clubs, are left out by the same query that ranks and
+pages the matches, so every page but the last is full.
+"""
+
+import re
+from django.db import connection, connections
+from django.db.models import Q
+from django.db.models.functions import Lower
+from clubs.models import Club, User
+
+RESULTS_PER_PAGE = 20
+MAX_TERMS = 8
+
+# Suggestions returned by an autocomplete
+AUTOCOMPLETE_RESULTS = 10
+
+# Sorts after any character, a prefix followed by it bounds the names starting with the prefix
+PREFIX_END = '\U0010ffff'
+
+# Columns of each searchable table, the first ones weigh more in the ranking
+SEARCH_TABLES = {
+    'clubs_club': ['name', 'location', 'description'],
+    'clubs_user': ['username', 'first_name', 'last_name', 'bio'],
+}
+
+# Condition a row of each searchable table meets when it is shown, the SQL of the visible filter of its search
+VISIBLE_ROWS = {
+    'clubs_club': 'clubs_club.deleted_at IS NULL',
+    'clubs_user': 'clubs_user.is_active',
+}
+
+class SearchPage:
+    """A page of ranked search results."""
+
+    def __init__(self, results, number, has_next):
+        self.results = results
+        self.number = number
+        self.has_next = has_next
+
+    def has_previous(self):
+        """Returns true if there is a page before this one."""
+        return self.number > 1
+
+    def next_page_number(self):
+        """Returns the number of the next page."""
+        return self.number + 1
+
+    def previous_page_number(self):
+        """Returns the number of the previous page."""
+        return self.number - 1
+
+    def __iter__(self):
+        """Iterates over the results of the page."""
+        return iter(self.results)
+
+    def __len__(self):
+        """Returns the number of results on the page."""
+        return len(self.results)
+
+def search_terms(query):
+    """Returns the words of a query, which are all that is passed on to the search engine."""
+    return re.findall(r'\w+', query.lower())[:MAX_TERMS]
+
+def search_clubs(query, page = 1):
+    """Returns the page of clubs that best match every word of the query."""
+    return _search(Club, 'clubs_club', query, page, Q(), 'name')
+
+def search_users(query, page = 1):
+    """Returns the page of active users that best match every word of the query."""
+    return _search(User, 'clubs_user', query, page, Q(is_active = True), 'username')
+
+def autocomplete_clubs(prefix, limit = AUTOCOMPLETE_RESULTS):
+    """Returns the id and name of the clubs whose name starts with the prefix, ignoring case.
+
+    The names are compared as a range of the lower case name, so the lookup
+    reads the club_name_lower_idx index instead of every club.
+    """
+    prefix = prefix.strip().lower()
+    if not prefix:
+        return []
+    return list(Club.objects.annotate(name_lower = Lower('name'))
+        .filter(_starts_with('name_lower', prefix))
+        .order_by('name_lower').values('id', 'name')[:limit])
+
+def autocomplete_members(club_id, prefix, limit = AUTOCOMPLETE_RESULTS):
+    """Returns the id and label of the members of a club whose username, first
+    name or last name starts with the prefix, ignoring case.
+
+    A prefix with a space matches a first name followed by the start of a
+    last name. Each name is compared as a range of its lower case value,
+    which the expression indexes of the user table answer.
+    """
+    prefix = ' '.join(prefix.lower().split())
+    if not prefix:
+        return []
+    if ' ' in prefix:
+        first_name, last_name = prefix.split(' ', 1)
+        starts = Q(first_name_lower = first_name) & _starts_with('last_name_lower', last_name)
+    else:
+        starts = _starts_with('username_lower', prefix) | _starts_with('first_name_lower', prefix) | _starts_with('last_name_lower', prefix)
+    members = (User.objects.filter(membership__club_id = club_id)
+        .annotate(username_lower = Lower('username'), first_name_lower = Lower('first_name'), last_name_lower = Lower('last_name'))
+        .filter(starts).only('id', 'username', 'first_name', 'last_name')[:limit])
+    return [{'id': member.id, 'name': member_label(member)} for member in members]
+
+def member_label(user):
+    """Returns how a member is shown in an autocomplete, their full name and username."""
+    return f'{user.full_name()} ({user.username})'
+
+def rebuild_search_index():
+    """Rebuilds the search index of every table from its rows."""
+    with connection.cursor() as cursor:
+        for table in SEARCH_TABLES:
+            if connection.vendor == 'sqlite':
+                cursor.execute(f"INSERT INTO {table}_fts({table}_fts) VALUES ('rebuild')")
+            elif connection.vendor == 'postgresql':
+                cursor.execute(f"REINDEX INDEX {table}_search_idx")
+
+def restore_search_triggers(using = 'default', **kwargs):
+    """Recreates the SQLite triggers lost when a migration rebuilt a searchable table, then reindexes it.
+
+    SQLite migrations rebuild a table to alter it, which drops its triggers,
+    so this runs after every migrate.
+    """
+    database = connections[using]
+    if database.vendor != 'sqlite':
+        return
+    with database.cursor() as cursor:
+        tables = database.introspection.table_names(cursor)
+        for table, columns in SEARCH_TABLES.items():
+            fts = f'{table}_fts'
+            if fts not in tables:
+                continue
+            triggers = [f'{fts}_{action}' for action in ('insert', 'delete', 'update')]
+            cursor.execute("SELECT count(*) FROM sqlite_master WHERE type = 'trigger' AND name IN (%s, %s, %s)", triggers)
+            if cursor.fetchone()[0] == len(triggers):
+                continue
+            for statement in _sqlite_triggers(table, columns):
+                cursor.execute(statement)
+            cursor.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+
+def _sqlite_triggers(table, columns):
+    """Returns the statements creating the triggers that copy every change of the table to its FTS5 index."""
+    fts = f'{table}_fts'
+    names = ', '.join(columns)
+    new_values = ', '.join(f'new.{column}' for column in columns)
+    old_values = ', '.join(f'old.{column}' for column in columns)
+    return [
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_insert AFTER INSERT ON {table} BEGIN "
+        f"INSERT INTO {fts}(rowid, {names}) VALUES (new.id, {new_values}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_delete AFTER DELETE ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {names}) VALUES ('delete', old.id, {old_values}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_update AFTER UPDATE OF {names} ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {names}) VALUES ('delete', old.id, {old_values}); "
+        f"INSERT INTO {fts}(rowid, {names}) VALUES (new.id, {new_values}); END",
+    ]
+
+def _search(model, table, query, page, visible, ordering):
+    """Runs the search on the table and returns the page of model instances in ranked order."""
+    terms = search_terms(query)
+    page = max(page, 1)
+    if not terms:
+        return SearchPage([], page, False)
+    offset = (page - 1) * RESULTS_PER_PAGE
+    limit = RESULTS_PER_PAGE + 1
+    if connection.vendor in ('sqlite', 'postgresql'):
+        ids = _ranked_ids(table, terms, limit, offset)
+        found = model.objects.filter(visible).in_bulk(ids[:RESULTS_PER_PAGE])
+        results = [found[id] for id in ids[:RESULTS_PER_PAGE] if id in found]
+        return SearchPage(results, page, len(ids) > RESULTS_PER_PAGE)
+    matches = model.objects.filter(visible)
+    for term in terms:
+        matches = matches.filter(_any_field_contains(SEARCH_TABLES[table], term))
+    results = list(matches.order_by(ordering)[offset:offset + limit])
+    return SearchPage(results[:RESULTS_PER_PAGE], page, len(results) > RESULTS_PER_PAGE)
+
+def _ranked_ids(table, terms, limit, offset):
+    """Returns the ids of the best matching visible rows, from the index of the database in use."""
+    if connection.vendor == 'sqlite':
+        columns = len(SEARCH_TABLES[table])
+        weights = ', '.join(str(float(columns - index)) for index in range(columns))
+        sql = (f"SELECT {table}_fts.rowid FROM {table}_fts JOIN {table} ON {table}.id = {table}_fts.rowid "
+            f"WHERE {table}_fts MATCH %s AND {VISIBLE_ROWS[table]} "
+            f"ORDER BY bm25({table}_fts, {weights}), {table}_fts.rowid LIMIT %s OFFSET %s")
+        params = [' '.join(f'"{term}"*' for term in terms), limit, offset]
+    else:
+        sql = (f"SELECT id FROM {table}, to_tsquery('simple', %s) query WHERE search_vector @@ query "
+            f"AND {VISIBLE_ROWS[table]} ORDER BY ts_rank(search_vector, query) DESC, id LIMIT %s OFFSET %s")
+        params = [' & '.join(f'{term}:*' for term in terms), limit, offset]
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return [row[0] for row in cursor.fetchall()]
+
+def _starts_with(lower_column, prefix):
+    """Returns the condition that an annotated lower case column starts with the prefix."""
+    return Q(**{f'{lower_column}__gte': prefix, f'{lower_column}__lt': prefix + PREFIX_END})
+
+def _any_field_contains(fields, term):
+    """Returns a filter matching rows where one of the fields contains the term."""
+    condition = Q()
+    for field in fields:
+        condition |= Q(**{f'{field}__icontains': term})
+    return condition
@@ -0,0 +1,138 @@
+"""Snapshots of the database to start tests and benchmarks from a large state quickly.
+
+A snapshot is a SQLite file. When the database is SQLite the snapshot is a
+page by page copy of the whole database made with the online backup API,
+and loading it copies the pages back, without parsing a single row. Any
+other database, or a snapshot asked for as rows, copies the rows of the
+clubs tables in batches instead, which also loads into any database.
+
+Loading a snapshot replaces the data of the database. A snapshot records
+the migrations applied when it was taken and only loads into a database
+with the same migrations.
+"""
+
+import json
+import os
+import sqlite3
+from django.apps import apps
+from django.core.management.color import no_style
+from django.db import connection, transaction
+from django.db.migrations.recorder import MigrationRecorder
+from clubs.search import rebuild_search_index
+
+BACKUP = 'backup'
+ROWS = 'rows'
+
+META_TABLE = 'snapshot_meta'
+
+# Rows copied per batch when copying rows
+BATCH_SIZE = 5000
+
+# Pages copied per step of the backup API, -1 copies everything in one step
+BACKUP_PAGES = -1
+
+class SnapshotError(Exception):
+    """Raised when a snapshot cannot be taken or loaded."""
+
+def dump_snapshot(path, rows = False):
+    """Writes a snapshot of the database to the file, copying rows instead of pages if asked to or not on SQLite."""
+    if os.path.exists(path):
+        os.remove(path)
+    kind = ROWS if rows or connection.vendor != 'sqlite' else BACKUP
+    snapshot = sqlite3.connect(path)
+    try:
+        if kind == BACKUP:
+            connection.ensure_connection()
+            connection.connection.backup(snapshot, pages = BACKUP_PAGES)
+        else:
+            _copy_rows_out(snapshot)
+        snapshot.execute(f"CREATE TABLE {META_TABLE} (key TEXT PRIMARY KEY, value TEXT)")
+        snapshot.executemany(f"INSERT INTO {META_TABLE} VALUES (?, ?)", [
+            ('kind', kind),
+            ('migrations', json.dumps(applied_migrations())),
+        ])
+        snapshot.commit()
+    finally:
+        snapshot.close()
+    return kind
+
+def load_snapshot(path):
+    """Replaces the data of the database with the snapshot in the file."""
+    if not os.path.exists(path):
+        raise SnapshotError(f"There is no snapshot at {path}")
+    snapshot = sqlite3.connect(path)
+    try:
+        try:
+            meta = dict(snapshot.execute(f"SELECT key, value FROM {META_TABLE}"))
+        except sqlite3.DatabaseError:
+            raise SnapshotError(f"{path} is not a snapshot")
+        if json.loads(meta['migrations']) != applied_migrations():
+            raise SnapshotError("The snapshot was taken with other migrations applied, migrate the database to match it")
+        if meta['kind'] == BACKUP and connection.vendor == 'sqlite':
+            _copy_pages_in(snapshot)
+        else:
+            _copy_rows_in(snapshot)
+    finally:
+        snapshot.close()
+    return meta['kind']
+
+def applied_migrations():
+    """Returns the applied migrations of every app as sorted 'app.name' strings."""
+    return sorted(f'{app}.{name}' for app, name in MigrationRecorder(connection).applied_migrations())
+
+def snapshot_models():
+    """Returns the models whose rows are copied, the clubs models with their many to many tables."""
+    return list(apps.get_app_config('clubs').get_models(include_auto_created = True))
+
+def _copy_pages_in(snapshot):
+    """Copies every page of the snapshot over the SQLite database."""
+    if connection.in_atomic_block:
+        raise SnapshotError("A backup snapshot cannot be loaded inside a transaction")
+    connection.ensure_connection()
+    snapshot.backup(connection.connection, pages = BACKUP_PAGES)
+    with connection.cursor() as cursor:
+        cursor.execute(f"DROP TABLE {META_TABLE}")
+
+def _copy_rows_out(snapshot):
+    """Copies the rows of every clubs table into a table of the same name in the snapshot."""
+    with connection.cursor() as cursor:
+        for model in snapshot_models():
+            table, columns = _table_and_columns(model)
+            snapshot.execute(f'CREATE TABLE "{table}" ({_snapshot_quoted(columns)})')
+            insert = f'INSERT INTO "{table}" VALUES ({", ".join("?" for column in columns)})'
+            cursor.execute(f"SELECT {_quoted(columns)} FROM {connection.ops.quote_name(table)}")
+            for batch in iter(lambda: cursor.fetchmany(BATCH_SIZE), []):
+                snapshot.executemany(insert, batch)
+
+def _copy_rows_in(snapshot):
+    """Replaces the rows of every clubs table with those of the snapshot, in one transaction.
+
+    Foreign keys are checked when the transaction commits, so tables can be
+    emptied and filled in any order.
+    """
+    models = snapshot_models()
+    with transaction.atomic(), connection.cursor() as cursor:
+        for model in reversed(models):
+            cursor.execute(f"DELETE FROM {connection.ops.quote_name(model._meta.db_table)}")
+        for model in models:
+            table, columns = _table_and_columns(model)
+            insert = (f"INSERT INTO {connection.ops.quote_name(table)} ({_quoted(columns)}) "
+                f"VALUES ({', '.join('%s' for column in columns)})")
+            rows = snapshot.execute(f'SELECT {_snapshot_quoted(columns)} FROM "{table}"')
+            for batch in iter(lambda: rows.fetchmany(BATCH_SIZE), []):
+                cursor.executemany(insert, batch)
+        for statement in connection.ops.sequence_reset_sql(no_style(), models):
+            cursor.execute(statement)
+    rebuild_search_index()
+
+def _table_and_columns(model):
+    """Returns the table of a model and its columns."""
+    return model._meta.db_table, [field.column for field in model._meta.concrete_fields]
+
+def _quoted(columns):
+    """Returns the columns quoted for the database, separated by commas."""
+    return ', '.join(connection.ops.quote_name(column) for column in columns)
+
+def _snapshot_quoted(columns):
+    """Returns the columns quoted for the snapshot, separated by commas."""
+    return ', '.join(f'"{column}"' for column in columns)
@@ -0,0 +1,27 @@
+"""Template tags for the static assets of the pages."""
+
+from functools import lru_cache
+from django import template
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.utils.safestring import mark_safe
+
+register = template.Library()
+
+@register.simple_tag
+def inline_static(path):
+    """Returns the content of a static file to inline in the page, such as the critical styles."""
+    if settings.DEBUG:
+        return mark_safe(_read_static(path))
+    return mark_safe(_cached_static(path))
+
+def _read_static(path):
+    """Reads a static file, without anything that could close the tag it is inlined in."""
+    found = finders.find(path)
+    if found is None:
+        raise ValueError(f"The static file {path} does not exist")
+    with open(found, encoding='utf-8') as static_file:
+        return static_file.read().replace('</', '<\\/')
+
+# Static files only change with a deployment, they are read once per process
+_cached_static = lru_cache(maxsize=None)(_read_static)
@@ -0,0 +1,91 @@
+"""Tests of the archival of old matches and applications."""
+
+import datetime
+import io
+import pytz
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from clubs.archive import archive_matches, archive_applications
+from clubs.models import (User, Club, Membership, Application, Match, Tournament, ArchivedMatch,
+    ArchivedApplication, PlayerArchiveStats, ClubArchiveStats, head_to_head, rebuild_head_to_heads, archived_results)
+
+
+class ArchiveTestCase(TestCase):
+    """Unit tests of the archival of old matches and applications."""
+
+    fixtures = [
+        'clubs/tests/fixtures/default_user.json',
+        'clubs/tests/fixtures/other_users.json',
+        'clubs/tests/fixtures/default_club.json',
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.club = Club.objects.get(name='PolecatChess')
+        cls.john = User.objects.get(username='johndoe')
+        cls.jane = User.objects.get(username='janedoe')
+        Membership.objects.create(user=cls.john, club=cls.club, role=Membership.OWNER)
+        Membership.objects.create(user=cls.jane, club=cls.club)
+        cls.long_ago = pytz.UTC.localize(datetime.datetime(2019, 3, 1, 18, 0))
+
+    def test_old_finished_matches_are_moved_with_their_stats(self):
+        self._match(Match.PLAYER1)
+        self._match(Match.DRAW, days=1)
+        self._match(Match.CANCELLED, days=2)
+        self.assertEqual(archive_matches(days=365, batch_size=2), 3)
+        self.assertEqual(Match.objects.count(), 0)
+        self.assertEqual(ArchivedMatch.objects.count(), 3)
+        john = PlayerArchiveStats.objects.get(club=self.club, user=self.john)
+        self.assertEqual((john.games, john.wins, john.losses, john.draws), (3, 1, 0, 1))
+        self.assertEqual(archived_results(self.jane)['losses'], 1)
+        club = ClubArchiveStats.objects.get(club=self.club)
+        self.assertEqual((club.matches, club.draws, club.cancelled), (3, 1, 1))
+
+    def test_pending_recent_and_tournament_matches_stay(self):
+        self._match(Match.PENDING)
+        Match.objects.create(player_1=self.john, player_2=self.jane, club=self.club, location='Strand',
+            date_time=timezone.now() - datetime.timedelta(days=2), status=Match.PLAYER2)
+        tournament = Tournament.objects.create(club=self.club, name='Spring', location='Strand', rounds=1)
+        match = self._match(Match.PLAYER1, days=1)
+        match.tournament = tournament
+        match.save()
+        self.assertEqual(archive_matches(days=365), 0)
+        self.assertEqual(Match.objects.count(), 3)
+
+    def test_stats_add_up_over_several_runs(self):
+        self._match(Match.PLAYER1)
+        archive_matches(days=365)
+        self._match(Match.PLAYER2, days=1)
+        archive_matches(days=365)
+        john = PlayerArchiveStats.objects.get(club=self.club, user=self.john)
+        self.assertEqual((john.games, john.wins, john.losses), (2, 1, 1))
+
+    def test_head_to_head_keeps_archived_matches(self):
+        self._match(Match.PLAYER1)
+        archive_matches(days=365)
+        Match.objects.create(player_1=self.jane, player_2=self.john, club=self.club, location='Strand',
+            date_time=timezone.now() - datetime.timedelta(days=1), status=Match.PLAYER1)
+        record = head_to_head(self.club.id, self.john.id, self.jane.id)
+        self.assertEqual((record.games, record.wins_for(self.john.id), record.losses_for(self.john.id)), (2, 1, 1))
+        rebuild_head_to_heads(self.club.id)
+        self.assertEqual(head_to_head(self.club.id, self.john.id, self.jane.id).games, 2)
+
+    def test_only_old_rejected_applications_are_moved(self):
+        rejected = Application.objects.create(user=self.jane, club=self.club, personal_statement='Hi', status=Application.REJECTED)
+        accepted = Application.objects.create(user=self.john, club=self.club, personal_statement='Hi', status=Application.ACCEPTED)
+        Application.objects.filter(id__in=[rejected.id, accepted.id]).update(created_at=self.long_ago)
+        Application.objects.create(user=self.jane, club=self.club, personal_statement='Again', status=Application.REJECTED)
+        self.assertEqual(archive_applications(days=90), 1)
+        self.assertEqual(list(ArchivedApplication.objects.values_list('user_id', 'status')), [(self.jane.id, Application.REJECTED)])
+        self.assertEqual(Application.objects.count(), 2)
+        self.assertEqual(ClubArchiveStats.objects.get(club=self.club).rejected_applications, 1)
+
+    def test_archive_history_command(self):
+        self._match(Match.DRAW)
+        call_command('archive_history', '--match-days', '30', stdout=io.StringIO())
+        self.assertEqual(ArchivedMatch.objects.count(), 1)
+
+    def _match(self, status, days=0):
+        return Match.objects.create(player_1=self.john, player_2=self.jane, club=self.club, location='Strand',
+            date_time=self.long_ago + datetime.timedelta(days=days), status=status)
@@ -0,0 +1,171 @@
+"""Tests of the deletion of clubs and closure of accounts in the background."""
+
+import datetime
+import io
+from unittest.mock import patch
+from django.core import mail
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from clubs.deletion import CLAIM_TIMEOUT, close_account, delete_club, purge_club, purge_user, run_deletion_jobs
+from clubs.models import (User, Club, Membership, Application, Match, MatchEvent, Tournament, TournamentEntry,
+    DeletionJob, HeadToHead, rebuild_head_to_heads)
+
+
+class DeletionTestCase(TestCase):
+    """Unit tests of the deletion of clubs and closure of accounts in the background."""
+
+    fixtures = [
+        'clubs/tests/fixtures/default_user.json',
+        'clubs/tests/fixtures/other_users.json',
+        'clubs/tests/fixtures/default_club.json',
+        'clubs/tests/fixtures/other_clubs.json',
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.club = Club.objects.get(name='PolecatChess')
+        cls.other_club = Club.objects.get(name='PolecatChess_2')
+        cls.john = User.objects.get(username='johndoe')
+        cls.jane = User.objects.get(username='janedoe')
+        Membership.objects.create(user=cls.john, club=cls.club, role=Membership.OWNER)
+        Membership.objects.create(user=cls.jane, club=cls.club)
+        Membership.objects.create(user=cls.john, club=cls.other_club)
+        Application.objects.create(user=cls.jane, club=cls.club, personal_statement='Hi!', status=Application.ACCEPTED)
+        tournament = Tournament.objects.create(club=cls.club, name='Spring', location='Strand', rounds=1)
+        TournamentEntry.objects.create(tournament=tournament, user=cls.jane)
+        for days in range(5):
+            match = Match.objects.create(player_1=cls.john, player_2=cls.jane, club=cls.club, location='Strand',
+                date_time=timezone.now() + datetime.timedelta(days=days + 1))
+            MatchEvent.publish(match, MatchEvent.CREATED)
+
+    def test_deleted_club_is_hidden_at_once(self):
+        job = delete_club(self.club)
+        self.assertFalse(Club.objects.filter(id=self.club.id).exists())
+        self.assertTrue(Club.all_objects.filter(id=self.club.id).exists())
+        self.assertEqual(Match.objects.filter(club=self.club).count(), 5)
+        self.assertEqual((job.kind, job.target_id), (DeletionJob.CLUB, self.club.id))
+        self.assertFalse(job.is_finished())
+        self.assertEqual(len(mail.outbox), 0)
+
+    def test_purge_deletes_every_row_of_the_club_in_batches(self):
+        job = delete_club(self.club)
+        purge_club(job, batch_size=2)
+        job.refresh_from_db()
+        self.assertTrue(job.is_finished())
+        self.assertFalse(Club.all_objects.filter(id=self.club.id).exists())
+        self.assertFalse(Match.objects.filter(club_id=self.club.id).exists())
+        self.assertFalse(Membership.objects.filter(club_id=self.club.id).exists())
+        self.assertFalse(Application.objects.filter(club_id=self.club.id).exists())
+        self.assertEqual(job.stage, 'memberships')
+        self.assertEqual(job.deleted_rows, 5 + 5 + 1 + 1 + 1 + 2)
+        self.assertTrue(Membership.objects.filter(club=self.other_club).exists())
+
+    def test_purge_emails_the_members_once(self):
+        job = delete_club(self.club)
+        purge_club(job)
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(sorted(mail.outbox[0].bcc), sorted([self.john.email, self.jane.email]))
+        self.assertIn(self.club.name, mail.outbox[0].body)
+
+    def test_stopped_purge_resumes_where_it_was(self):
+        job = delete_club(self.club)
+        with patch('clubs.deletion._club_rows', side_effect=self._rows_failing_after('matches')):
+            with self.assertRaises(RuntimeError):
+                purge_club(job, batch_size=2)
+        job.refresh_from_db()
+        self.assertEqual(job.stage, 'matches')
+        self.assertTrue(job.notified)
+        self.assertFalse(Match.objects.filter(club_id=self.club.id).exists())
+        run_deletion_jobs()
+        job.refresh_from_db()
+        self.assertTrue(job.is_finished())
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertFalse(Club.all_objects.filter(id=self.club.id).exists())
+
+    def test_purge_deleted_command_runs_the_queued_jobs(self):
+        delete_club(self.club)
+        out = io.StringIO()
+        call_command('purge_deleted', stdout=out)
+        self.assertIn('Finished 1 deletion jobs', out.getvalue())
+        self.assertFalse(Club.all_objects.filter(id=self.club.id).exists())
+        self.assertEqual(run_deletion_jobs(), 0)
+
+    def test_job_claimed_by_another_run_is_skipped(self):
+        job = delete_club(self.club)
+        DeletionJob.objects.filter(id=job.id).update(claimed_at=timezone.now())
+        self.assertEqual(run_deletion_jobs(), 0)
+        job.refresh_from_db()
+        self.assertFalse(job.is_finished())
+        self.assertTrue(Club.all_objects.filter(id=self.club.id).exists())
+
+    def test_expired_claim_is_taken_over(self):
+        job = delete_club(self.club)
+        DeletionJob.objects.filter(id=job.id).update(
+            claimed_at=timezone.now() - CLAIM_TIMEOUT - datetime.timedelta(minutes=1))
+        self.assertEqual(run_deletion_jobs(), 1)
+        job.refresh_from_db()
+        self.assertTrue(job.is_finished())
+
+    def test_stopped_run_releases_its_claim(self):
+        job = delete_club(self.club)
+        with patch('clubs.deletion._club_rows', side_effect=self._rows_failing_after('matches')):
+            with self.assertRaises(RuntimeError):
+                run_deletion_jobs(batch_size=2)
+        job.refresh_from_db()
+        self.assertIsNone(job.claimed_at)
+        self.assertEqual(run_deletion_jobs(), 1)
+
+    def test_name_of_a_deleted_club_stays_taken_until_purged(self):
+        delete_club(self.club)
+        self.assertTrue(Club._default_manager.filter(name=self.club.name).exists())
+
+    def test_closed_account_is_deactivated_at_once(self):
+        job = close_account(self.jane)
+        self.jane.refresh_from_db()
+        self.assertFalse(self.jane.is_active)
+        self.assertEqual(self.jane.username, 'janedoe')
+        self.assertEqual((job.kind, job.target_id), (DeletionJob.USER, self.jane.id))
+
+    def test_purge_keeps_the_matches_of_a_closed_account_with_a_tombstone_player(self):
+        Match.objects.filter(club=self.club).update(status=Match.PLAYER1)
+        rebuild_head_to_heads(self.club.id)
+        job = close_account(self.jane)
+        purge_user(job, batch_size=1)
+        job.refresh_from_db()
+        self.assertTrue(job.is_finished())
+        self.assertFalse(Application.objects.filter(user_id=self.jane.id).exists())
+        self.assertFalse(Membership.objects.filter(user_id=self.jane.id).exists())
+        self.assertEqual(Match.objects.filter(player_2_id=self.jane.id).count(), 5)
+        self.assertEqual(HeadToHead.objects.get(club=self.club).games, 5)
+        tombstone = User.objects.get(id=self.jane.id)
+        self.assertEqual(tombstone.username, f'deleted_{self.jane.id}')
+        self.assertEqual(tombstone.full_name(), 'Deleted player')
+        self.assertNotEqual(tombstone.email, self.jane.email)
+        self.assertFalse(tombstone.has_usable_password())
+
+    def test_purge_deleted_command_runs_both_kinds_of_jobs(self):
+        close_account(self.jane)
+        delete_club(self.other_club)
+        self.assertEqual(run_deletion_jobs(), 2)
+        self.assertFalse(Club.all_objects.filter(id=self.other_club.id).exists())
+        self.assertNotEqual(User.objects.get(id=self.jane.id).email, self.jane.email)
+
+    def _rows_failing_after(self, failing_after):
+        """Returns a replacement for _club_rows whose stage after the given one fails."""
+        from clubs.deletion import _club_rows as club_rows
+
+        def rows(club_id):
+            stages = club_rows(club_id)
+            names = [stage for stage, queryset in stages]
+            failing = names.index(failing_after) + 1
+            stages[failing] = (names[failing], _FailingRows())
+            return stages
+        return rows
+
+
+class _FailingRows:
+    """Rows whose purge fails, like a worker stopped partway."""
+
+    def order_by(self, *args):
+        raise RuntimeError
@@ -10,8 +10,9 @@ class CreateClubFormTestCase(TestCase):
 
     fixtures = ['clubs/tests/fixtures/default_club.json']
 
-    def setUp(self):
-        self.form_input = {
+    @classmethod
+    def setUpTestData(cls):
+        cls.form_input = {
             'name': 'PolecatChess2',
             'location': 'London',
             'description': 'Welcome to Polecat chess club!'
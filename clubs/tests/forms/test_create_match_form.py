@@ -16,26 +16,27 @@ class CreateMatchTestCase(TestCase):
         'clubs/tests/fixtures/default_club.json',
     ]
 
-    def setUp(self):
-        self.utc = pytz.UTC
-        self.user1 = User.objects.get(username='johndoe')
-        self.user2 = User.objects.get(username='petrapickles')
-        self.user3 = User.objects.get(username='janedoe')
-        self.club = Club.objects.get(name='PolecatChess')
-        self.match_time = self.utc.localize(
+    @classmethod
+    def setUpTestData(cls):
+        cls.utc = pytz.UTC
+        cls.user1 = User.objects.get(username='johndoe')
+        cls.user2 = User.objects.get(username='petrapickles')
+        cls.user3 = User.objects.get(username='janedoe')
+        cls.club = Club.objects.get(name='PolecatChess')
+        cls.match_time = cls.utc.localize(
             datetime.datetime(2022, 9, 25, 10, 30))
-        self.match_location = 'Bush House'
-        self.usr1application = self._create_application(self.user1)
-        self.usr2application = self._create_application(self.user2)
-        self.usr3application = self._create_application(self.user3)
-        self.membership1 = self._create_membership(self.user1)
-        self.membership2 = self._create_membership(self.user2)
-        self.membership3 = self._create_membership(self.user3)
-        self.form_input = {
-            'player_1': self.user1,
-            'player_2': self.user2,
-            'location': self.match_location,
-            'date_time': self.match_time
+        cls.match_location = 'Bush House'
+        cls.usr1application = cls._create_application(cls.user1)
+        cls.usr2application = cls._create_application(cls.user2)
+        cls.usr3application = cls._create_application(cls.user3)
+        cls.membership1 = cls._create_membership(cls.user1)
+        cls.membership2 = cls._create_membership(cls.user2)
+        cls.membership3 = cls._create_membership(cls.user3)
+        cls.form_input = {
+            'player_1': cls.user1,
+            'player_2': cls.user2,
+            'location': cls.match_location,
+            'date_time': cls.match_time
         }
 
     def test_form_has_necessary_fields(self):
@@ -100,6 +101,36 @@ class CreateMatchTestCase(TestCase):
         form = CreateMatchForm(club=self.club, data=self.form_input)
         self.assertFalse(form.is_valid())
 
+    def test_form_rejects_player_who_is_not_a_member(self):
+        self.form_input['date_time'] = self._future_date_time()
+        self.form_input['player_2'] = User.objects.get(username='peterpickles').id
+        form = CreateMatchForm(club=self.club, data=self.form_input)
+        self.assertFalse(form.is_valid())
+        self.assertIn('player_2', form.errors)
+
+    def test_form_rejects_player_id_that_is_not_a_number(self):
+        self.form_input['player_2'] = 'abc'
+        form = CreateMatchForm(club=self.club, data=self.form_input)
+        self.assertFalse(form.is_valid())
+        self.assertIn('player_2', form.errors)
+
+    def test_form_loads_both_players_with_one_query(self):
+        self.form_input['player_1'] = self.user1.id
+        self.form_input['player_2'] = self.user2.id
+        self.form_input['date_time'] = self._future_date_time()
+        form = CreateMatchForm(club=self.club, data=self.form_input)
+        with self.assertNumQueries(2):
+            self.assertTrue(form.is_valid())
+        self.assertEqual(form.cleaned_data['player_1'], self.user1)
+        self.assertEqual(form.cleaned_data['player_2'], self.user2)
+
+    def test_form_does_not_list_every_member(self):
+        form = CreateMatchForm(club=self.club, initial={'player_1': self.user1.id})
+        with self.assertNumQueries(1):
+            html = form['player_1'].as_widget() + form['player_2'].as_widget()
+        self.assertNotIn('<option', html)
+        self.assertIn('value="John Doe (johndoe)"', html)
+
     def test_match_must_save(self):
         form = CreateMatchForm(club=self.club, data=self.form_input)
         before_count = Match.objects.count()
@@ -107,14 +138,19 @@ class CreateMatchTestCase(TestCase):
         after_count = Match.objects.count()
         self.assertEqual(after_count, before_count + 1)
 
-    def _create_application(self, user):
+    def _future_date_time(self):
+        return self.utc.localize(datetime.datetime.now() + datetime.timedelta(days=7))
+
+    @classmethod
+    def _create_application(cls, user):
         return Application.objects.create(
             user=user,
-            club=self.club,
+            club=cls.club,
             personal_statement="personal statement",
             status=Application.ACCEPTED)
 
-    def _create_membership(self, user):
+    @classmethod
+    def _create_membership(cls, user):
         return Membership.objects.create(user=user,
-                                         club=self.club,
+                                         club=cls.club,
                                          role=Membership.MEMBER)
@@ -0,0 +1,79 @@
+"""Tests of the create tournament form."""
+
+from django.test import TestCase
+from clubs.forms import CreateTournamentForm
+from clubs.models import User, Club, Membership, Tournament
+
+
+class CreateTournamentFormTestCase(TestCase):
+    """Unit tests of the create tournament form."""
+
+    fixtures = [
+        'clubs/tests/fixtures/default_user.json',
+        'clubs/tests/fixtures/other_users.json',
+        'clubs/tests/fixtures/default_club.json',
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.club = Club.objects.get(name='PolecatChess')
+        cls.user = User.objects.get(username='johndoe')
+        Membership.objects.create(user=cls.user, club=cls.club)
+        cls.form_input = {'name': 'Winter Open', 'location': 'Bush House', 'rounds': 5}
+
+    def test_form_has_necessary_fields(self):
+        form = CreateTournamentForm()
+        self.assertIn('name', form.fields)
+        self.assertIn('location', form.fields)
+        self.assertIn('rounds', form.fields)
+
+    def test_form_accepts_valid_input(self):
+        form = CreateTournamentForm(data=self.form_input)
+        self.assertTrue(form.is_valid())
+
+    def test_form_rejects_blank_name(self):
+        self.form_input['name'] = ''
+        form = CreateTournamentForm(data=self.form_input)
+        self.assertFalse(form.is_valid())
+
+    def test_form_rejects_zero_rounds(self):
+        self.form_input['rounds'] = 0
+        form = CreateTournamentForm(data=self.form_input)
+        self.assertFalse(form.is_valid())
+
+    def test_form_must_save_correctly(self):
+        form = CreateTournamentForm(data=self.form_input)
+        form.is_valid()
+        before_count = Tournament.objects.count()
+        tournament = form.save(self.club)
+        self.assertEqual(Tournament.objects.count(), before_count + 1)
+        self.assertEqual(tournament.club, self.club)
+        self.assertEqual(tournament.rounds, 5)
+        self.assertEqual(list(tournament.players.all()), [self.user])
+
+    def test_form_rejects_swiss_tournament_without_rounds(self):
+        self.form_input['rounds'] = ''
+        form = CreateTournamentForm(data=self.form_input)
+        self.assertFalse(form.is_valid())
+
+    def test_form_rejects_round_robin_without_start(self):
+        self.form_input['format'] = Tournament.ROUND_ROBIN
+        form = CreateTournamentForm(data=self.form_input)
+        self.assertFalse(form.is_valid())
+
+    def test_form_rejects_start_in_the_past(self):
+        self.form_input['format'] = Tournament.KNOCKOUT
+        self.form_input['starts_at'] = '2020-01-01 10:00'
+        form = CreateTournamentForm(data=self.form_input)
+        self.assertFalse(form.is_valid())
+
+    def test_form_schedules_round_robin(self):
+        other_user = User.objects.get(username='janedoe')
+        Membership.objects.create(user=other_user, club=self.club)
+        self.form_input.update({'format': Tournament.ROUND_ROBIN, 'rounds': '', 'starts_at': '2030-01-01 10:00'})
+        form = CreateTournamentForm(data=self.form_input)
+        self.assertTrue(form.is_valid())
+        tournament = form.save(self.club)
+        self.assertEqual(tournament.rounds, 1)
+        self.assertEqual(tournament.days_between_rounds, 7)
+        self.assertEqual(tournament.match_set.count(), 1)
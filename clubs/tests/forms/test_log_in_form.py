@@ -10,8 +10,9 @@ class LogInTestCase(TestCase):
     """Unit test of the log in form."""
     fixtures = ['clubs/tests/fixtures/default_user.json']
 
-    def setUp(self):
-        self.form_input = {
+    @classmethod
+    def setUpTestData(cls):
+        cls.form_input = {
             'email': 'janedoe@example.org',
             'password': 'Password123'
         }
@@ -1,5 +1,6 @@
 """Tests of the new application form."""
 
+from unittest.mock import patch
 from django.test import TestCase
 from clubs.models import User, Club
 from clubs.models import Application
@@ -37,4 +38,20 @@ class ApplicationFormTestCase(TestCase):
         after_count = Application.objects.count()
         self.assertEqual(after_count, before_count + 1)
         application = Application.objects.get(user=self.user)
-        self.assertEqual(application.personal_statement, 'Hi!')
\ No newline at end of file
+        self.assertEqual(application.personal_statement, 'Hi!')
+
+    def test_second_open_application_is_not_saved(self):
+        Application.objects.create(user=self.user, club=self.club, personal_statement='Hi!')
+        form = ApplicationForm(data={'personal_statement': 'Hi again!', 'club': self.club})
+        self.assertTrue(form.is_valid())
+        with self.assertNumQueries(1):
+            self.assertIsNone(form.save(self.user))
+        self.assertEqual(Application.objects.filter(user=self.user).count(), 1)
+
+    def test_concurrent_open_application_is_not_saved(self):
+        Application.objects.create(user=self.user, club=self.club, personal_statement='Hi!')
+        form = ApplicationForm(data={'personal_statement': 'Hi again!', 'club': self.club})
+        self.assertTrue(form.is_valid())
+        with patch('clubs.forms.application_forms.has_open_application', return_value=False):
+            self.assertIsNone(form.save(self.user))
+        self.assertEqual(Application.objects.filter(user=self.user).count(), 1)
@@ -10,9 +10,10 @@ class PasswordFormTestCase(TestCase):
 
     fixtures = ['clubs/tests/fixtures/default_user.json']
 
-    def setUp(self):
-        self.user = User.objects.get(username='johndoe')
-        self.form_input = {
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.get(username='johndoe')
+        cls.form_input = {
             'password': 'Password123',
             'new_password': 'NewPassword123',
             'password_confirmation': 'NewPassword123',
@@ -9,8 +9,9 @@ from clubs.models import User
 
 class SignUpFormTestCase(TestCase):
     """Unit tests of the sign up form."""
-    def setUp(self):
-        self.form_input = {
+    @classmethod
+    def setUpTestData(cls):
+        cls.form_input = {
             'first_name': 'Jane',
             'last_name': 'Doe',
             'username': 'janedoe',
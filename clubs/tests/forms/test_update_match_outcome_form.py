@@ -16,27 +16,28 @@ class CreateMatchTestCase(TestCase):
         'clubs/tests/fixtures/default_club.json',
     ]
 
-    def setUp(self):
-        self.utc = pytz.UTC
-        self.club = Club.objects.get(name='PolecatChess')
-        self.player1 = User.objects.get(username='johndoe')
-        self.player2 = User.objects.get(username='janedoe')
-        self.player1application = self._create_application(self.player1)
-        self.player2application = self._create_application(self.player2)
-        self.membership1 = self._create_membership(self.player1,
+    @classmethod
+    def setUpTestData(cls):
+        cls.utc = pytz.UTC
+        cls.club = Club.objects.get(name='PolecatChess')
+        cls.player1 = User.objects.get(username='johndoe')
+        cls.player2 = User.objects.get(username='janedoe')
+        cls.player1application = cls._create_application(cls.player1)
+        cls.player2application = cls._create_application(cls.player2)
+        cls.membership1 = cls._create_membership(cls.player1,
                                                    Membership.OFFICER)
-        self.membership2 = self._create_membership(self.player2,
+        cls.membership2 = cls._create_membership(cls.player2,
                                                    Membership.MEMBER)
-        self.match = Match.objects.create(
-            player_1=self.player1,
-            player_2=self.player2,
-            club=self.club,
+        cls.match = Match.objects.create(
+            player_1=cls.player1,
+            player_2=cls.player2,
+            club=cls.club,
             location='Bush House',
-            date_time=self.utc.localize(datetime.datetime(2022, 9, 25, 10,
+            date_time=cls.utc.localize(datetime.datetime(2022, 9, 25, 10,
                                                           30)),
             status=Match.PENDING,
             id=1)
-        self.form_input = {'status': Match.DRAW}
+        cls.form_input = {'status': Match.DRAW}
 
     def test_form_has_necessary_fields(self):
         form = UpdateMatchOutcomeForm()
@@ -69,12 +70,14 @@ class CreateMatchTestCase(TestCase):
         self.match.refresh_from_db()
         self.assertEqual(self.match.status, Match.DRAW)
 
-    def _create_application(self, user):
+    @classmethod
+    def _create_application(cls, user):
         return Application.objects.create(
             user=user,
-            club=self.club,
+            club=cls.club,
             personal_statement="personal statement",
             status=Application.ACCEPTED)
 
-    def _create_membership(self, user, role):
-        return Membership.objects.create(user=user, club=self.club, role=role)
+    @classmethod
+    def _create_membership(cls, user, role):
+        return Membership.objects.create(user=user, club=cls.club, role=role)
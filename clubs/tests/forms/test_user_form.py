@@ -11,8 +11,9 @@ class UserFormTestCase(TestCase):
 
     fixtures = ['clubs/tests/fixtures/default_user.json']
 
-    def setUp(self):
-        self.form_input = {
+    @classmethod
+    def setUpTestData(cls):
+        cls.form_input = {
             'first_name': 'Jane',
             'last_name': 'Doe',
             'username': 'janedoe',
@@ -0,0 +1,47 @@
+"""Tests of the offline geocoder and the grid of cells."""
+
+from django.test import SimpleTestCase
+from clubs.geo import (geocode, grid_cell, square_cell_ranges, covered_radius_km, distance_km,
+    GRID_COLUMNS, GRID_ROWS)
+
+
+class GeoTestCase(SimpleTestCase):
+    """Unit tests of the offline geocoder and the grid of cells."""
+
+    def test_geocode_known_place(self):
+        self.assertEqual(geocode('Strand'), (51.5115, -0.1190))
+
+    def test_geocode_ignores_case_and_punctuation(self):
+        self.assertEqual(geocode('  central   LONDON!'), geocode('Central London'))
+
+    def test_geocode_finds_the_most_specific_place_in_the_text(self):
+        self.assertEqual(geocode('Chess cafe, London Bridge, London'), geocode('London Bridge'))
+
+    def test_geocode_unknown_place(self):
+        self.assertIsNone(geocode('Atlantis'))
+        self.assertIsNone(geocode(''))
+
+    def test_distance_between_places(self):
+        london, paris = geocode('London'), geocode('Paris')
+        self.assertAlmostEqual(distance_km(*london, *paris), 344, delta=2)
+        self.assertEqual(distance_km(*london, *london), 0)
+
+    def test_square_contains_the_cells_around_the_point(self):
+        cells = {cell for first, last in square_cell_ranges(51.5, -0.1, 1) for cell in range(first, last + 1)}
+        self.assertEqual(len(cells), 9)
+        self.assertIn(grid_cell(51.5, -0.1), cells)
+
+    def test_square_wraps_around_the_antimeridian(self):
+        cells = {cell for first, last in square_cell_ranges(0, 179.99, 1) for cell in range(first, last + 1)}
+        self.assertEqual(len(cells), 9)
+        self.assertIn(grid_cell(0, -179.99), cells)
+
+    def test_square_stops_at_the_poles(self):
+        ranges = square_cell_ranges(89.99, 0, 2)
+        self.assertEqual(len(ranges), 3)
+        self.assertTrue(all(last < GRID_ROWS * GRID_COLUMNS for first, last in ranges))
+
+    def test_covered_radius_grows_with_the_square(self):
+        self.assertEqual(covered_radius_km(51.5, 0), 0)
+        self.assertLess(covered_radius_km(51.5, 1), covered_radius_km(51.5, 2))
+        self.assertLess(covered_radius_km(70, 2), covered_radius_km(10, 2))
@@ -0,0 +1,182 @@
+"""Tests of the CSV imports of members and matches."""
+
+import io
+from unittest import mock
+from django.test import TestCase
+from clubs import imports
+from clubs.imports import ImportFileError, import_members, import_matches
+from clubs.models import User, Club, Membership, Application, Match, head_to_head
+
+
+class ImportMembersTestCase(TestCase):
+    """Unit tests of the import of members."""
+
+    fixtures = [
+        'clubs/tests/fixtures/default_user.json',
+        'clubs/tests/fixtures/other_users.json',
+        'clubs/tests/fixtures/default_club.json',
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.club = Club.objects.get(name='PolecatChess')
+        cls.member = User.objects.get(username='johndoe')
+        Membership.objects.create(user=cls.member, club=cls.club, role=Membership.OWNER)
+
+    def test_import_creates_users_applications_and_memberships(self):
+        result = import_members(self.club, self._file(
+            'username,first_name,last_name,email,experience_level,role',
+            'magnus,Magnus,Carlsen,magnus@example.org,Advanced,Officer',
+            'judit,Judit,Polgar,Judit@Example.org,,',
+        ))
+        self.assertTrue(result.is_valid())
+        self.assertEqual(result.created, 2)
+        magnus = User.objects.get(username='magnus')
+        self.assertEqual(magnus.experience_level, User.ADVANCED)
+        self.assertFalse(magnus.has_usable_password())
+        self.assertEqual(User.objects.get(username='judit').email, 'Judit@example.org')
+        self.assertEqual(Membership.objects.get(user=magnus, club=self.club).role, Membership.OFFICER)
+        self.assertTrue(Application.objects.filter(user=magnus, club=self.club, status=Application.ACCEPTED).exists())
+
+    def test_import_reuses_existing_users_and_skips_members(self):
+        jane = User.objects.get(username='janedoe')
+        Application.objects.create(user=jane, club=self.club, personal_statement='Hello')
+        result = import_members(self.club, self._file(
+            'username,first_name,last_name,email',
+            'janedoe,Jane,Doe,janedoe@example.org',
+            'johndoe,John,Doe,johndoe@example.org',
+        ))
+        self.assertEqual((result.created, result.skipped), (1, 1))
+        self.assertEqual(User.objects.filter(username='janedoe').count(), 1)
+        self.assertEqual(Application.objects.get(user=jane, club=self.club).status, Application.ACCEPTED)
+        self.assertTrue(jane.check_password('Password123'))
+
+    def test_existing_users_who_did_not_apply_get_a_pending_application(self):
+        petra = User.objects.get(username='petrapickles')
+        result = import_members(self.club, self._file(
+            'username,first_name,last_name,email',
+            'petrapickles,Petra,Pickles,petrapickles@example.org',
+        ))
+        self.assertEqual((result.created, result.invited), (0, 1))
+        self.assertFalse(Membership.objects.filter(user=petra, club=self.club).exists())
+        self.assertEqual(Application.objects.get(user=petra, club=self.club).status, Application.PENDING)
+
+    def test_existing_users_are_matched_ignoring_case(self):
+        jane = User.objects.get(username='janedoe')
+        jane.username = 'JaneDoe'
+        jane.email = 'Jane.Doe@example.org'
+        jane.save()
+        Application.objects.create(user=jane, club=self.club, personal_statement='Hello')
+        result = import_members(self.club, self._file(
+            'username,first_name,last_name,email',
+            'janedoe,Jane,Doe,jane.doe@example.org',
+        ))
+        self.assertTrue(result.is_valid())
+        self.assertEqual(result.created, 1)
+        self.assertFalse(User.objects.filter(email='jane.doe@example.org').exists())
+        self.assertTrue(Membership.objects.filter(user=jane, club=self.club).exists())
+
+    def test_invalid_rows_are_reported_and_nothing_is_imported(self):
+        result = import_members(self.club, self._file(
+            'username,first_name,last_name,email,role',
+            'ok_user,Ok,User,ok@example.org,',
+            'x,Too,Short,short@example.org,',
+            'no_email,No,Email,not-an-email,',
+            'ok_user,Ok,Again,again@example.org,',
+            'boss,The,Boss,boss@example.org,Owner',
+            'janedoe,Not,Jane,someone@example.org,',
+        ))
+        self.assertFalse(result.is_valid())
+        self.assertEqual([line for line, message in result.errors], [3, 4, 5, 6, 7])
+        self.assertFalse(User.objects.filter(username='ok_user').exists())
+
+    def test_dry_run_does_not_import(self):
+        result = import_members(self.club, self._file(
+            'username,first_name,last_name,email',
+            'magnus,Magnus,Carlsen,magnus@example.org',
+        ), dry_run=True)
+        self.assertTrue(result.is_valid())
+        self.assertFalse(User.objects.filter(username='magnus').exists())
+
+    def test_missing_columns_raise(self):
+        with self.assertRaises(ImportFileError):
+            import_members(self.club, self._file('username,email', 'magnus,magnus@example.org'))
+
+    def test_rows_are_written_in_chunks(self):
+        rows = [f'player{number},Player,{number},player{number}@example.org' for number in range(5)]
+        with mock.patch.object(imports, 'CHUNK_SIZE', 2):
+            result = import_members(self.club, self._file('username,first_name,last_name,email', *rows))
+        self.assertEqual(result.created, 5)
+        self.assertEqual(Membership.objects.filter(club=self.club).count(), 6)
+
+    def _file(self, *lines):
+        return io.StringIO('\n'.join(lines) + '\n')
+
+
+class ImportMatchesTestCase(TestCase):
+    """Unit tests of the import of matches."""
+
+    fixtures = [
+        'clubs/tests/fixtures/default_user.json',
+        'clubs/tests/fixtures/other_users.json',
+        'clubs/tests/fixtures/default_club.json',
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.club = Club.objects.get(name='PolecatChess')
+        cls.john = User.objects.get(username='johndoe')
+        cls.jane = User.objects.get(username='janedoe')
+        Membership.objects.create(user=cls.john, club=cls.club, role=Membership.OWNER)
+        Membership.objects.create(user=cls.jane, club=cls.club)
+
+    def test_import_creates_matches_and_head_to_heads(self):
+        result = import_matches(self.club, self._file(
+            'date_time,location,player_1,player_2,status',
+            '2020-01-10 18:00,,johndoe,janedoe,1-0',
+            '2020-01-17 18:00,Bush House,janedoe@example.org,johndoe,1/2-1/2',
+            '2020-01-24,,johndoe,janedoe,Pending',
+        ))
+        self.assertTrue(result.is_valid())
+        self.assertEqual(result.created, 3)
+        self.assertEqual(sorted(Match.objects.values_list('status', flat=True)),
+            sorted([Match.PLAYER1, Match.DRAW, Match.PENDING]))
+        self.assertEqual(Match.objects.filter(location=self.club.location).count(), 2)
+        record = head_to_head(self.club.id, self.john.id, self.jane.id)
+        self.assertEqual(record.games, 2)
+        self.assertEqual(record.wins_for(self.john.id), 1)
+
+    def test_players_are_matched_ignoring_case(self):
+        self.jane.username = 'JaneDoe'
+        self.jane.email = 'Jane.Doe@example.org'
+        self.jane.save()
+        result = import_matches(self.club, self._file(
+            'date_time,player_1,player_2,status',
+            '2020-01-10 18:00,johndoe,janedoe,1-0',
+            '2020-01-17 18:00,jane.doe@example.org,JOHNDOE,0-1',
+        ))
+        self.assertTrue(result.is_valid())
+        self.assertEqual(result.created, 2)
+
+    def test_import_skips_matches_already_in_the_club(self):
+        lines = ['date_time,player_1,player_2,status', '2020-01-10 18:00,johndoe,janedoe,1-0']
+        import_matches(self.club, self._file(*lines))
+        result = import_matches(self.club, self._file(*lines))
+        self.assertEqual((result.created, result.skipped), (0, 1))
+        self.assertEqual(Match.objects.count(), 1)
+
+    def test_invalid_rows_are_reported_and_nothing_is_imported(self):
+        result = import_matches(self.club, self._file(
+            'date_time,player_1,player_2,status',
+            '2020-01-10 18:00,johndoe,janedoe,1-0',
+            'yesterday,johndoe,janedoe,1-0',
+            '2020-01-10 18:00,johndoe,petrapickles,1-0',
+            '2020-01-11 18:00,johndoe,johndoe@example.org,1-0',
+            '2020-01-12 18:00,johndoe,janedoe,won',
+            '2020-01-10 18:00,johndoe,janedoe,1-0',
+        ))
+        self.assertEqual([line for line, message in result.errors], [3, 4, 5, 6, 7])
+        self.assertEqual(Match.objects.count(), 0)
+
+    def _file(self, *lines):
+        return io.StringIO('\n'.join(lines) + '\n')
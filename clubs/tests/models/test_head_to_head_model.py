@@ -0,0 +1,98 @@
+"""Tests of the head-to-head model."""
+
+from django.db.utils import IntegrityError
+from django.test import TestCase
+from clubs.models import (User, Club, Match, Membership, HeadToHead, head_to_head, have_played,
+    club_opponents, rebuild_head_to_heads)
+import datetime
+import pytz
+
+
+class HeadToHeadModelTestCase(TestCase):
+    """Unit tests of the head-to-head model."""
+
+    fixtures = [
+        'clubs/tests/fixtures/default_user.json',
+        'clubs/tests/fixtures/other_users.json',
+        'clubs/tests/fixtures/default_club.json',
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.utc = pytz.UTC
+        cls.club = Club.objects.get(name='PolecatChess')
+        cls.user = User.objects.get(username='johndoe')
+        cls.other_user = User.objects.get(username='janedoe')
+        cls.third_user = User.objects.get(username='petrapickles')
+        for user in (cls.user, cls.other_user, cls.third_user):
+            Membership.objects.create(user=user, club=cls.club)
+        cls.match = cls._create_match(cls.other_user, cls.user, datetime.datetime(2030, 9, 25, 10, 30))
+
+    def test_pending_match_has_no_record(self):
+        self.assertFalse(have_played(self.club.id, self.user.id, self.other_user.id))
+        self.assertEqual(head_to_head(self.club.id, self.user.id, self.other_user.id).games, 0)
+
+    def test_result_is_recorded(self):
+        self.match.status = Match.PLAYER1
+        self.match.save()
+        record = head_to_head(self.club.id, self.user.id, self.other_user.id)
+        self.assertEqual(record.games, 1)
+        self.assertEqual(record.wins_for(self.other_user.id), 1)
+        self.assertEqual(record.losses_for(self.user.id), 1)
+        self.assertEqual(record.last_played, self.match.date_time)
+        self.assertTrue(have_played(self.club.id, self.other_user.id, self.user.id))
+
+    def test_changed_result_replaces_the_old_one(self):
+        self.match.status = Match.PLAYER1
+        self.match.save()
+        match = Match.objects.get(id=self.match.id)
+        match.status = Match.DRAW
+        match.save()
+        record = head_to_head(self.club.id, self.other_user.id, self.user.id)
+        self.assertEqual(record.games, 1)
+        self.assertEqual(record.draws, 1)
+        self.assertEqual(record.wins_for(self.other_user.id), 0)
+
+    def test_cancelled_match_removes_the_record(self):
+        self.match.status = Match.PLAYER2
+        self.match.save()
+        self.match.status = Match.CANCELLED
+        self.match.save()
+        self.assertFalse(HeadToHead.objects.exists())
+
+    def test_players_are_stored_in_order(self):
+        self.match.status = Match.PLAYER2
+        self.match.save()
+        record = HeadToHead.objects.get()
+        self.assertLess(record.player_1_id, record.player_2_id)
+        self.assertEqual(record.wins_for(self.user.id), 1)
+
+    def test_pair_has_a_single_record(self):
+        self.match.status = Match.PLAYER2
+        self.match.save()
+        with self.assertRaises(IntegrityError):
+            HeadToHead.objects.create(club=self.club, player_1=self.user, player_2=self.other_user)
+
+    def test_club_opponents(self):
+        self.match.status = Match.DRAW
+        self.match.save()
+        match = self._create_match(self.user, self.third_user, datetime.datetime(2030, 9, 26, 10, 30))
+        match.status = Match.PLAYER1
+        match.save()
+        self.assertEqual(club_opponents(self.club.id)[self.user.id], {self.other_user.id, self.third_user.id})
+        self.assertEqual(club_opponents(self.club.id)[self.third_user.id], {self.user.id})
+
+    def test_rebuild_counts_results_changed_without_save(self):
+        Match.objects.filter(id=self.match.id).update(status=Match.PLAYER1)
+        self._create_match(self.user, self.other_user, datetime.datetime(2030, 9, 26, 10, 30))
+        Match.objects.filter(status=Match.PENDING).update(status=Match.PLAYER1)
+        rebuild_head_to_heads()
+        record = HeadToHead.objects.get()
+        self.assertEqual(record.games, 2)
+        self.assertEqual(record.wins_for(self.user.id), 1)
+        self.assertEqual(record.wins_for(self.other_user.id), 1)
+
+    @classmethod
+    def _create_match(cls, player_1, player_2, date_time):
+        return Match.objects.create(player_1=player_1, player_2=player_2, club=cls.club,
+            location='Bush House', date_time=cls.utc.localize(date_time))
@@ -0,0 +1,78 @@
+"""Tests of the match event model."""
+
+import io
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from clubs.models import User, Club, Match, Membership, MatchEvent
+from clubs.models import match_events_after, latest_match_event_id
+import datetime
+import pytz
+
+
+class MatchEventTestCase(TestCase):
+    """Unit tests of the match event model."""
+
+    fixtures = [
+        'clubs/tests/fixtures/default_user.json',
+        'clubs/tests/fixtures/other_users.json',
+        'clubs/tests/fixtures/default_club.json',
+        'clubs/tests/fixtures/other_clubs.json'
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.utc = pytz.UTC
+        cls.user1 = User.objects.get(username='johndoe')
+        cls.user2 = User.objects.get(username='petrapickles')
+        cls.club = Club.objects.get(name='PolecatChess')
+        cls.other_club = Club.objects.get(name='PolecatChess_2')
+        Membership.objects.create(user=cls.user1, club=cls.club)
+        Membership.objects.create(user=cls.user2, club=cls.club)
+        cls.match = Match.objects.create(
+            player_1=cls.user1,
+            player_2=cls.user2,
+            club=cls.club,
+            location="Bush House floor 6",
+            date_time=cls.utc.localize(datetime.datetime(2030, 9, 25, 14, 40)),
+        )
+        cls.event = MatchEvent.publish(cls.match, MatchEvent.CREATED)
+
+    def test_valid_match_event(self):
+        try:
+            self.event.full_clean()
+        except ValidationError:
+            self.fail("Test match event should be valid")
+
+    def test_publish_uses_the_club_of_the_match(self):
+        self.assertEqual(self.event.club, self.club)
+        self.assertEqual(self.event.match, self.match)
+
+    def test_kind_cannot_be_anything_but_a_kind_constant(self):
+        self.event.kind = 'x'
+        with self.assertRaises(ValidationError):
+            self.event.full_clean()
+
+    def test_delete_event_when_match_is_deleted(self):
+        self.match.delete()
+        self.assertFalse(MatchEvent.objects.filter(id=self.event.id).exists())
+
+    def test_events_after_returns_only_newer_events_of_the_club(self):
+        cancelled = MatchEvent.publish(self.match, MatchEvent.CANCELLED)
+        MatchEvent.objects.create(club=self.other_club, match=self.match, kind=MatchEvent.UPDATED)
+        events = list(match_events_after(self.club.id, self.event.id))
+        self.assertEqual(events, [cancelled])
+
+    def test_latest_event_id(self):
+        self.assertEqual(latest_match_event_id(self.club.id), self.event.id)
+        self.assertEqual(latest_match_event_id(self.other_club.id), 0)
+
+    def test_prune_deletes_only_events_older_than_the_retention(self):
+        old_events = [MatchEvent.publish(self.match, MatchEvent.UPDATED) for _ in range(3)]
+        MatchEvent.objects.filter(id__in=[event.id for event in old_events]).update(
+            created_at=timezone.now() - datetime.timedelta(hours=25))
+        output = io.StringIO()
+        call_command('prune_match_events', '--hours', '24', '--batch-size', '2', stdout=output)
+        self.assertEqual(list(MatchEvent.objects.all()), [self.event])
+        self.assertIn('Deleted 3 match events', output.getvalue())
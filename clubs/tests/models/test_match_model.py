@@ -2,9 +2,10 @@
 
 from django.core.exceptions import ValidationError
 from django.db.utils import IntegrityError
-from clubs.models import User, Club, Match, Membership
+from clubs.models import User, Club, Match, Membership, MatchEvent, HeadToHead, withdraw_from_club_matches
 from clubs.models import Application
 from django.test import TestCase
+from django.utils import timezone
 import datetime
 import pytz
 
@@ -144,6 +145,55 @@ class MatchTestCase(TestCase):
         count_after = Match.objects.count()
         self.assertEqual(count_after, count_before)
 
+    def test_for_display_annotates_overdue_matches(self):
+        Match.objects.filter(id=self.match.id).update(
+            date_time=self.utc.localize(datetime.datetime.now() + datetime.timedelta(days=1)))
+        upcoming = Match.objects.for_display().get(id=self.match.id)
+        self.assertFalse(upcoming.is_overdue())
+        Match.objects.filter(id=self.match.id).update(
+            date_time=self.utc.localize(datetime.datetime.now() - datetime.timedelta(days=1)))
+        played = Match.objects.for_display().get(id=self.match.id)
+        self.assertTrue(played.is_overdue())
+        self.assertTrue(Match.objects.get(id=self.match.id).is_overdue())
+
+    def test_for_display_loads_the_players(self):
+        match = Match.objects.for_display().get(id=self.match.id)
+        with self.assertNumQueries(0):
+            match.player_1.full_name()
+            match.player_2.full_name()
+
+    def test_withdrawing_cancels_upcoming_and_forfeits_overdue_matches(self):
+        upcoming = self._pending_match(datetime.timedelta(days=3))
+        overdue_as_player_1 = self._pending_match(-datetime.timedelta(days=3))
+        overdue_as_player_2 = Match.objects.create(player_1=self.user2, player_2=self.user1, club=self.club,
+            location="Bush House floor 6", date_time=timezone.now() - datetime.timedelta(days=2))
+        self.assertEqual(withdraw_from_club_matches(self.club.id, self.user1.id), 4)
+        self.assertEqual(Match.objects.get(id=upcoming.id).status, Match.CANCELLED)
+        self.assertEqual(Match.objects.get(id=overdue_as_player_1.id).status, Match.PLAYER2)
+        self.assertEqual(Match.objects.get(id=overdue_as_player_2.id).status, Match.PLAYER1)
+        self.assertEqual(Match.objects.get(id=self.match.id).status, Match.PLAYER2)
+        events = dict(MatchEvent.objects.filter(club=self.club).values_list('match_id', 'kind'))
+        self.assertEqual(events[upcoming.id], MatchEvent.CANCELLED)
+        self.assertEqual(events[overdue_as_player_2.id], MatchEvent.FORFEITED)
+        record = HeadToHead.objects.get(club=self.club)
+        self.assertEqual((record.games, record.wins_for(self.user2.id)), (3, 3))
+
+    def test_withdrawing_leaves_other_matches_alone(self):
+        self.match.status = Match.DRAW
+        self.match.save()
+        other_club = Club.objects.get(name='PolecatChess_2')
+        Membership.objects.create(user=self.user1, club=other_club)
+        Membership.objects.create(user=self.user2, club=other_club)
+        elsewhere = Match.objects.create(player_1=self.user1, player_2=self.user2, club=other_club,
+            location="Strand", date_time=timezone.now() + datetime.timedelta(days=1))
+        self.assertEqual(withdraw_from_club_matches(self.club.id, self.user1.id), 0)
+        self.assertEqual(Match.objects.get(id=self.match.id).status, Match.DRAW)
+        self.assertTrue(Match.objects.get(id=elsewhere.id).is_pending())
+
+    def _pending_match(self, from_now):
+        return Match.objects.create(player_1=self.user1, player_2=self.user2, club=self.club,
+            location="Bush House floor 6", date_time=timezone.now() + from_now)
+
     def _assert_match_is_valid(self):
         try:
             self.match.full_clean()
@@ -0,0 +1,63 @@
+"""Tests of the club coordinates and the nearest clubs query."""
+
+from django.test import TestCase
+from clubs.geo import geocode, grid_cell
+from clubs.models import Club, nearest_clubs
+
+
+class NearestClubsTestCase(TestCase):
+    """Unit tests of the club coordinates and the nearest clubs query."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.strand = Club.objects.create(name='Strand', location='Strand', description='Strand club')
+        cls.waterloo = Club.objects.create(name='Waterloo', location='Waterloo', description='Waterloo club')
+        cls.leeds = Club.objects.create(name='Leeds', location='Leeds', description='Leeds club')
+        cls.tokyo = Club.objects.create(name='Tokyo', location='Tokyo', description='Tokyo club')
+        cls.nowhere = Club.objects.create(name='Nowhere', location='Atlantis', description='Lost club')
+
+    def test_club_is_geocoded_when_saved(self):
+        self.assertEqual((self.strand.latitude, self.strand.longitude), geocode('Strand'))
+        self.assertEqual(self.strand.grid_cell, grid_cell(*geocode('Strand')))
+
+    def test_club_with_unknown_location_has_no_coordinates(self):
+        self.assertIsNone(self.nowhere.latitude)
+        self.assertIsNone(self.nowhere.grid_cell)
+
+    def test_club_is_geocoded_again_when_location_changes(self):
+        club = Club.objects.get(id=self.strand.id)
+        club.location = 'Leeds'
+        club.save()
+        self.assertEqual((club.latitude, club.longitude), geocode('Leeds'))
+
+    def test_coordinates_are_kept_when_location_does_not_change(self):
+        club = Club.objects.get(id=self.nowhere.id)
+        club.set_coordinates((10.0, 10.0))
+        club.save()
+        club = Club.objects.get(id=self.nowhere.id)
+        club.description = 'Found club'
+        club.save()
+        self.assertEqual(Club.objects.get(id=self.nowhere.id).latitude, 10.0)
+
+    def test_nearest_clubs_are_ordered_by_distance(self):
+        clubs = nearest_clubs(*geocode('Covent Garden'), count=3)
+        self.assertEqual(clubs, [self.strand, self.waterloo, self.leeds])
+        self.assertLess(clubs[0].distance_km, 1)
+
+    def test_nearest_clubs_skip_clubs_without_coordinates(self):
+        clubs = nearest_clubs(*geocode('London'), count=10)
+        self.assertNotIn(self.nowhere, clubs)
+        self.assertEqual(clubs[-1], self.tokyo)
+
+    def test_nearest_clubs_can_be_restricted(self):
+        clubs = nearest_clubs(*geocode('Strand'), count=1, clubs=Club.objects.exclude(id=self.strand.id))
+        self.assertEqual(clubs, [self.waterloo])
+
+    def test_nearest_clubs_are_found_in_a_square(self):
+        self.assertEqual(nearest_clubs(*geocode('Seoul'), count=1), [self.tokyo])
+
+    def test_nearest_clubs_outside_the_largest_square_are_found_by_reading_every_club(self):
+        clubs = nearest_clubs(*geocode('Sydney'), count=10)
+        self.assertEqual(len(clubs), 4)
+        self.assertEqual(clubs[0], self.tokyo)
+        self.assertGreater(clubs[0].distance_km, 7000)
@@ -124,6 +124,16 @@ class ApplicationTestCase(TestCase):
         count_after = Application.objects.count()
         self.assertEqual(count_after, count_before + 1)
 
+    def test_pending_application_can_be_saved_again(self):
+        self.application.personal_statement = "new personal statement"
+        self.application.save()
+        self.assertEqual(Application.objects.get(id=self.application.id).personal_statement, "new personal statement")
+
+    def test_duplicate_application_leaves_the_transaction_usable(self):
+        with self.assertRaises(IntegrityError):
+            self._create_application(self.user, self.club)
+        self.assertEqual(Application.objects.filter(user=self.user, club=self.club).count(), 1)
+
     def _assert_application_is_valid(self):
         try:
             self.application.full_clean()
@@ -0,0 +1,186 @@
+"""Tests of the tournament model."""
+
+from django.core.exceptions import ValidationError
+from django.db.utils import IntegrityError
+from django.test import TestCase
+from clubs.models import User, Club, Match, MatchEvent, Membership, Tournament, TournamentEntry, enter_club_members
+from clubs.scheduling import PairingError
+import datetime
+import pytz
+
+
+class TournamentModelTestCase(TestCase):
+    """Unit tests of the tournament model."""
+
+    fixtures = [
+        'clubs/tests/fixtures/default_user.json',
+        'clubs/tests/fixtures/other_users.json',
+        'clubs/tests/fixtures/default_club.json',
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.utc = pytz.UTC
+        cls.club = Club.objects.get(name='PolecatChess')
+        cls.users = list(User.objects.order_by('id'))
+        for user in cls.users:
+            Membership.objects.create(user=user, club=cls.club)
+        cls.tournament = Tournament.objects.create(club=cls.club, name='Winter Open', location='Bush House', rounds=3)
+        enter_club_members(cls.tournament)
+        cls.date_time = cls.utc.localize(datetime.datetime(2030, 9, 25, 10, 30))
+
+    def test_valid_tournament(self):
+        try:
+            self.tournament.full_clean()
+        except ValidationError:
+            self.fail("Test tournament should be valid")
+
+    def test_name_must_not_be_blank(self):
+        self.tournament.name = ''
+        with self.assertRaises(ValidationError):
+            self.tournament.full_clean()
+
+    def test_rounds_must_be_at_least_one(self):
+        self.tournament.rounds = 0
+        with self.assertRaises(ValidationError):
+            self.tournament.full_clean()
+
+    def test_enter_club_members_enters_every_member(self):
+        self.assertEqual(set(self.tournament.players.all()), set(self.users))
+
+    def test_user_can_enter_a_tournament_only_once(self):
+        with self.assertRaises(IntegrityError):
+            TournamentEntry.objects.create(tournament=self.tournament, user=self.users[0])
+
+    def test_pair_next_round_creates_a_match_for_every_pair(self):
+        self.tournament.pair_next_round(self.date_time)
+        matches = Match.objects.filter(tournament=self.tournament)
+        self.assertEqual(matches.count(), 2)
+        self.assertEqual(self.tournament.current_round, 1)
+        for match in matches:
+            self.assertEqual(match.round, 1)
+            self.assertEqual(match.location, 'Bush House')
+            self.assertEqual(match.date_time, self.date_time)
+            self.assertTrue(match.is_pending())
+
+    def test_pair_next_round_publishes_an_event_for_every_match(self):
+        matches = self.tournament.pair_next_round(self.date_time)
+        events = MatchEvent.objects.filter(club=self.club)
+        self.assertEqual(sorted(events.values_list('match_id', flat=True)), sorted(match.id for match in matches))
+        self.assertTrue(all(event.kind == MatchEvent.CREATED for event in events))
+
+    def test_pair_next_round_needs_results_of_the_current_round(self):
+        self.tournament.pair_next_round(self.date_time)
+        with self.assertRaises(PairingError):
+            self.tournament.pair_next_round(self.date_time)
+
+    def test_pair_next_round_does_not_repeat_pairings(self):
+        pairings = set()
+        for round_number in range(3):
+            self.tournament.pair_next_round(self.date_time)
+            for match in Match.objects.filter(tournament=self.tournament, round=round_number + 1):
+                pairing = frozenset((match.player_1_id, match.player_2_id))
+                self.assertNotIn(pairing, pairings)
+                pairings.add(pairing)
+                match.status = Match.PLAYER1
+                match.save()
+        self.assertTrue(self.tournament.is_finished())
+        with self.assertRaises(PairingError):
+            self.tournament.pair_next_round(self.date_time)
+
+    def test_pair_next_round_skips_players_who_left_the_club(self):
+        Membership.objects.filter(user=self.users[0]).delete()
+        self.tournament.pair_next_round(self.date_time)
+        matches = Match.objects.filter(tournament=self.tournament)
+        self.assertEqual(matches.count(), 1)
+        self.assertEqual(TournamentEntry.objects.get(tournament=self.tournament, byes=1).user, self.users[3])
+
+    def test_standings_are_ordered_by_score(self):
+        self.tournament.pair_next_round(self.date_time)
+        for match in Match.objects.filter(tournament=self.tournament):
+            match.status = Match.PLAYER2
+            match.save()
+        winners = set(Match.objects.filter(tournament=self.tournament).values_list('player_2_id', flat=True))
+        standings = self.tournament.standings()
+        self.assertEqual({entry.user_id for entry in standings[:2]}, winners)
+        self.assertEqual([entry.score for entry in standings], [1, 1, 0, 0])
+
+    def test_round_date_is_spaced_by_days_between_rounds(self):
+        self.tournament.starts_at = self.date_time
+        self.tournament.days_between_rounds = 3
+        self.assertEqual(self.tournament.round_date(1), self.date_time)
+        self.assertEqual(self.tournament.round_date(3), self.date_time + datetime.timedelta(days=6))
+
+    def test_pair_next_round_uses_the_round_date_by_default(self):
+        self.tournament.starts_at = self.date_time
+        self.tournament.save()
+        self.tournament.pair_next_round()
+        self.assertEqual(set(Match.objects.filter(tournament=self.tournament).values_list('date_time', flat=True)), {self.date_time})
+
+    def test_pair_next_round_rejects_conflicting_matches(self):
+        Match.objects.create(player_1=self.users[0], player_2=self.users[1], club=self.club,
+            location='Bush House', date_time=self.date_time)
+        with self.assertRaises(PairingError):
+            self.tournament.pair_next_round(self.date_time)
+        self.assertFalse(Match.objects.filter(tournament=self.tournament).exists())
+        self.assertEqual(self.tournament.current_round, 0)
+
+    def test_schedule_round_robin_creates_every_round(self):
+        tournament = self._scheduled_tournament(Tournament.ROUND_ROBIN)
+        self.assertEqual(tournament.rounds, 3)
+        self.assertEqual(tournament.current_round, 3)
+        matches = Match.objects.filter(tournament=tournament)
+        self.assertEqual(matches.count(), 6)
+        self.assertEqual(len({frozenset((match.player_1_id, match.player_2_id)) for match in matches}), 6)
+        for match in matches:
+            self.assertEqual(match.date_time, tournament.round_date(match.round))
+
+    def test_schedule_knockout_pairs_the_first_round(self):
+        tournament = self._scheduled_tournament(Tournament.KNOCKOUT)
+        self.assertEqual(tournament.rounds, 2)
+        self.assertEqual(tournament.current_round, 1)
+        pairs = {frozenset((match.player_1_id, match.player_2_id)) for match in Match.objects.filter(tournament=tournament)}
+        self.assertEqual(pairs, {frozenset((self.users[0].id, self.users[3].id)), frozenset((self.users[1].id, self.users[2].id))})
+
+    def test_knockout_winners_meet_in_the_next_round(self):
+        tournament = self._scheduled_tournament(Tournament.KNOCKOUT)
+        for match in Match.objects.filter(tournament=tournament):
+            match.status = Match.PLAYER2
+            match.save()
+        winners = set(Match.objects.filter(tournament=tournament).values_list('player_2_id', flat=True))
+        final = tournament.pair_next_round()
+        self.assertEqual(len(final), 1)
+        self.assertEqual({final[0].player_1_id, final[0].player_2_id}, winners)
+        self.assertEqual(final[0].date_time, tournament.round_date(2))
+        self.assertTrue(tournament.is_finished())
+
+    def test_knockout_draw_is_won_by_the_better_seed(self):
+        tournament = self._scheduled_tournament(Tournament.KNOCKOUT)
+        Match.objects.filter(tournament=tournament).update(status=Match.DRAW)
+        final = tournament.pair_next_round()
+        self.assertEqual({final[0].player_1_id, final[0].player_2_id}, {self.users[0].id, self.users[1].id})
+
+    def test_schedule_round_robin_rejects_conflicting_matches(self):
+        Match.objects.create(player_1=self.users[0], player_2=self.users[1], club=self.club,
+            location='Bush House', date_time=self.date_time)
+        tournament = Tournament.objects.create(club=self.club, name='Round robin', location='Bush House',
+            rounds=1, format=Tournament.ROUND_ROBIN, starts_at=self.date_time)
+        enter_club_members(tournament)
+        with self.assertRaises(PairingError):
+            tournament.schedule()
+        self.assertFalse(Match.objects.filter(tournament=tournament).exists())
+
+    def test_schedule_knockout_rejects_fewer_than_two_entrants(self):
+        tournament = Tournament.objects.create(club=self.club, name='Lonely', location='Bush House',
+            rounds=1, format=Tournament.KNOCKOUT, starts_at=self.date_time)
+        TournamentEntry.objects.create(tournament=tournament, user=self.users[0])
+        with self.assertRaises(PairingError):
+            tournament.schedule()
+        self.assertFalse(Match.objects.filter(tournament=tournament).exists())
+
+    def _scheduled_tournament(self, tournament_format):
+        tournament = Tournament.objects.create(club=self.club, name=tournament_format, location='Bush House',
+            rounds=1, format=tournament_format, starts_at=self.date_time)
+        enter_club_members(tournament)
+        tournament.schedule()
+        return tournament
@@ -14,10 +14,11 @@ class UserModelTestCase(TestCase):
         'clubs/tests/fixtures/other_clubs.json',
     ]
 
-    def setUp(self):
-        self.user1 = User.objects.get(username='johndoe')
-        self.user2 = User.objects.get(username='janedoe')
-        self.club = Club.objects.get(name='PolecatChess')
+    @classmethod
+    def setUpTestData(cls):
+        cls.user1 = User.objects.get(username='johndoe')
+        cls.user2 = User.objects.get(username='janedoe')
+        cls.club = Club.objects.get(name='PolecatChess')
 
     def test_valid_user(self):
         self._assert_user_is_valid()
@@ -0,0 +1,38 @@
+"""Tests of the knockout bracket generator."""
+
+from django.test import SimpleTestCase
+from clubs.scheduling import seeded_bracket, knockout_rounds, next_knockout_pairs
+
+
+class KnockoutTestCase(SimpleTestCase):
+    """Unit tests of the knockout bracket generator."""
+
+    def test_bracket_keeps_the_top_seeds_apart(self):
+        self.assertEqual(seeded_bracket([1, 2, 3, 4]), [1, 4, 2, 3])
+        bracket = seeded_bracket(list(range(1, 9)))
+        self.assertIn(1, bracket[:4])
+        self.assertIn(2, bracket[4:])
+
+    def test_bracket_is_padded_with_byes_for_the_top_seeds(self):
+        bracket = seeded_bracket([1, 2, 3, 4, 5, 6])
+        self.assertEqual(len(bracket), 8)
+        self.assertEqual(bracket.count(None), 2)
+        _, pairs = next_knockout_pairs(bracket, lambda first, second: None)
+        self.assertEqual(len(pairs), 2)
+        self.assertNotIn(1, [player for pair in pairs for player in pair])
+        self.assertNotIn(2, [player for pair in pairs for player in pair])
+
+    def test_number_of_rounds(self):
+        self.assertEqual(knockout_rounds(2), 1)
+        self.assertEqual(knockout_rounds(5), 3)
+        self.assertEqual(knockout_rounds(8), 3)
+
+    def test_winners_meet_in_the_next_round(self):
+        bracket = seeded_bracket(list(range(1, 9)))
+        better_seed = lambda first, second: min(first, second)
+        bracket, pairs = next_knockout_pairs(bracket, better_seed)
+        self.assertEqual(len(pairs), 4)
+        bracket, pairs = next_knockout_pairs(bracket, better_seed)
+        self.assertEqual({frozenset(pair) for pair in pairs}, {frozenset((1, 4)), frozenset((2, 3))})
+        bracket, pairs = next_knockout_pairs(bracket, better_seed)
+        self.assertEqual([frozenset(pair) for pair in pairs], [frozenset((1, 2))])
@@ -0,0 +1,38 @@
+"""Tests of the round robin schedule generator."""
+
+from itertools import combinations
+from django.test import SimpleTestCase
+from clubs.scheduling import berger_rounds
+
+
+class RoundRobinTestCase(SimpleTestCase):
+    """Unit tests of the round robin schedule generator."""
+
+    def test_every_pair_meets_exactly_once(self):
+        for size in (2, 5, 8, 11):
+            players = list(range(size))
+            rounds = berger_rounds(players)
+            pairs = [frozenset(pair) for pairs in rounds for pair in pairs]
+            self.assertEqual(len(pairs), len(set(pairs)))
+            self.assertEqual(set(pairs), {frozenset(pair) for pair in combinations(players, 2)})
+
+    def test_number_of_rounds(self):
+        self.assertEqual(len(berger_rounds(list(range(8)))), 7)
+        self.assertEqual(len(berger_rounds(list(range(7)))), 7)
+
+    def test_players_play_at_most_once_a_round(self):
+        for pairs in berger_rounds(list(range(9))):
+            players = [player for pair in pairs for player in pair]
+            self.assertEqual(len(players), len(set(players)))
+
+    def test_colours_are_balanced(self):
+        balance = dict.fromkeys(range(10), 0)
+        for pairs in berger_rounds(list(range(10))):
+            for white, black in pairs:
+                balance[white] += 1
+                balance[black] -= 1
+        self.assertTrue(all(abs(colours) <= 1 for colours in balance.values()))
+
+    def test_fewer_than_two_players_have_no_rounds(self):
+        self.assertEqual(berger_rounds([]), [])
+        self.assertEqual(berger_rounds([1]), [])
@@ -0,0 +1,80 @@
+"""Tests of the Swiss pairing engine."""
+
+from django.test import SimpleTestCase
+from clubs.scheduling import SwissPlayer, pair_swiss_round, PairingError, WHITE, BLACK
+
+
+class SwissPairingTestCase(SimpleTestCase):
+    """Unit tests of the Swiss pairing engine."""
+
+    def setUp(self):
+        self.players = [SwissPlayer(id, rank=id) for id in range(8)]
+
+    def test_first_round_pairs_top_half_against_bottom_half(self):
+        pairs, bye = pair_swiss_round(self.players)
+        self.assertIsNone(bye)
+        self.assertEqual(self._ids(pairs), {(0, 4), (1, 5), (2, 6), (3, 7)})
+
+    def test_players_are_paired_within_their_score_group(self):
+        for player in self.players[:4]:
+            player.score = 1
+        pairs, bye = pair_swiss_round(self.players)
+        self.assertEqual(self._ids(pairs), {(0, 2), (1, 3), (4, 6), (5, 7)})
+
+    def test_players_do_not_meet_twice(self):
+        for round_number in range(7):
+            pairs, bye = pair_swiss_round(self.players)
+            for white, black in pairs:
+                self.assertNotIn(black.id, white.opponents)
+                white.opponents.add(black.id)
+                black.opponents.add(white.id)
+        for player in self.players:
+            self.assertEqual(player.opponents, {other.id for other in self.players} - {player.id})
+
+    def test_lowest_ranked_player_without_bye_gets_the_bye(self):
+        players = self.players[:7]
+        players[6].had_bye = True
+        pairs, bye = pair_swiss_round(players)
+        self.assertEqual(bye, 5)
+        self.assertEqual(len(pairs), 3)
+
+    def test_player_due_white_gets_white(self):
+        first, second = SwissPlayer(1, rank=1), SwissPlayer(2, rank=2)
+        first.colour_balance, first.last_colour = 1, WHITE
+        second.colour_balance, second.last_colour = -1, BLACK
+        pairs, bye = pair_swiss_round([first, second])
+        self.assertEqual(pairs, [(second, first)])
+
+    def test_higher_ranked_player_gets_white_when_colours_are_even(self):
+        pairs, bye = pair_swiss_round([SwissPlayer(2, rank=2), SwissPlayer(1, rank=1)])
+        self.assertEqual(self._ids(pairs), {(1, 2)})
+        self.assertEqual(pairs[0][0].id, 1)
+
+    def test_round_cannot_be_paired_when_everyone_has_met(self):
+        first, second = SwissPlayer(1), SwissPlayer(2)
+        first.opponents.add(2)
+        second.opponents.add(1)
+        with self.assertRaises(PairingError):
+            pair_swiss_round([first, second])
+
+    def test_large_round_pairs_everyone(self):
+        players = [SwissPlayer(id, rank=id, score=id % 5) for id in range(1001)]
+        pairs, bye = pair_swiss_round(players)
+        paired = {player.id for pair in pairs for player in pair}
+        self.assertEqual(len(pairs), 500)
+        self.assertEqual(paired | {bye}, {player.id for player in players})
+
+    def test_opponents_met_outside_the_tournament_are_avoided_when_possible(self):
+        self.players[0].met_before.add(4)
+        pairs, bye = pair_swiss_round(self.players)
+        self.assertNotIn((0, 4), self._ids(pairs))
+        self.assertEqual(len(pairs), 4)
+
+    def test_opponents_met_outside_the_tournament_can_still_be_paired(self):
+        players = self.players[:2]
+        players[0].met_before.add(1)
+        pairs, bye = pair_swiss_round(players)
+        self.assertEqual(self._ids(pairs), {(0, 1)})
+
+    def _ids(self, pairs):
+        return {tuple(sorted((white.id, black.id))) for white, black in pairs}
@@ -0,0 +1,89 @@
+"""Tests of the full-text search over clubs and users."""
+
+from django.db import connection
+from django.test import TestCase
+from django.utils import timezone
+from clubs.models import User, Club
+from clubs.search import (search_clubs, search_users, search_terms, rebuild_search_index,
+    restore_search_triggers, RESULTS_PER_PAGE)
+
+
+class SearchIndexTestCase(TestCase):
+    """Unit tests of the full-text search over clubs and users."""
+
+    fixtures = [
+        'clubs/tests/fixtures/default_user.json',
+        'clubs/tests/fixtures/other_users.json',
+        'clubs/tests/fixtures/default_club.json',
+        'clubs/tests/fixtures/other_clubs.json',
+    ]
+
+    def test_search_terms_keep_only_words(self):
+        self.assertEqual(search_terms('Polecat "chess" OR -club*'), ['polecat', 'chess', 'or', 'club'])
+
+    def test_clubs_are_found_by_word_prefix(self):
+        self.assertIn(Club.objects.get(name='PolecatChess'), list(search_clubs('polec')))
+
+    def test_every_word_must_match(self):
+        self.assertEqual(list(search_clubs('polecat nowhere')), [])
+
+    def test_blank_query_has_no_results(self):
+        page = search_clubs('  ')
+        self.assertEqual(len(page), 0)
+        self.assertFalse(page.has_next)
+
+    def test_name_matches_rank_above_description_matches(self):
+        Club.objects.create(name='Rookies', location='Leeds', description='Friendly games against Knights players')
+        knights = Club.objects.create(name='Knights', location='York', description='A club for everyone')
+        self.assertEqual(list(search_clubs('knights'))[0], knights)
+
+    def test_index_follows_changes(self):
+        club = Club.objects.get(name='PolecatChess')
+        club.name = 'Bishops'
+        club.save()
+        self.assertEqual(list(search_clubs('bishops')), [club])
+        self.assertNotIn(club, list(search_clubs('polecatchess')))
+        club.delete()
+        self.assertEqual(list(search_clubs('bishops')), [])
+
+    def test_users_are_found_by_name(self):
+        self.assertEqual(list(search_users('jane')), [User.objects.get(username='janedoe')])
+
+    def test_inactive_users_are_not_found(self):
+        User.objects.filter(username='janedoe').update(is_active=False)
+        self.assertEqual(list(search_users('jane')), [])
+
+    def test_inactive_users_do_not_leave_pages_short(self):
+        User.objects.bulk_create([
+            User(username=f'rook{index}', email=f'rook{index}@example.org', first_name='Rook', last_name=str(index),
+                is_active=index >= RESULTS_PER_PAGE) for index in range(RESULTS_PER_PAGE * 2)
+        ])
+        first_page = search_users('rook')
+        self.assertEqual(len(first_page), RESULTS_PER_PAGE)
+        self.assertTrue(all(user.is_active for user in first_page))
+        self.assertFalse(first_page.has_next)
+
+    def test_deleted_clubs_are_not_found(self):
+        Club.objects.filter(name='PolecatChess').update(deleted_at=timezone.now())
+        self.assertNotIn('PolecatChess', [club.name for club in search_clubs('polecatchess')])
+
+    def test_results_are_paginated(self):
+        Club.objects.bulk_create([
+            Club(name=f'Gambit {index}', location='London', description='Gambit club') for index in range(RESULTS_PER_PAGE + 5)
+        ])
+        first_page = search_clubs('gambit')
+        second_page = search_clubs('gambit', page=2)
+        self.assertEqual(len(first_page), RESULTS_PER_PAGE)
+        self.assertTrue(first_page.has_next)
+        self.assertEqual(len(second_page), 5)
+        self.assertFalse(second_page.has_next)
+        self.assertTrue(second_page.has_previous())
+        self.assertFalse(set(first_page.results) & set(second_page.results))
+
+    def test_rebuild_and_restore_keep_the_index_working(self):
+        with connection.cursor() as cursor:
+            cursor.execute("DROP TRIGGER clubs_club_fts_insert")
+        restore_search_triggers()
+        club = Club.objects.create(name='Castlers', location='Leeds', description='New club')
+        rebuild_search_index()
+        self.assertEqual(list(search_clubs('castlers')), [club])
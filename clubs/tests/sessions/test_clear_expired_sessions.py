@@ -0,0 +1,32 @@
+"""Tests of the clear_expired_sessions command."""
+
+import datetime
+import io
+from django.contrib.sessions.models import Session
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+
+class ClearExpiredSessionsTestCase(TestCase):
+    """Unit tests of the clear_expired_sessions command."""
+
+    @classmethod
+    def setUpTestData(cls):
+        now = timezone.now()
+        Session.objects.bulk_create(
+            [Session(session_key=f'expired{number}', session_data='', expire_date=now - datetime.timedelta(days=1))
+                for number in range(5)]
+            + [Session(session_key='current', session_data='', expire_date=now + datetime.timedelta(days=1))]
+        )
+
+    def test_expired_sessions_are_deleted_in_batches(self):
+        output = io.StringIO()
+        call_command('clear_expired_sessions', '--batch-size', '2', stdout=output)
+        self.assertEqual(list(Session.objects.values_list('session_key', flat=True)), ['current'])
+        self.assertIn('Deleted 5 expired sessions', output.getvalue())
+
+    @override_settings(SESSION_ENGINE='django.contrib.sessions.backends.signed_cookies')
+    def test_nothing_is_deleted_with_cookie_sessions(self):
+        call_command('clear_expired_sessions', stdout=io.StringIO())
+        self.assertEqual(Session.objects.count(), 6)
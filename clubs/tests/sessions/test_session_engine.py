@@ -0,0 +1,14 @@
+"""Tests of the default session backend."""
+
+import os
+from unittest import skipIf
+from django.conf import settings
+from django.test import TestCase
+
+
+class SessionEngineTestCase(TestCase):
+    """Unit tests of the default session backend."""
+
+    @skipIf(os.environ.get('SESSION_BACKEND') or settings.SHARED_CACHE, 'The session backend is configured')
+    def test_sessions_are_not_cached_without_a_shared_cache(self):
+        self.assertEqual(settings.SESSION_ENGINE, settings.SESSION_BACKENDS['db'])
@@ -0,0 +1,65 @@
+"""Tests of database snapshots."""
+
+import os
+import sqlite3
+import tempfile
+from django.test import TransactionTestCase
+from clubs.models import User, Club, Membership
+from clubs.search import search_clubs
+from clubs.snapshots import BACKUP, ROWS, SnapshotError, dump_snapshot, load_snapshot
+
+
+class SnapshotTestCase(TransactionTestCase):
+    """Unit tests of dumping and loading snapshots."""
+
+    fixtures = [
+        'clubs/tests/fixtures/default_user.json',
+        'clubs/tests/fixtures/default_club.json',
+    ]
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'snapshot.sqlite3')
+        self.user = User.objects.get(username='johndoe')
+        self.club = Club.objects.get(name='PolecatChess')
+        Membership.objects.create(user=self.user, club=self.club, role=Membership.OWNER)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_backup_snapshot_restores_the_database(self):
+        self.assertEqual(dump_snapshot(self.path), BACKUP)
+        Club.objects.create(name='Later', location='Leeds', description='Created after the snapshot')
+        Club.objects.filter(id=self.club.id).delete()
+        self.assertEqual(load_snapshot(self.path), BACKUP)
+        self.assertEqual(list(Club.objects.values_list('name', flat=True)), ['PolecatChess'])
+        self.assertTrue(Membership.objects.filter(user=self.user, club=self.club).exists())
+        self.assertEqual([club.name for club in search_clubs('PolecatChess').results], ['PolecatChess'])
+
+    def test_rows_snapshot_restores_the_clubs_tables(self):
+        self.assertEqual(dump_snapshot(self.path, rows=True), ROWS)
+        Club.objects.filter(id=self.club.id).delete()
+        self.assertEqual(load_snapshot(self.path), ROWS)
+        club = Club.objects.get(name='PolecatChess')
+        self.assertEqual(club.id, self.club.id)
+        self.assertTrue(User.objects.get(username='johndoe').is_owner_of(club))
+        self.assertEqual([club.name for club in search_clubs('PolecatChess').results], ['PolecatChess'])
+        other = Club.objects.create(name='Later', location='Leeds', description='Created after the snapshot')
+        self.assertGreater(other.id, club.id)
+
+    def test_snapshot_of_other_migrations_is_not_loaded(self):
+        dump_snapshot(self.path)
+        snapshot = sqlite3.connect(self.path)
+        snapshot.execute("UPDATE snapshot_meta SET value = '[]' WHERE key = 'migrations'")
+        snapshot.commit()
+        snapshot.close()
+        with self.assertRaises(SnapshotError):
+            load_snapshot(self.path)
+
+    def test_missing_or_invalid_snapshot_is_not_loaded(self):
+        with self.assertRaises(SnapshotError):
+            load_snapshot(self.path)
+        with open(self.path, 'w') as snapshot:
+            snapshot.write('not a snapshot')
+        with self.assertRaises(SnapshotError):
+            load_snapshot(self.path)
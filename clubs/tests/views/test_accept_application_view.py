@@ -14,18 +14,19 @@ class ClubApplicationsViewTestCase(TestCase, MenuTesterMixin):
         'clubs/tests/fixtures/other_users.json'
     ]
 
-    def setUp(self):
-        self.user = User.objects.get(username="janedoe")
-        self.club = Club.objects.get(name='PolecatChess')
-        self.applicant = User.objects.get(username='johndoe')
-        self.application = Application.objects.create(
-            user=self.applicant,
-            club=self.club,
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.get(username="janedoe")
+        cls.club = Club.objects.get(name='PolecatChess')
+        cls.applicant = User.objects.get(username='johndoe')
+        cls.application = Application.objects.create(
+            user=cls.applicant,
+            club=cls.club,
             personal_statement="My personal statement")
-        self.url = reverse('accept_application',
+        cls.url = reverse('accept_application',
                            kwargs={
-                               'club_id': self.club.id,
-                               'application_id': self.application.id
+                               'club_id': cls.club.id,
+                               'application_id': cls.application.id
                            })
 
     def test_accept_application_url(self):
@@ -102,6 +103,20 @@ class ClubApplicationsViewTestCase(TestCase, MenuTesterMixin):
                                           club=self.club)), 0)
         member.delete()
 
+    def test_accept_application_of_a_member_is_rolled_back(self):
+        self.client.login(email=self.user.email, password='Password123')
+        Membership.objects.create(user=self.user, club=self.club, role=Membership.OFFICER)
+        Membership.objects.create(user=self.applicant, club=self.club)
+        response = self.client.post(self.url, follow=True)
+        self.assertRedirects(response,
+                             reverse('club_application_list', kwargs={'club_id': self.club.id}),
+                             status_code=302,
+                             target_status_code=200)
+        self.assertContains(response, 'That application has already been handled')
+        self.assertEquals(
+            Application.objects.get(id=self.application.id).status,
+            Application.PENDING)
+
     def test_accept_application_redirects_without_membership(self):
         self.client.login(email=self.user.email, password='Password123')
         redirect_url = reverse('applications')
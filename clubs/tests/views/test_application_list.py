@@ -1,6 +1,9 @@
 """Tests of the application list view."""
 
+from unittest.mock import patch
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from clubs.models import Application, User, Club
 from clubs.tests.helpers import MenuTesterMixin, reverse_with_next
@@ -11,11 +14,15 @@ class ApplicationsViewTestCase(TestCase, MenuTesterMixin):
     fixtures = [
         'clubs/tests/fixtures/default_user.json',
         'clubs/tests/fixtures/default_club.json',
+        'clubs/tests/fixtures/other_clubs.json',
     ]
 
-    def setUp(self):
-        self.url = reverse('applications')
-        self.user = User.objects.get(username='johndoe')
+    @classmethod
+    def setUpTestData(cls):
+        cls.url = reverse('applications')
+        cls.user = User.objects.get(username='johndoe')
+        cls.club = Club.objects.get(name='PolecatChess')
+        cls.other_club = Club.objects.get(name='PolecatChess_2')
 
     def test_application_list_url(self):
         self.assertEqual(self.url, '/applications/')
@@ -41,3 +48,35 @@ class ApplicationsViewTestCase(TestCase, MenuTesterMixin):
                              redirect_url,
                              status_code=302,
                              target_status_code=200)
+
+    def test_processed_applications_are_only_loaded_for_the_history(self):
+        self.client.login(email=self.user.email, password='Password123')
+        Application.objects.create(user=self.user, club=self.club, personal_statement="Pending")
+        rejected = Application.objects.create(user=self.user, club=self.other_club,
+                                              personal_statement="Rejected", status=Application.REJECTED)
+        response = self.client.get(self.url)
+        self.assertEqual(len(response.context['applications']), 1)
+        self.assertEqual(response.context['history_count'], 1)
+        self.assertNotIn('history', response.context)
+        self.assertContains(response, 'id="application-history-link"')
+        response = self.client.get(self.url, {'history': 'full'})
+        self.assertEqual(list(response.context['history']), [rejected])
+        self.assertNotContains(response, 'id="application-history-link"')
+
+    def test_applications_are_paginated(self):
+        self.client.login(email=self.user.email, password='Password123')
+        Application.objects.create(user=self.user, club=self.club, personal_statement="First")
+        Application.objects.create(user=self.user, club=self.other_club, personal_statement="Second")
+        with patch('clubs.views.helpers.APPLICATIONS_PAGE_SIZE', 1):
+            response = self.client.get(self.url, {'page': 2})
+        self.assertEqual(len(response.context['applications']), 1)
+        self.assertEqual(response.context['applications'].paginator.num_pages, 2)
+
+    def test_application_clubs_are_loaded_with_the_applications(self):
+        self.client.login(email=self.user.email, password='Password123')
+        Application.objects.create(user=self.user, club=self.club, personal_statement="First")
+        with CaptureQueriesContext(connection) as one_application:
+            self.client.get(self.url)
+        Application.objects.create(user=self.user, club=self.other_club, personal_statement="Second")
+        with self.assertNumQueries(len(one_application)):
+            self.client.get(self.url)
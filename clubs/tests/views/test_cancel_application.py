@@ -15,16 +15,17 @@ class CancelApplicationViewTestCase(TestCase, MenuTesterMixin):
         'clubs/tests/fixtures/other_users.json'
     ]
 
-    def setUp(self):
-        self.user = User.objects.get(username='johndoe')
-        self.club = Club.objects.get(name='PolecatChess')
-        self.application = Application.objects.create(
-            user=self.user,
-            club=self.club,
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.get(username='johndoe')
+        cls.club = Club.objects.get(name='PolecatChess')
+        cls.application = Application.objects.create(
+            user=cls.user,
+            club=cls.club,
             personal_statement="Application to cancel",
             status="Pending")
-        self.url = reverse('cancel_application',
-                           kwargs={'application_id': self.application.id})
+        cls.url = reverse('cancel_application',
+                           kwargs={'application_id': cls.application.id})
 
     def test_cancel_application_url(self):
         self.assertEqual(
@@ -18,41 +18,42 @@ class CancelMatchViewTestCase(TestCase, MenuTesterMixin):
         'clubs/tests/fixtures/other_clubs.json',
     ]
 
-    def setUp(self):
-        self.utc = pytz.UTC
-        self.club = Club.objects.get(name='PolecatChess')
-        self.player1 = User.objects.get(username='johndoe')
-        self.player2 = User.objects.get(username='janedoe')
-        self.player1application = Application.objects.create(
-            user=self.player1,
-            club=self.club,
+    @classmethod
+    def setUpTestData(cls):
+        cls.utc = pytz.UTC
+        cls.club = Club.objects.get(name='PolecatChess')
+        cls.player1 = User.objects.get(username='johndoe')
+        cls.player2 = User.objects.get(username='janedoe')
+        cls.player1application = Application.objects.create(
+            user=cls.player1,
+            club=cls.club,
             personal_statement="Player1 personal statement",
             status=Application.ACCEPTED)
 
-        self.player2application = Application.objects.create(
-            user=self.player2,
-            club=self.club,
+        cls.player2application = Application.objects.create(
+            user=cls.player2,
+            club=cls.club,
             personal_statement="Player2 personal statement",
             status=Application.ACCEPTED)
-        self.membership1 = Membership.objects.create(user=self.player1,
-                                                     club=self.club,
+        cls.membership1 = Membership.objects.create(user=cls.player1,
+                                                     club=cls.club,
                                                      role=Membership.OFFICER)
-        self.membership2 = Membership.objects.create(user=self.player2,
-                                                     club=self.club,
+        cls.membership2 = Membership.objects.create(user=cls.player2,
+                                                     club=cls.club,
                                                      role=Membership.MEMBER)
-        self.match = Match.objects.create(
-            player_1=self.player1,
-            player_2=self.player2,
-            club=self.club,
+        cls.match = Match.objects.create(
+            player_1=cls.player1,
+            player_2=cls.player2,
+            club=cls.club,
             location='Bush House',
-            date_time=self.utc.localize(datetime.datetime(2024, 9, 25, 10,
+            date_time=cls.utc.localize(datetime.datetime(2024, 9, 25, 10,
                                                           30)),
             status=Match.PENDING,
             id=1)
-        self.url = reverse('cancel_match',
+        cls.url = reverse('cancel_match',
                            kwargs={
-                               'club_id': self.club.id,
-                               'match_id': self.match.id
+                               'club_id': cls.club.id,
+                               'match_id': cls.match.id
                            })
 
     def test_cancel_match_url(self):
@@ -2,7 +2,8 @@
 
 from django.test import TestCase
 from django.urls import reverse
-from clubs.models import User, Club, Membership
+from clubs.deletion import delete_club
+from clubs.models import User, Club, Membership, Application, DeletionJob
 from clubs.tests.helpers import reverse_with_next
 
 
@@ -15,9 +16,10 @@ class CloseAccountViewTestCase(TestCase):
         'clubs/tests/fixtures/other_users.json'
         ]
 
-    def setUp(self):
-        self.url = reverse('close_account')
-        self.user_one = User.objects.get(username='johndoe')
+    @classmethod
+    def setUpTestData(cls):
+        cls.url = reverse('close_account')
+        cls.user_one = User.objects.get(username='johndoe')
 
     def test_close_account_url(self):
         self.assertEqual(self.url, '/close_account/')
@@ -50,12 +52,23 @@ class CloseAccountViewTestCase(TestCase):
                             status_code=302, 
                             target_status_code=200)
 
+    def test_get_close_account_when_owner_of_a_deleted_club(self):
+        self.client.login(email=self.user_one.email, password='Password123')
+        club = Club.objects.get(name='PolecatChess')
+        Membership.objects.create(user=self.user_one, club=club, role=Membership.OWNER)
+        delete_club(club)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, 'account_templates/close_account.html')
+
     def test_successful_account_close(self):
         self.client.login(email=self.user_one.email, password='Password123')
-        user_count_before = User.objects.count()
         response = self.client.post(self.url, follow=True)
-        user_count_after = User.objects.count()
-        self.assertEqual(user_count_after, user_count_before - 1)
+        self.user_one.refresh_from_db()
+        self.assertFalse(self.user_one.is_active)
+        self.assertTrue(DeletionJob.objects.filter(kind=DeletionJob.USER, target_id=self.user_one.id).exists())
+        self.assertFalse(response.context['user'].is_authenticated)
+        self.assertFalse(self.client.login(email=self.user_one.email, password='Password123'))
         response_url = reverse('home')
         self.assertRedirects(response,
                              response_url,
@@ -63,3 +76,12 @@ class CloseAccountViewTestCase(TestCase):
                              target_status_code=200,
                              fetch_redirect_response=True)
         self.assertTemplateUsed(response, 'account_templates/home.html')
+
+    def test_account_close_leaves_the_clubs_of_the_user(self):
+        self.client.login(email=self.user_one.email, password='Password123')
+        club = Club.objects.get(name='PolecatChess')
+        Application.objects.create(user=self.user_one, club=club, personal_statement='Hi!', status=Application.ACCEPTED)
+        Membership.objects.create(user=self.user_one, club=club)
+        self.client.post(self.url)
+        self.assertFalse(Membership.objects.filter(user=self.user_one).exists())
+        self.assertEqual(Application.objects.get(user=self.user_one).status, Application.REJECTED)
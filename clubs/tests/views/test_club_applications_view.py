@@ -1,8 +1,11 @@
 """Tests of the club applications view."""
 
+from datetime import timedelta
+from unittest.mock import patch
 from django.test import TestCase
 from django.urls import reverse
-from clubs.models import User, Club, Application, Membership
+from django.utils import timezone
+from clubs.models import User, Club, Application, Membership, application_queue
 from clubs.tests.helpers import MenuTesterMixin, reverse_with_next
 
 
@@ -11,14 +14,16 @@ class ClubApplicationsViewTestCase(TestCase, MenuTesterMixin):
 
     fixtures = [
         'clubs/tests/fixtures/default_user.json',
-        'clubs/tests/fixtures/default_club.json'
+        'clubs/tests/fixtures/default_club.json',
+        'clubs/tests/fixtures/other_users.json'
     ]
 
-    def setUp(self):
-        self.user = User.objects.get(username='johndoe')
-        self.club = Club.objects.get(name='PolecatChess')
-        self.url = reverse('club_application_list',
-                           kwargs={'club_id': self.club.id})
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.get(username='johndoe')
+        cls.club = Club.objects.get(name='PolecatChess')
+        cls.url = reverse('club_application_list',
+                           kwargs={'club_id': cls.club.id})
 
     def test_club_application_list_url(self):
         self.assertEqual(self.url,
@@ -86,3 +91,49 @@ class ClubApplicationsViewTestCase(TestCase, MenuTesterMixin):
                              redirect_url,
                              status_code=302,
                              target_status_code=200)
+
+    def _create_applications(self):
+        now = timezone.now()
+        applications = []
+        for days, user in enumerate(User.objects.exclude(id=self.user.id).order_by('id')):
+            application = Application.objects.create(user=user, club=self.club, personal_statement='Hi!')
+            Application.objects.filter(id=application.id).update(created_at=now - timedelta(days=days))
+            applications.append(application)
+        return applications
+
+    def test_club_application_list_is_paginated_newest_first(self):
+        self.client.login(email=self.user.email, password='Password123')
+        Membership.objects.create(user=self.user, club=self.club, role=Membership.OFFICER)
+        applications = self._create_applications()
+        with patch('clubs.models.application_models.APPLICATION_QUEUE_PAGE_SIZE', 2):
+            first = self.client.get(self.url)
+            second = self.client.get(self.url, {'after': first.context['page'].next_cursor})
+        self.assertEqual(first.context['applications'], applications[:2])
+        self.assertEqual(second.context['applications'], applications[2:])
+        self.assertFalse(second.context['page'].has_next())
+        self.assertEqual(first.context['page'].pending_count, len(applications))
+        self.assertEqual(second.context['page'].pending_count, len(applications))
+        self.assertContains(first, 'Next</a>')
+
+    def test_club_application_list_ignores_invalid_cursor(self):
+        self.client.login(email=self.user.email, password='Password123')
+        Membership.objects.create(user=self.user, club=self.club, role=Membership.OFFICER)
+        applications = self._create_applications()
+        response = self.client.get(self.url, {'after': 'not-a-cursor'})
+        self.assertEqual(response.context['applications'], applications)
+
+    def test_club_application_list_filters_by_experience_level(self):
+        self.client.login(email=self.user.email, password='Password123')
+        Membership.objects.create(user=self.user, club=self.club, role=Membership.OFFICER)
+        applications = self._create_applications()
+        advanced = [application for application in applications if application.user.experience_level == User.ADVANCED]
+        response = self.client.get(self.url, {'experience': User.ADVANCED})
+        self.assertEqual(response.context['applications'], advanced)
+        self.assertEqual(response.context['page'].pending_count, len(advanced))
+
+    def test_club_application_list_loads_the_page_in_one_query(self):
+        self._create_applications()
+        with self.assertNumQueries(1):
+            page = application_queue(self.club.id)
+            [application.user.full_name() for application in page.applications]
+            page.pending_count
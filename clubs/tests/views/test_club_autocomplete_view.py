@@ -0,0 +1,54 @@
+"""Tests of the club autocomplete view."""
+
+from django.test import TestCase
+from django.urls import reverse
+from clubs.models import Club, User
+from clubs.tests.helpers import reverse_with_next
+
+
+class ClubAutocompleteViewTestCase(TestCase):
+    """Unit tests of the club autocomplete view."""
+
+    fixtures = [
+        'clubs/tests/fixtures/default_user.json',
+        'clubs/tests/fixtures/default_club.json',
+        'clubs/tests/fixtures/other_clubs.json'
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.get(username='johndoe')
+        cls.url = reverse('club_autocomplete')
+        Club.objects.create(name='Knights', location='London', description='Another club')
+
+    def test_club_autocomplete_url(self):
+        self.assertEqual(self.url, '/autocomplete/clubs/')
+
+    def test_clubs_starting_with_the_query_are_returned_ignoring_case(self):
+        self.client.login(email=self.user.email, password='Password123')
+        response = self.client.get(self.url, {'q': 'POLECAT'})
+        names = [result['name'] for result in response.json()['results']]
+        self.assertTrue(names)
+        self.assertTrue(all(name.startswith('PolecatChess') for name in names))
+        self.assertEqual(names, sorted(names, key=str.lower))
+
+    def test_results_hold_the_id_and_name(self):
+        self.client.login(email=self.user.email, password='Password123')
+        club = Club.objects.get(name='Knights')
+        response = self.client.get(self.url, {'q': 'kni'})
+        self.assertEqual(response.json(), {'results': [{'id': club.id, 'name': 'Knights'}]})
+
+    def test_clubs_only_containing_the_query_are_not_returned(self):
+        self.client.login(email=self.user.email, password='Password123')
+        response = self.client.get(self.url, {'q': 'chess'})
+        self.assertEqual(response.json(), {'results': []})
+
+    def test_empty_query_returns_nothing(self):
+        self.client.login(email=self.user.email, password='Password123')
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url, {'q': ' '})
+        self.assertEqual(response.json(), {'results': []})
+
+    def test_club_autocomplete_redirects_when_not_logged_in(self):
+        response = self.client.get(self.url)
+        self.assertRedirects(response, reverse_with_next('log_in', self.url), status_code=302, target_status_code=200)
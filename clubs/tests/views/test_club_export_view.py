@@ -0,0 +1,114 @@
+"""Tests of the club export view."""
+
+import csv
+import io
+import json
+from django.test import TestCase
+from django.urls import reverse
+from clubs.models import User, Club, Membership, Application, Match
+from clubs.tests.helpers import reverse_with_next
+import datetime
+import pytz
+
+
+class ClubExportViewTestCase(TestCase):
+    """Unit tests of the club export view."""
+
+    fixtures = [
+        'clubs/tests/fixtures/default_user.json',
+        'clubs/tests/fixtures/other_users.json',
+        'clubs/tests/fixtures/default_club.json',
+        'clubs/tests/fixtures/other_clubs.json',
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.get(username='johndoe')
+        cls.member = User.objects.get(username='janedoe')
+        cls.club = Club.objects.get(name='PolecatChess')
+        cls.other_club = Club.objects.get(name='PolecatChess_2')
+        Membership.objects.create(user=cls.user, club=cls.club, role=Membership.OFFICER)
+        Membership.objects.create(user=cls.member, club=cls.club)
+        Membership.objects.create(user=cls.member, club=cls.other_club)
+        Application.objects.create(user=cls.member, club=cls.club, personal_statement='Let me in, "please"',
+            status=Application.ACCEPTED)
+        cls.match = Match.objects.create(player_1=cls.user, player_2=cls.member, club=cls.club, location='Bush House',
+            date_time=pytz.UTC.localize(datetime.datetime(2030, 9, 25, 10, 30)))
+        cls.url = reverse('club_export', kwargs={'club_id': cls.club.id, 'kind': 'members'})
+
+    def test_club_export_url(self):
+        self.assertEqual(self.url, f'/club/{self.club.id}/export/members')
+
+    def test_export_redirects_when_not_logged_in(self):
+        redirect_url = reverse_with_next('log_in', self.url)
+        response = self.client.get(self.url)
+        self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
+
+    def test_export_as_member_redirects(self):
+        self.client.login(email=self.member.email, password='Password123')
+        response = self.client.get(self.url)
+        redirect_url = reverse('club_home', kwargs={'club_id': self.club.id})
+        self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
+
+    def test_export_members_as_csv(self):
+        self.client.login(email=self.user.email, password='Password123')
+        response = self.client.get(self.url)
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        self.assertEqual(response['Content-Disposition'], 'attachment; filename="PolecatChess-members.csv"')
+        rows = list(csv.DictReader(io.StringIO(self._content(response))))
+        self.assertEqual([row['username'] for row in rows], ['johndoe', 'janedoe'])
+        self.assertEqual(rows[0]['role'], Membership.OFFICER)
+
+    def test_export_applications_quotes_csv_fields(self):
+        self.client.login(email=self.user.email, password='Password123')
+        url = reverse('club_export', kwargs={'club_id': self.club.id, 'kind': 'applications'})
+        rows = list(csv.DictReader(io.StringIO(self._content(self.client.get(url)))))
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]['personal_statement'], 'Let me in, "please"')
+
+    def test_export_neutralises_formulas_in_csv_fields(self):
+        Application.objects.filter(club=self.club).update(personal_statement='=HYPERLINK("http://example.org")')
+        User.objects.filter(id=self.member.id).update(first_name='@SUM(A1)', last_name='-1+2')
+        self.client.login(email=self.user.email, password='Password123')
+        url = reverse('club_export', kwargs={'club_id': self.club.id, 'kind': 'applications'})
+        rows = list(csv.DictReader(io.StringIO(self._content(self.client.get(url)))))
+        self.assertEqual(rows[0]['personal_statement'], '\'=HYPERLINK("http://example.org")')
+        self.assertEqual(rows[0]['first_name'], "'@SUM(A1)")
+        self.assertEqual(rows[0]['last_name'], "'-1+2")
+        self.assertEqual(rows[0]['username'], 'janedoe')
+        response = self.client.get(url, {'format': 'jsonl'})
+        self.assertEqual(json.loads(self._content(response))['first_name'], '@SUM(A1)')
+
+    def test_export_matches_as_json_lines(self):
+        self.client.login(email=self.user.email, password='Password123')
+        url = reverse('club_export', kwargs={'club_id': self.club.id, 'kind': 'matches'})
+        response = self.client.get(url, {'format': 'jsonl'})
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        rows = [json.loads(line) for line in self._content(response).splitlines()]
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]['match_id'], self.match.id)
+        self.assertEqual(rows[0]['player_2'], 'janedoe')
+        self.assertEqual(rows[0]['status'], Match.PENDING)
+
+    def test_export_only_contains_the_club(self):
+        self.client.login(email=self.user.email, password='Password123')
+        Membership.objects.create(user=User.objects.get(username='petrapickles'), club=self.other_club)
+        rows = list(csv.DictReader(io.StringIO(self._content(self.client.get(self.url)))))
+        self.assertNotIn('petrapickles', [row['username'] for row in rows])
+
+    def test_unknown_export_redirects(self):
+        self.client.login(email=self.user.email, password='Password123')
+        url = reverse('club_export', kwargs={'club_id': self.club.id, 'kind': 'passwords'})
+        response = self.client.get(url)
+        self.assertRedirects(response, reverse('members_list', kwargs={'club_id': self.club.id}),
+            status_code=302, target_status_code=200)
+        response = self.client.get(self.url, {'format': 'xml'})
+        self.assertEqual(response.status_code, 302)
+
+    def test_members_list_links_to_exports_for_officers(self):
+        self.client.login(email=self.user.email, password='Password123')
+        response = self.client.get(reverse('members_list', kwargs={'club_id': self.club.id}))
+        self.assertContains(response, f'{self.url}?format=csv')
+
+    def _content(self, response):
+        return b''.join(response.streaming_content).decode()
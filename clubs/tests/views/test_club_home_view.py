@@ -1,8 +1,12 @@
 """Tests of the club home view."""
 
+import datetime
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
-from clubs.models import User, Club, Membership
+from django.utils import timezone
+from clubs.models import User, Club, Match, Membership
 from clubs.tests.helpers import MenuTesterMixin, reverse_with_next
 
 
@@ -11,13 +15,15 @@ class ClubHomeViewTestCase(TestCase, MenuTesterMixin):
 
     fixtures = [
         'clubs/tests/fixtures/default_user.json',
-        'clubs/tests/fixtures/default_club.json'
+        'clubs/tests/fixtures/default_club.json',
+        'clubs/tests/fixtures/other_users.json'
     ]
 
-    def setUp(self):
-        self.user = User.objects.get(username='johndoe')
-        self.club = Club.objects.get(name='PolecatChess')
-        self.url = reverse('club_home', kwargs={'club_id': self.club.id})
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.get(username='johndoe')
+        cls.club = Club.objects.get(name='PolecatChess')
+        cls.url = reverse('club_home', kwargs={'club_id': cls.club.id})
 
     def test_club_home_url(self):
         self.assertEqual(self.url, '/club/' + str(self.club.id))
@@ -67,4 +73,27 @@ class ClubHomeViewTestCase(TestCase, MenuTesterMixin):
             pass
         url = reverse('leave_club', kwargs={'club_id': self.club.id})
         self.assertNotHTML(response, f'a[href="{url}"]')
-        member.delete()
\ No newline at end of file
+        member.delete()
+
+    def test_get_club_home_queries_do_not_grow_with_the_matches(self):
+        self.client.login(email=self.user.email, password='Password123')
+        Membership.objects.create(user=self.user, club=self.club, role=Membership.OFFICER)
+        players = [User.objects.get(username='janedoe'), User.objects.get(username='petrapickles')]
+        for player in players:
+            Membership.objects.create(user=player, club=self.club)
+        self._create_matches(players, 2)
+        with CaptureQueriesContext(connection) as few_matches:
+            self.client.get(self.url)
+        self._create_matches(players, 20)
+        with CaptureQueriesContext(connection) as many_matches:
+            response = self.client.get(self.url)
+        self.assertEqual(len(response.context['matches']), 22)
+        self.assertEqual(len(many_matches), len(few_matches))
+
+    def _create_matches(self, players, count):
+        now = timezone.now()
+        Match.objects.bulk_create([
+            Match(player_1=players[0], player_2=players[1], club=self.club, location='Bush House',
+                  date_time=now + datetime.timedelta(days=number - count // 2))
+            for number in range(count)
+        ])
@@ -0,0 +1,79 @@
+"""Tests of the club import view."""
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase
+from django.urls import reverse
+from clubs.models import User, Club, Membership
+from clubs.tests.helpers import reverse_with_next
+
+
+class ClubImportViewTestCase(TestCase):
+    """Unit tests of the club import view."""
+
+    fixtures = [
+        'clubs/tests/fixtures/default_user.json',
+        'clubs/tests/fixtures/other_users.json',
+        'clubs/tests/fixtures/default_club.json',
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.get(username='johndoe')
+        cls.member = User.objects.get(username='janedoe')
+        cls.club = Club.objects.get(name='PolecatChess')
+        Membership.objects.create(user=cls.user, club=cls.club, role=Membership.OFFICER)
+        Membership.objects.create(user=cls.member, club=cls.club)
+        cls.url = reverse('club_import', kwargs={'club_id': cls.club.id})
+
+    def test_club_import_url(self):
+        self.assertEqual(self.url, f'/club/{self.club.id}/import')
+
+    def test_import_redirects_when_not_logged_in(self):
+        redirect_url = reverse_with_next('log_in', self.url)
+        response = self.client.get(self.url)
+        self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
+
+    def test_import_as_member_redirects(self):
+        self.client.login(email=self.member.email, password='Password123')
+        response = self.client.get(self.url)
+        redirect_url = reverse('club_home', kwargs={'club_id': self.club.id})
+        self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
+
+    def test_get_import(self):
+        self.client.login(email=self.user.email, password='Password123')
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, 'club_templates/import.html')
+
+    def test_successful_import(self):
+        self.client.login(email=self.user.email, password='Password123')
+        response = self.client.post(self.url, {'kind': 'members', 'file': self._upload(
+            'username,first_name,last_name,email',
+            'magnus,Magnus,Carlsen,magnus@example.org',
+        )}, follow=True)
+        self.assertRedirects(response, reverse('members_list', kwargs={'club_id': self.club.id}),
+            status_code=302, target_status_code=200)
+        self.assertTrue(Membership.objects.filter(user__username='magnus', club=self.club).exists())
+
+    def test_invalid_rows_are_listed(self):
+        self.client.login(email=self.user.email, password='Password123')
+        response = self.client.post(self.url, {'kind': 'matches', 'file': self._upload(
+            'date_time,player_1,player_2,status',
+            '2020-01-10 18:00,johndoe,petrapickles,1-0',
+        )})
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'petrapickles is not a member of the club.')
+
+    def test_file_without_columns_shows_error(self):
+        self.client.login(email=self.user.email, password='Password123')
+        response = self.client.post(self.url, {'kind': 'members', 'file': self._upload('name', 'magnus')})
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'The file is missing the columns')
+
+    def test_members_list_links_to_import_for_officers(self):
+        self.client.login(email=self.user.email, password='Password123')
+        response = self.client.get(reverse('members_list', kwargs={'club_id': self.club.id}))
+        self.assertContains(response, self.url)
+
+    def _upload(self, *lines):
+        return SimpleUploadedFile('import.csv', ('﻿' + '\n'.join(lines) + '\n').encode(), content_type='text/csv')
@@ -0,0 +1,104 @@
+"""Tests of the club match events view."""
+
+from django.test import TestCase
+from django.urls import reverse
+from clubs.models import User, Club, Match, Membership, MatchEvent
+from clubs.tests.helpers import reverse_with_next
+from clubs.views.club_views.club_home_views import ClubMatchEventsView
+import datetime
+import pytz
+
+
+class ClubMatchEventsViewTestCase(TestCase):
+    """Unit tests of the club match events view."""
+
+    fixtures = [
+        'clubs/tests/fixtures/default_user.json',
+        'clubs/tests/fixtures/default_club.json',
+        'clubs/tests/fixtures/other_users.json',
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.utc = pytz.UTC
+        cls.user = User.objects.get(username='johndoe')
+        cls.other_user = User.objects.get(username='janedoe')
+        cls.club = Club.objects.get(name='PolecatChess')
+        Membership.objects.create(user=cls.user, club=cls.club, role=Membership.OFFICER)
+        Membership.objects.create(user=cls.other_user, club=cls.club)
+        cls.match = Match.objects.create(
+            player_1=cls.user,
+            player_2=cls.other_user,
+            club=cls.club,
+            location='Bush House',
+            date_time=cls.utc.localize(datetime.datetime(2030, 9, 25, 10, 30)),
+        )
+        cls.url = reverse('club_match_events', kwargs={'club_id': cls.club.id})
+
+    def test_club_match_events_url(self):
+        self.assertEqual(self.url, '/club/' + str(self.club.id) + '/match_events')
+
+    def test_get_club_match_events_redirects_when_not_logged_in(self):
+        redirect_url = reverse_with_next('log_in', self.url)
+        response = self.client.get(self.url)
+        self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
+
+    def test_get_club_match_events_redirects_when_not_a_member(self):
+        Membership.objects.filter(user=self.user).delete()
+        self.client.login(email=self.user.email, password='Password123')
+        response = self.client.get(self.url)
+        self.assertRedirects(response, reverse('applications'), status_code=302, target_status_code=200)
+
+    def test_get_starts_after_latest_event(self):
+        event = MatchEvent.publish(self.match, MatchEvent.CREATED)
+        self.client.login(email=self.user.email, password='Password123')
+        response = self.client.get(self.url)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertEqual(response.json(), {'last_event_id': event.id, 'events': []})
+
+    def test_get_returns_events_after_given_id(self):
+        first = MatchEvent.publish(self.match, MatchEvent.CREATED)
+        self.match.status = Match.CANCELLED
+        self.match.save()
+        second = MatchEvent.publish(self.match, MatchEvent.CANCELLED)
+        self.client.login(email=self.user.email, password='Password123')
+        response = self.client.get(self.url, {'after': first.id})
+        data = response.json()
+        self.assertEqual(data['last_event_id'], second.id)
+        self.assertEqual(len(data['events']), 1)
+        event = data['events'][0]
+        self.assertEqual(event['id'], second.id)
+        self.assertEqual(event['kind'], 'cancelled')
+        self.assertEqual(event['match_id'], self.match.id)
+        self.assertEqual(event['status'], Match.CANCELLED)
+        self.assertIn(f'data-match-id="{self.match.id}"', event['html'])
+
+    def test_get_without_new_events_keeps_given_id(self):
+        event = MatchEvent.publish(self.match, MatchEvent.CREATED)
+        self.client.login(email=self.user.email, password='Password123')
+        response = self.client.get(self.url, {'after': event.id})
+        self.assertEqual(response.json(), {'last_event_id': event.id, 'events': []})
+
+    def test_get_returns_a_limited_number_of_events(self):
+        for _ in range(ClubMatchEventsView.EVENTS_PER_REQUEST + 1):
+            MatchEvent.publish(self.match, MatchEvent.UPDATED)
+        self.client.login(email=self.user.email, password='Password123')
+        data = self.client.get(self.url, {'after': 0}).json()
+        self.assertEqual(len(data['events']), ClubMatchEventsView.EVENTS_PER_REQUEST)
+        self.assertEqual(data['last_event_id'], data['events'][-1]['id'])
+        data = self.client.get(self.url, {'after': data['last_event_id']}).json()
+        self.assertEqual(len(data['events']), 1)
+
+    def test_cancel_match_publishes_event(self):
+        self.client.login(email=self.user.email, password='Password123')
+        url = reverse('cancel_match', kwargs={'club_id': self.club.id, 'match_id': self.match.id})
+        self.client.post(url)
+        response = self.client.get(self.url, {'after': 0})
+        self.assertEqual([event['kind'] for event in response.json()['events']], ['cancelled'])
+
+    def test_forfeit_match_publishes_event(self):
+        self.client.login(email=self.user.email, password='Password123')
+        url = reverse('forfeit_match', kwargs={'club_id': self.club.id, 'match_id': self.match.id})
+        self.client.get(url)
+        response = self.client.get(self.url, {'after': 0})
+        self.assertEqual([event['kind'] for event in response.json()['events']], ['forfeited'])
@@ -0,0 +1,74 @@
+"""Tests of the cached "My clubs" menu."""
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from clubs.menus import club_menu
+from clubs.models import Club, Membership, User
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}, SHARED_CACHE=True)
+class ClubMenuTestCase(TestCase):
+    """Unit tests of the cached "My clubs" menu."""
+
+    fixtures = [
+        'clubs/tests/fixtures/default_user.json',
+        'clubs/tests/fixtures/default_club.json',
+        'clubs/tests/fixtures/other_clubs.json'
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.get(username='johndoe')
+        cls.club = Club.objects.get(name='PolecatChess')
+        cls.other_club = Club.objects.get(name='PolecatChess_2')
+        Membership.objects.create(user=cls.user, club=cls.club)
+
+    def setUp(self):
+        cache.clear()
+
+    def test_menu_lists_the_clubs_of_the_user(self):
+        self.assertEqual(club_menu(self.user.id), [{'id': self.club.id, 'name': self.club.name}])
+
+    def test_warm_menu_costs_no_queries(self):
+        club_menu(self.user.id)
+        with self.assertNumQueries(0):
+            club_menu(self.user.id)
+
+    def test_joining_a_club_invalidates_the_menu(self):
+        club_menu(self.user.id)
+        with self.captureOnCommitCallbacks(execute=True):
+            Membership.objects.create(user=self.user, club=self.other_club)
+        self.assertIn({'id': self.other_club.id, 'name': self.other_club.name}, club_menu(self.user.id))
+
+    def test_leaving_a_club_invalidates_the_menu(self):
+        club_menu(self.user.id)
+        with self.captureOnCommitCallbacks(execute=True):
+            Membership.objects.get(user=self.user, club=self.club).delete()
+        self.assertEqual(club_menu(self.user.id), [])
+
+    def test_renaming_a_club_invalidates_the_menu(self):
+        club_menu(self.user.id)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.club.name = 'RenamedChess'
+            self.club.save()
+        self.assertEqual(club_menu(self.user.id), [{'id': self.club.id, 'name': 'RenamedChess'}])
+
+    def test_menu_is_shown_in_the_navbar(self):
+        self.client.login(email=self.user.email, password='Password123')
+        response = self.client.get(reverse('dashboard'))
+        self.assertContains(response, 'id="my-clubs-dropdown"')
+        self.assertContains(response, f'href="{reverse("club_home", kwargs={"club_id": self.club.id})}"')
+
+    def test_menu_is_not_shown_without_clubs(self):
+        Membership.objects.filter(user=self.user).delete()
+        self.client.login(email=self.user.email, password='Password123')
+        response = self.client.get(reverse('dashboard'))
+        self.assertNotContains(response, 'id="my-clubs-dropdown"')
+
+    @override_settings(SHARED_CACHE=False)
+    def test_menu_is_not_cached_without_a_shared_cache(self):
+        club_menu(self.user.id)
+        with self.assertNumQueries(1):
+            self.assertEqual(club_menu(self.user.id), [{'id': self.club.id, 'name': self.club.name}])
+        self.assertIsNone(cache.get(f'club_menu_version:{self.user.id}'))
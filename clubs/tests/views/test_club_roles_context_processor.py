@@ -0,0 +1,68 @@
+"""Tests of the club roles context processor."""
+
+from django.contrib.auth.models import AnonymousUser
+from django.test import RequestFactory, TestCase
+from django.urls import resolve, reverse
+from clubs.context_processors import club_roles
+from clubs.models import Club, Membership, User
+
+
+class ClubRolesContextProcessorTestCase(TestCase):
+    """Unit tests of the club roles context processor."""
+
+    fixtures = [
+        'clubs/tests/fixtures/default_user.json',
+        'clubs/tests/fixtures/default_club.json',
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.get(username='johndoe')
+        cls.club = Club.objects.get(name='PolecatChess')
+        cls.url = reverse('club_home', kwargs={'club_id': cls.club.id})
+
+    def _request(self, url=None, user=None):
+        request = RequestFactory().get(url or self.url)
+        request.resolver_match = resolve(url or self.url)
+        request.user = user or self.user
+        return request
+
+    def _flags(self, context):
+        return (
+            bool(context['logged_in_user_is_member']),
+            bool(context['logged_in_user_is_officer']),
+            bool(context['logged_in_user_is_owner']),
+        )
+
+    def test_flags_of_each_role(self):
+        membership = Membership.objects.create(user=self.user, club=self.club, role=Membership.MEMBER)
+        expected = {
+            Membership.MEMBER: (True, False, False),
+            Membership.OFFICER: (True, True, False),
+            Membership.OWNER: (True, True, True),
+        }
+        for role, flags in expected.items():
+            membership.role = role
+            membership.save()
+            self.assertEqual(self._flags(club_roles(self._request())), flags)
+
+    def test_flags_of_a_user_who_is_not_a_member(self):
+        self.assertEqual(self._flags(club_roles(self._request())), (False, False, False))
+
+    def test_flags_of_an_anonymous_user(self):
+        with self.assertNumQueries(0):
+            self.assertEqual(self._flags(club_roles(self._request(user=AnonymousUser()))), (False, False, False))
+
+    def test_flags_are_not_computed_until_used(self):
+        with self.assertNumQueries(0):
+            club_roles(self._request())
+
+    def test_flags_share_one_query_per_request(self):
+        Membership.objects.create(user=self.user, club=self.club, role=Membership.OFFICER)
+        request = self._request()
+        with self.assertNumQueries(1):
+            self._flags(club_roles(request))
+            self._flags(club_roles(request))
+
+    def test_no_flags_outside_of_a_club(self):
+        self.assertEqual(club_roles(self._request(reverse('dashboard'))), {})
@@ -12,10 +12,11 @@ class CreateClubViewTestCase(TestCase, LogInTester):
 
     fixtures = ['clubs/tests/fixtures/default_user.json']
 
-    def setUp(self):
-        self.url = reverse('create_club')
-        self.user = User.objects.get(username='johndoe')
-        self.form_input = {
+    @classmethod
+    def setUpTestData(cls):
+        cls.url = reverse('create_club')
+        cls.user = User.objects.get(username='johndoe')
+        cls.form_input = {
             'name': 'PolecatChess2',
             'location': 'London',
             'description': 'Welcome to Polecat chess club!'
@@ -20,26 +20,27 @@ class CreateClubViewTestCase(TestCase, LogInTester, MenuTesterMixin):
         'clubs/tests/fixtures/other_clubs.json'
     ]
 
-    def setUp(self):
-        self.utc = pytz.UTC
-        self.user1 = User.objects.get(username='johndoe')
-        self.user2 = User.objects.get(username='petrapickles')
-        self.club = Club.objects.get(name='PolecatChess')
-        self.url = reverse('create_match', kwargs={'club_id': self.club.id})
-        self.match_time = self.utc.localize(
+    @classmethod
+    def setUpTestData(cls):
+        cls.utc = pytz.UTC
+        cls.user1 = User.objects.get(username='johndoe')
+        cls.user2 = User.objects.get(username='petrapickles')
+        cls.club = Club.objects.get(name='PolecatChess')
+        cls.url = reverse('create_match', kwargs={'club_id': cls.club.id})
+        cls.match_time = cls.utc.localize(
             datetime.datetime(2022, 9, 25, 14, 40))
-        self.usr1application = self._create_application(self.user1)
-        self.usr2application = self._create_application(self.user2)
-        self.membership1 = self._create_membership(self.user1,
+        cls.usr1application = cls._create_application(cls.user1)
+        cls.usr2application = cls._create_application(cls.user2)
+        cls.membership1 = cls._create_membership(cls.user1,
                                                    Membership.OFFICER)
-        self.membership2 = self._create_membership(self.user2,
+        cls.membership2 = cls._create_membership(cls.user2,
                                                    Membership.MEMBER)
         Match.objects.all().delete()
-        self.form_input = {
-            'player_1': self.user1.id,
-            'player_2': self.user2.id,
+        cls.form_input = {
+            'player_1': cls.user1.id,
+            'player_2': cls.user2.id,
             'location': 'Bush House',
-            'date_time': self.match_time
+            'date_time': cls.match_time
         }
 
     def test_create_match_url(self):
@@ -125,12 +126,14 @@ class CreateClubViewTestCase(TestCase, LogInTester, MenuTesterMixin):
         after_count = Match.objects.count()
         self.assertEqual(after_count, before_count + 1)
 
-    def _create_application(self, user):
+    @classmethod
+    def _create_application(cls, user):
         return Application.objects.create(
             user=user,
-            club=self.club,
+            club=cls.club,
             personal_statement="personal statement",
             status=Application.ACCEPTED)
 
-    def _create_membership(self, user, role):
-        return Membership.objects.create(user=user, club=self.club, role=role)
+    @classmethod
+    def _create_membership(cls, user, role):
+        return Membership.objects.create(user=user, club=cls.club, role=role)
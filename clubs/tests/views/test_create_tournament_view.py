@@ -0,0 +1,86 @@
+"""Tests of the create tournament view."""
+
+from django.test import TestCase
+from django.urls import reverse
+from clubs.forms import CreateTournamentForm
+from clubs.models import User, Club, Membership, Tournament
+from clubs.tests.helpers import MenuTesterMixin, reverse_with_next
+
+
+class CreateTournamentViewTestCase(TestCase, MenuTesterMixin):
+    """Unit tests of the create tournament view."""
+
+    fixtures = [
+        'clubs/tests/fixtures/default_user.json',
+        'clubs/tests/fixtures/other_users.json',
+        'clubs/tests/fixtures/default_club.json',
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.get(username='johndoe')
+        cls.member = User.objects.get(username='janedoe')
+        cls.club = Club.objects.get(name='PolecatChess')
+        Membership.objects.create(user=cls.user, club=cls.club, role=Membership.OFFICER)
+        Membership.objects.create(user=cls.member, club=cls.club)
+        cls.url = reverse('create_tournament', kwargs={'club_id': cls.club.id})
+        cls.form_input = {'name': 'Winter Open', 'location': 'Bush House', 'rounds': 5}
+
+    def test_create_tournament_url(self):
+        self.assertEqual(self.url, '/club/' + str(self.club.id) + '/create_tournament')
+
+    def test_get_create_tournament(self):
+        self.client.login(email=self.user.email, password='Password123')
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, 'club_templates/create_tournament.html')
+        form = response.context['form']
+        self.assertTrue(isinstance(form, CreateTournamentForm))
+        self.assertEqual(form.initial['location'], self.club.location)
+        self.assert_officer_menu(response, self.club.id)
+
+    def test_get_create_tournament_redirects_when_not_logged_in(self):
+        redirect_url = reverse_with_next('log_in', self.url)
+        response = self.client.get(self.url)
+        self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
+
+    def test_successful_create_tournament_enters_every_member(self):
+        self.client.login(email=self.user.email, password='Password123')
+        response = self.client.post(self.url, self.form_input, follow=True)
+        tournament = Tournament.objects.get(name='Winter Open')
+        redirect_url = reverse('show_tournament', kwargs={'club_id': self.club.id, 'tournament_id': tournament.id})
+        self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
+        self.assertEqual(set(tournament.players.all()), {self.user, self.member})
+
+    def test_unsuccessful_create_tournament(self):
+        self.client.login(email=self.user.email, password='Password123')
+        self.form_input['rounds'] = 0
+        response = self.client.post(self.url, self.form_input)
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, 'club_templates/create_tournament.html')
+        self.assertEqual(Tournament.objects.count(), 0)
+
+    def test_create_tournament_as_member_redirects(self):
+        self.client.login(email=self.member.email, password='Password123')
+        response = self.client.post(self.url, self.form_input)
+        redirect_url = reverse('club_home', kwargs={'club_id': self.club.id})
+        self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
+        self.assertEqual(Tournament.objects.count(), 0)
+
+    def test_create_round_robin_schedules_every_round(self):
+        self.client.login(email=self.user.email, password='Password123')
+        self.form_input.update({'format': Tournament.ROUND_ROBIN, 'rounds': '', 'starts_at': '2030-01-01 10:00'})
+        self.client.post(self.url, self.form_input, follow=True)
+        tournament = Tournament.objects.get(name='Winter Open')
+        self.assertEqual(tournament.current_round, tournament.rounds)
+        self.assertEqual(tournament.match_set.count(), 1)
+
+    def test_create_knockout_with_one_member_shows_an_error(self):
+        self.client.login(email=self.user.email, password='Password123')
+        Membership.objects.filter(user=self.member).delete()
+        self.form_input.update({'format': Tournament.KNOCKOUT, 'rounds': '', 'starts_at': '2030-01-01 10:00'})
+        response = self.client.post(self.url, self.form_input)
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, 'club_templates/create_tournament.html')
+        self.assertContains(response, 'A knockout tournament needs at least two entrants.')
+        self.assertEqual(Tournament.objects.count(), 0)
@@ -15,10 +15,11 @@ class ClubListTest(TestCase, MenuTesterMixin):
         'clubs/tests/fixtures/other_clubs.json'
     ]
 
-    def setUp(self):
-        self.user = User.objects.get(username='johndoe')
-        self.club = Club.objects.get(name='PolecatChess')
-        self.url = reverse('dashboard')
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.get(username='johndoe')
+        cls.club = Club.objects.get(name='PolecatChess')
+        cls.url = reverse('dashboard')
 
     def test_club_list_url(self):
         self.assertEqual(self.url, '/dashboard/')
@@ -1,8 +1,9 @@
 """Tests of the delete club view."""
 
+from django.core import mail
 from django.test import TestCase
 from django.urls import reverse
-from clubs.models import User, Membership, Application, Club
+from clubs.models import User, Membership, Application, Club, DeletionJob
 from clubs.tests.helpers import reverse_with_next
 
 
@@ -15,18 +16,19 @@ class DeleteClubTestCase(TestCase):
         'clubs/tests/fixtures/other_clubs.json'
     ]
 
-    def setUp(self):
-        self.club = Club.objects.get(name='PolecatChess')
-        self.user = User.objects.get(username='johndoe')
-        self.user_application = Application.objects.create(
-            user=self.user,
-            club=self.club,
+    @classmethod
+    def setUpTestData(cls):
+        cls.club = Club.objects.get(name='PolecatChess')
+        cls.user = User.objects.get(username='johndoe')
+        cls.user_application = Application.objects.create(
+            user=cls.user,
+            club=cls.club,
             personal_statement="User one personal statement",
             status=Application.ACCEPTED)
-        self.membership = Membership.objects.create(user=self.user,
-                                                    club=self.club,
+        cls.membership = Membership.objects.create(user=cls.user,
+                                                    club=cls.club,
                                                     role=Membership.OWNER)
-        self.url = reverse('delete_club', kwargs={'club_id': self.club.id})
+        cls.url = reverse('delete_club', kwargs={'club_id': cls.club.id})
 
     def test_delete_club_url(self):
         self.client.login(email=self.user.email, password="Password123")
@@ -71,6 +73,16 @@ class DeleteClubTestCase(TestCase):
                              status_code=302,
                              target_status_code=200)
 
+    def test_delete_club_hides_the_club_and_queues_its_purge(self):
+        self.client.login(email=self.user.email, password="Password123")
+        self.client.post(self.url)
+        self.assertFalse(Club.objects.filter(id=self.club.id).exists())
+        self.assertTrue(Membership.objects.filter(club_id=self.club.id).exists())
+        self.assertTrue(DeletionJob.objects.filter(kind=DeletionJob.CLUB, target_id=self.club.id).exists())
+        self.assertEqual(len(mail.outbox), 0)
+        response = self.client.get(reverse('club_home', kwargs={'club_id': self.club.id}))
+        self.assertRedirects(response, reverse('dashboard'), status_code=302, target_status_code=200)
+
     def test_delete_club_when_not_owner(self):
         self.client.login(email=self.user.email, password="Password123")
         self.membership.role = Membership.MEMBER
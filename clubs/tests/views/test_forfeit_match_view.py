@@ -2,6 +2,7 @@
 
 from django.test import TestCase
 from django.urls import reverse
+from clubs.deletion import delete_club
 from clubs.models import Match, Club, User, Application, Membership
 from clubs.tests.helpers import reverse_with_next
 import pytz
@@ -18,34 +19,35 @@ class ForfeitMatchViewTestCase(TestCase):
         'clubs/tests/fixtures/other_clubs.json',
     ]
 
-    def setUp(self):
-        self.utc = pytz.UTC
-        self.club = Club.objects.get(name='PolecatChess')
-        self.player1 = User.objects.get(username='johndoe')
-        self.player2 = User.objects.get(username='janedoe')
-        self.player3 = User.objects.get(username='petrapickles')
-        self.player1application = self._create_application(self.player1)
-        self.player2application = self._create_application(self.player2)
-        self.player3application = self._create_application(self.player3)
-        self.membership1 = self._create_membership(self.player1,
+    @classmethod
+    def setUpTestData(cls):
+        cls.utc = pytz.UTC
+        cls.club = Club.objects.get(name='PolecatChess')
+        cls.player1 = User.objects.get(username='johndoe')
+        cls.player2 = User.objects.get(username='janedoe')
+        cls.player3 = User.objects.get(username='petrapickles')
+        cls.player1application = cls._create_application(cls.player1)
+        cls.player2application = cls._create_application(cls.player2)
+        cls.player3application = cls._create_application(cls.player3)
+        cls.membership1 = cls._create_membership(cls.player1,
                                                    Membership.OFFICER)
-        self.membership2 = self._create_membership(self.player2,
+        cls.membership2 = cls._create_membership(cls.player2,
                                                    Membership.MEMBER)
-        self.membership3 = self._create_membership(self.player3,
+        cls.membership3 = cls._create_membership(cls.player3,
                                                    Membership.MEMBER)
-        self.match = Match.objects.create(
-            player_1=self.player1,
-            player_2=self.player2,
-            club=self.club,
+        cls.match = Match.objects.create(
+            player_1=cls.player1,
+            player_2=cls.player2,
+            club=cls.club,
             location='Bush House',
-            date_time=self.utc.localize(datetime.datetime(2024, 9, 25, 10,
+            date_time=cls.utc.localize(datetime.datetime(2024, 9, 25, 10,
                                                           30)),
             status=Match.PENDING,
             id=1)
-        self.url = reverse('forfeit_match',
+        cls.url = reverse('forfeit_match',
                            kwargs={
-                               'club_id': self.club.id,
-                               'match_id': self.match.id
+                               'club_id': cls.club.id,
+                               'match_id': cls.match.id
                            })
 
     def test_forfeit_match_url(self):
@@ -155,6 +157,13 @@ class ForfeitMatchViewTestCase(TestCase):
                              status_code=302,
                              target_status_code=200)
 
+    def test_cannot_forfeit_match_of_a_deleted_club(self):
+        self.client.login(email=self.player2.email, password='Password123')
+        delete_club(self.club)
+        self.client.get(self.url)
+        self.match.refresh_from_db()
+        self.assertEqual(self.match.status, Match.PENDING)
+
     def test_forfeit_nonexisting_match(self):
         self.client.login(email=self.player1.email, password='Password123')
         url = reverse('forfeit_match',
@@ -225,12 +234,14 @@ class ForfeitMatchViewTestCase(TestCase):
             status=Match.PENDING,
             id=2)
 
-    def _create_application(self, user):
+    @classmethod
+    def _create_application(cls, user):
         return Application.objects.create(
             user=user,
-            club=self.club,
+            club=cls.club,
             personal_statement="personal statement",
             status=Application.ACCEPTED)
 
-    def _create_membership(self, user, role):
-        return Membership.objects.create(user=user, club=self.club, role=role)
+    @classmethod
+    def _create_membership(cls, user, role):
+        return Membership.objects.create(user=user, club=cls.club, role=role)
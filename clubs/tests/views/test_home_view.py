@@ -10,9 +10,10 @@ class HomeViewTestCase(TestCase, MenuTesterMixin):
 
     fixtures = ['clubs/tests/fixtures/default_user.json']
 
-    def setUp(self):
-        self.url = reverse('home')
-        self.user = User.objects.get(username='johndoe')
+    @classmethod
+    def setUpTestData(cls):
+        cls.url = reverse('home')
+        cls.user = User.objects.get(username='johndoe')
 
     def test_home_url(self):
         self.assertEqual(self.url, '/')
@@ -33,3 +34,10 @@ class HomeViewTestCase(TestCase, MenuTesterMixin):
                              target_status_code=200)
         self.assertTemplateUsed(response, 'account_templates/dashboard.html')
         self.assert_logged_in_menu(response)
+
+    def test_home_inlines_critical_styles_and_preloads_bootstrap(self):
+        response = self.client.get(self.url)
+        self.assertContains(response, '--bs-primary: #2c3e50;')
+        self.assertContains(response, '.navbar-brand {')
+        self.assertContains(response, '<link rel="preload" href="/static/bootstrap.css" as="style"')
+        self.assertContains(response, '<noscript>')
@@ -1,8 +1,10 @@
 """Tests of the leave club view."""
 
+import datetime
 from django.test import TestCase
 from django.urls import reverse
-from clubs.models import User, Membership, Application, Club
+from django.utils import timezone
+from clubs.models import User, Membership, Application, Club, Match
 from clubs.tests.helpers import reverse_with_next
 
 
@@ -11,17 +13,19 @@ class LeaveClubTestCase(TestCase):
 
     fixtures = [
         'clubs/tests/fixtures/default_user.json',
-        'clubs/tests/fixtures/default_club.json'
+        'clubs/tests/fixtures/default_club.json',
+        'clubs/tests/fixtures/other_users.json'
     ]
 
-    def setUp(self):
-        self.club = Club.objects.get(name='PolecatChess')
-        self.user = User.objects.get(username='johndoe')
-        self.user_application = Application.objects.create(
-            user=self.user,
-            club=self.club,
+    @classmethod
+    def setUpTestData(cls):
+        cls.club = Club.objects.get(name='PolecatChess')
+        cls.user = User.objects.get(username='johndoe')
+        cls.user_application = Application.objects.create(
+            user=cls.user,
+            club=cls.club,
             personal_statement="User one personal statement")
-        self.url = reverse('leave_club', kwargs={'club_id': self.club.id})
+        cls.url = reverse('leave_club', kwargs={'club_id': cls.club.id})
 
     def test_leave_club_url(self):
         self.client.login(email=self.user.email, password="Password123")
@@ -145,4 +149,17 @@ class LeaveClubTestCase(TestCase):
                                   club=self.club,
                                   role=Membership.OWNER)
         response = self.client.get(self.url)
-        self.assertEqual(200, response.status_code)
\ No newline at end of file
+        self.assertEqual(200, response.status_code)
+
+    def test_leaving_club_cancels_pending_matches(self):
+        self.client.login(email=self.user.email, password="Password123")
+        self.user_application.status = Application.ACCEPTED
+        self.user_application.save()
+        opponent = User.objects.get(username='janedoe')
+        Membership.objects.create(user=self.user, club=self.club, role=Membership.MEMBER)
+        Membership.objects.create(user=opponent, club=self.club, role=Membership.MEMBER)
+        match = Match.objects.create(player_1=opponent, player_2=self.user, club=self.club, location='Strand',
+            date_time=timezone.now() + datetime.timedelta(days=1))
+        self.client.post(self.url)
+        self.assertFalse(Membership.objects.filter(user=self.user, club=self.club).exists())
+        self.assertEqual(Match.objects.get(id=match.id).status, Match.CANCELLED)
@@ -13,9 +13,10 @@ class LogInViewTestCase(TestCase, LogInTester, MenuTesterMixin):
 
     fixtures = ['clubs/tests/fixtures/default_user.json']
 
-    def setUp(self):
-        self.url = reverse('log_in')
-        self.user = User.objects.get(username='johndoe')
+    @classmethod
+    def setUpTestData(cls):
+        cls.url = reverse('log_in')
+        cls.user = User.objects.get(username='johndoe')
 
     def test_log_in_url(self):
         self.assertEqual(self.url, '/log_in/')
@@ -11,9 +11,10 @@ class LogOutViewTestCase(TestCase, LogInTester, MenuTesterMixin):
 
     fixtures = ['clubs/tests/fixtures/default_user.json']
 
-    def setUp(self):
-        self.url = reverse('log_out')
-        self.user = User.objects.get(username='johndoe')
+    @classmethod
+    def setUpTestData(cls):
+        cls.url = reverse('log_out')
+        cls.user = User.objects.get(username='johndoe')
 
     def test_log_out_url(self):
         self.assertEqual(self.url, '/log_out/')
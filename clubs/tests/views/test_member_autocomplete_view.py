@@ -0,0 +1,58 @@
+"""Tests of the member autocomplete view."""
+
+from django.test import TestCase
+from django.urls import reverse
+from clubs.models import Club, Membership, User
+from clubs.tests.helpers import reverse_with_next
+
+
+class MemberAutocompleteViewTestCase(TestCase):
+    """Unit tests of the member autocomplete view."""
+
+    fixtures = [
+        'clubs/tests/fixtures/default_user.json',
+        'clubs/tests/fixtures/other_users.json',
+        'clubs/tests/fixtures/default_club.json',
+        'clubs/tests/fixtures/other_clubs.json'
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.get(username='johndoe')
+        cls.member = User.objects.get(username='petrapickles')
+        cls.club = Club.objects.get(name='PolecatChess')
+        cls.other_club = Club.objects.get(name='PolecatChess_2')
+        Membership.objects.create(user=cls.user, club=cls.club, role=Membership.OFFICER)
+        Membership.objects.create(user=cls.member, club=cls.club)
+        Membership.objects.create(user=User.objects.get(username='peterpickles'), club=cls.other_club)
+        cls.url = reverse('member_autocomplete', kwargs={'club_id': cls.club.id})
+
+    def test_member_autocomplete_url(self):
+        self.assertEqual(self.url, f'/club/{self.club.id}/autocomplete/members/')
+
+    def test_members_are_found_by_the_start_of_their_names_ignoring_case(self):
+        self.client.login(email=self.user.email, password='Password123')
+        expected = {'results': [{'id': self.member.id, 'name': 'Petra Pickles (petrapickles)'}]}
+        for query in ['petra', 'PICK', 'petrap', 'Petra Pi']:
+            response = self.client.get(self.url, {'q': query})
+            self.assertEqual(response.json(), expected, query)
+
+    def test_only_members_of_the_club_are_returned(self):
+        self.client.login(email=self.user.email, password='Password123')
+        response = self.client.get(self.url, {'q': 'pe'})
+        self.assertEqual([result['id'] for result in response.json()['results']], [self.member.id])
+
+    def test_names_only_containing_the_query_are_not_returned(self):
+        self.client.login(email=self.user.email, password='Password123')
+        response = self.client.get(self.url, {'q': 'ickles'})
+        self.assertEqual(response.json(), {'results': []})
+
+    def test_member_autocomplete_redirects_when_not_a_member(self):
+        self.client.login(email=self.user.email, password='Password123')
+        url = reverse('member_autocomplete', kwargs={'club_id': self.other_club.id})
+        response = self.client.get(url)
+        self.assertRedirects(response, reverse('applications'), status_code=302, target_status_code=200)
+
+    def test_member_autocomplete_redirects_when_not_logged_in(self):
+        response = self.client.get(self.url)
+        self.assertRedirects(response, reverse_with_next('log_in', self.url), status_code=302, target_status_code=200)
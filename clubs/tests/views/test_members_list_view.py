@@ -17,18 +17,19 @@ class UserListTest(TestCase, MenuTesterMixin):
         'clubs/tests/fixtures/other_users.json'
     ]
 
-    def setUp(self):
-        self.club = Club.objects.get(name='PolecatChess')
-        self.url = reverse('members_list', kwargs={'club_id': self.club.id})
-        self.first_user = User.objects.get(username='johndoe')
-        self.user1application = Application.objects.create(
-            user=self.first_user,
-            club=self.club,
+    @classmethod
+    def setUpTestData(cls):
+        cls.club = Club.objects.get(name='PolecatChess')
+        cls.url = reverse('members_list', kwargs={'club_id': cls.club.id})
+        cls.first_user = User.objects.get(username='johndoe')
+        cls.user1application = Application.objects.create(
+            user=cls.first_user,
+            club=cls.club,
             personal_statement="1st user's personal statement")
-        self.second_user = User.objects.get(username='janedoe')
-        self.user2application = Application.objects.create(
-            user=self.second_user,
-            club=self.club,
+        cls.second_user = User.objects.get(username='janedoe')
+        cls.user2application = Application.objects.create(
+            user=cls.second_user,
+            club=cls.club,
             personal_statement="2nd user's personal statement")
 
     def test_members_list_url(self):
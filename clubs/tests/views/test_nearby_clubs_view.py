@@ -0,0 +1,66 @@
+"""Tests of the nearby clubs view."""
+
+from django.contrib import messages
+from django.test import TestCase
+from django.urls import reverse
+from clubs.models import User, Club, Membership
+from clubs.tests.helpers import MenuTesterMixin, reverse_with_next
+
+
+class NearbyClubsViewTestCase(TestCase, MenuTesterMixin):
+    """Unit tests of the nearby clubs view."""
+
+    fixtures = [
+        'clubs/tests/fixtures/default_user.json',
+        'clubs/tests/fixtures/other_users.json',
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.get(username='johndoe')
+        cls.owner = User.objects.get(username='janedoe')
+        cls.strand = Club.objects.create(name='Strand', location='Strand', description='Strand club')
+        cls.leeds = Club.objects.create(name='Leeds', location='Leeds', description='Leeds club')
+        for club in (cls.strand, cls.leeds):
+            Membership.objects.create(user=cls.owner, club=club, role=Membership.OWNER)
+        cls.url = reverse('nearby_clubs')
+
+    def test_nearby_clubs_url(self):
+        self.assertEqual(self.url, '/nearby_clubs/')
+
+    def test_nearby_clubs_redirects_when_not_logged_in(self):
+        redirect_url = reverse_with_next('log_in', self.url)
+        response = self.client.get(self.url)
+        self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
+
+    def test_get_nearby_clubs_without_place(self):
+        self.client.login(email=self.user.email, password='Password123')
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, 'home_templates/nearby_clubs.html')
+        self.assertNotIn('clubs', response.context)
+        self.assert_logged_in_menu(response)
+
+    def test_get_nearby_clubs_of_a_place(self):
+        Membership.objects.create(user=self.user, club=self.leeds)
+        self.client.login(email=self.user.email, password='Password123')
+        response = self.client.get(self.url, {'near': 'Waterloo'})
+        self.assertEqual(response.context['clubs'], [self.strand, self.leeds])
+        self.assertEqual(response.context['my_club_ids'], {self.leeds.id})
+        with self.assertHTML(response, f'a[href="{reverse("application", kwargs={"club_id": self.strand.id})}"]'):
+            pass
+        with self.assertHTML(response, f'a[href="{reverse("club_home", kwargs={"club_id": self.leeds.id})}"]'):
+            pass
+
+    def test_get_nearby_clubs_of_browser_position(self):
+        self.client.login(email=self.user.email, password='Password123')
+        response = self.client.get(self.url, {'latitude': '53.8', 'longitude': '-1.55'})
+        self.assertEqual(response.context['clubs'], [self.leeds, self.strand])
+
+    def test_get_nearby_clubs_of_unknown_place(self):
+        self.client.login(email=self.user.email, password='Password123')
+        response = self.client.get(self.url, {'near': 'Atlantis'})
+        self.assertNotIn('clubs', response.context)
+        messages_list = list(response.context['messages'])
+        self.assertEqual(len(messages_list), 1)
+        self.assertEqual(messages_list[0].level, messages.ERROR)
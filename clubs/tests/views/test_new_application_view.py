@@ -1,6 +1,8 @@
 """Tests of the new application view."""
 
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from clubs.forms import ApplicationForm
 from clubs.models import User
@@ -17,14 +19,15 @@ class ApplicationViewTestCase(TestCase, MenuTesterMixin):
         'clubs/tests/fixtures/other_users.json'
     ]
 
-    def setUp(self):
-        self.club = Club.objects.get(name='PolecatChess')
-        self.user = User.objects.get(username='johndoe')
-        self.form_input = {
-            'club': 'PolecatChess',
+    @classmethod
+    def setUpTestData(cls):
+        cls.club = Club.objects.get(name='PolecatChess')
+        cls.user = User.objects.get(username='johndoe')
+        cls.form_input = {
+            'club': cls.club.id,
             'personal_statement': 'My personal statement'
         }
-        self.url = reverse('application')
+        cls.url = reverse('application')
 
     def test_application_url(self):
         self.assertEqual(self.url, '/application/')
@@ -70,6 +73,16 @@ class ApplicationViewTestCase(TestCase, MenuTesterMixin):
         self.assertTrue(isinstance(form, ApplicationForm))
         self.assertFalse(form.is_bound)
 
+    def test_get_application_does_not_list_every_club(self):
+        self.client.login(email='johndoe@example.org', password='Password123')
+        Club.objects.create(name='Knights', location='London', description='Another club')
+        url = reverse('application', kwargs={'club_id': self.club.id})
+        response = self.client.get(url)
+        self.assertNotContains(response, '<option')
+        self.assertNotContains(response, 'Knights')
+        self.assertContains(response, f'name="club" id="id_club_value" value="{self.club.id}"')
+        self.assertContains(response, 'value="PolecatChess"')
+
     def test_invalid_application(self):
         self.client.login(email='johndoe@example.org', password='Password123')
         self.form_input['personal_statement'] = ''
@@ -109,6 +122,20 @@ class ApplicationViewTestCase(TestCase, MenuTesterMixin):
         self.assertTemplateUsed(response,
                                 'application_templates/new_application.html')
 
+    def test_queries_do_not_grow_with_the_application_history(self):
+        self.client.login(email='johndoe@example.org', password='Password123')
+        Application.objects.create(user=self.user, club=self.club, personal_statement='Old', status=Application.REJECTED)
+        with CaptureQueriesContext(connection) as short_history:
+            self.client.post(self.url, self.form_input)
+        Application.objects.filter(user=self.user).delete()
+        Application.objects.bulk_create([
+            Application(user=self.user, club=self.club, personal_statement='Old', status=Application.REJECTED)
+            for number in range(20)
+        ])
+        with CaptureQueriesContext(connection) as long_history:
+            self.client.post(self.url, self.form_input)
+        self.assertEqual(len(long_history), len(short_history))
+
     def test_create_second_application_after_first_one_is_rejected_allowed(
             self):
         self.client.login(email='johndoe@example.org', password='Password123')
@@ -0,0 +1,71 @@
+"""Tests of the pair tournament round view."""
+
+from django.test import TestCase
+from django.urls import reverse
+from clubs.models import User, Club, Match, Membership, Tournament, enter_club_members
+from clubs.tests.helpers import reverse_with_next
+import datetime
+import pytz
+
+
+class PairTournamentRoundViewTestCase(TestCase):
+    """Unit tests of the pair tournament round view."""
+
+    fixtures = [
+        'clubs/tests/fixtures/default_user.json',
+        'clubs/tests/fixtures/other_users.json',
+        'clubs/tests/fixtures/default_club.json',
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.get(username='johndoe')
+        cls.club = Club.objects.get(name='PolecatChess')
+        for user in User.objects.all():
+            Membership.objects.create(user=user, club=cls.club)
+        Membership.objects.filter(user=cls.user).update(role=Membership.OFFICER)
+        cls.tournament = Tournament.objects.create(club=cls.club, name='Winter Open', location='Bush House', rounds=3)
+        enter_club_members(cls.tournament)
+        cls.url = reverse('pair_tournament_round', kwargs={'club_id': cls.club.id, 'tournament_id': cls.tournament.id})
+        cls.redirect_url = reverse('show_tournament', kwargs={'club_id': cls.club.id, 'tournament_id': cls.tournament.id})
+        cls.form_input = {'date_time': '2030-09-25 10:30:00'}
+
+    def test_pair_tournament_round_url(self):
+        self.assertEqual(self.url, '/club/' + str(self.club.id) + '/tournament/' + str(self.tournament.id) + '/pair_round')
+
+    def test_post_pair_tournament_round(self):
+        self.client.login(email=self.user.email, password='Password123')
+        response = self.client.post(self.url, self.form_input, follow=True)
+        self.assertRedirects(response, self.redirect_url, status_code=302, target_status_code=200)
+        self.assertEqual(Match.objects.filter(tournament=self.tournament, round=1).count(), 2)
+        self.tournament.refresh_from_db()
+        self.assertEqual(self.tournament.current_round, 1)
+
+    def test_post_pair_tournament_round_with_date_in_the_past(self):
+        self.client.login(email=self.user.email, password='Password123')
+        self.form_input['date_time'] = '2020-09-25 10:30:00'
+        response = self.client.post(self.url, self.form_input, follow=True)
+        self.assertRedirects(response, self.redirect_url, status_code=302, target_status_code=200)
+        self.assertEqual(Match.objects.count(), 0)
+
+    def test_post_pair_tournament_round_with_pending_matches(self):
+        self.client.login(email=self.user.email, password='Password123')
+        self.client.post(self.url, self.form_input)
+        response = self.client.post(self.url, self.form_input, follow=True)
+        self.assertRedirects(response, self.redirect_url, status_code=302, target_status_code=200)
+        self.assertEqual(Match.objects.count(), 2)
+        messages_list = [str(message) for message in response.context['messages']]
+        self.assertIn('Every match of the current round needs a result before the next round.', messages_list)
+
+    def test_post_pair_tournament_round_as_member_redirects(self):
+        Membership.objects.filter(user=self.user).update(role=Membership.MEMBER)
+        self.client.login(email=self.user.email, password='Password123')
+        response = self.client.post(self.url, self.form_input)
+        redirect_url = reverse('club_home', kwargs={'club_id': self.club.id})
+        self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
+        self.assertEqual(Match.objects.count(), 0)
+
+    def test_post_pair_tournament_round_when_not_logged_in(self):
+        response = self.client.post(self.url, self.form_input)
+        redirect_url = reverse_with_next('log_in', self.url)
+        self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
@@ -13,10 +13,11 @@ class PasswordResetCompleteViewTestCase(TestCase):
         'clubs/tests/fixtures/other_users.json'
     ]
 
-    def setUp(self):
-        self.url = reverse('password_reset_complete')
-        self.user_one = User.objects.get(username='johndoe')
-        self.user_two = User.objects.get(username='janedoe')
+    @classmethod
+    def setUpTestData(cls):
+        cls.url = reverse('password_reset_complete')
+        cls.user_one = User.objects.get(username='johndoe')
+        cls.user_two = User.objects.get(username='janedoe')
 
     def test_password_reset_url(self):
         self.assertEqual(self.url, '/password_reset/complete/')
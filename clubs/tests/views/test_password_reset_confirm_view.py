@@ -14,8 +14,9 @@ class PasswordResetConfirmViewTestCase(TestCase):
         'clubs/tests/fixtures/other_users.json'
     ]
 
-    def setUp(self):
-        self.user = User.objects.get(username='johndoe')
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.get(username='johndoe')
 
     def test_get_password_reset_confirm(self):
         response = self.client.post(reverse('password_reset'),
@@ -13,9 +13,10 @@ class PasswordResetViewTestCase(TestCase):
         'clubs/tests/fixtures/other_users.json'
     ]
 
-    def setUp(self):
-        self.url = reverse('password_reset')
-        self.user = User.objects.get(username='johndoe')
+    @classmethod
+    def setUpTestData(cls):
+        cls.url = reverse('password_reset')
+        cls.user = User.objects.get(username='johndoe')
 
     def test_password_reset_url(self):
         self.assertEqual(self.url, '/password_reset/')
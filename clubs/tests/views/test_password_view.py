@@ -13,10 +13,11 @@ class PasswordViewTest(TestCase):
 
     fixtures = ['clubs/tests/fixtures/default_user.json']
 
-    def setUp(self):
-        self.user = User.objects.get(username='johndoe')
-        self.url = reverse('password')
-        self.form_input = {
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.get(username='johndoe')
+        cls.url = reverse('password')
+        cls.form_input = {
             'password': 'Password123',
             'new_password': 'NewPassword123',
             'password_confirmation': 'NewPassword123',
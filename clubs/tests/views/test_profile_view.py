@@ -16,10 +16,11 @@ class ProfileViewTest(TestCase):
         'clubs/tests/fixtures/other_users.json'
     ]
 
-    def setUp(self):
-        self.user = User.objects.get(username='johndoe')
-        self.url = reverse('profile')
-        self.form_input = {
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.get(username='johndoe')
+        cls.url = reverse('profile')
+        cls.form_input = {
             'first_name': 'John2',
             'last_name': 'Doe2',
             'username': 'johndoe2',
@@ -16,18 +16,19 @@ class ClubApplicationsViewTestCase(TestCase, MenuTesterMixin):
         'clubs/tests/fixtures/other_users.json'
     ]
 
-    def setUp(self):
-        self.user = User.objects.get(username="janedoe")
-        self.club = Club.objects.get(name='PolecatChess')
-        self.applicant = User.objects.get(username='johndoe')
-        self.application = Application.objects.create(
-            user=self.applicant,
-            club=self.club,
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.get(username="janedoe")
+        cls.club = Club.objects.get(name='PolecatChess')
+        cls.applicant = User.objects.get(username='johndoe')
+        cls.application = Application.objects.create(
+            user=cls.applicant,
+            club=cls.club,
             personal_statement="My personal statement")
-        self.url = reverse('reject_application',
+        cls.url = reverse('reject_application',
                            kwargs={
-                               'club_id': self.club.id,
-                               'application_id': self.application.id
+                               'club_id': cls.club.id,
+                               'application_id': cls.application.id
                            })
 
     def test_reject_application_url(self):
@@ -0,0 +1,59 @@
+"""Tests of the search view."""
+
+from django.test import TestCase
+from django.urls import reverse
+from clubs.models import User, Club, Membership
+from clubs.tests.helpers import MenuTesterMixin, reverse_with_next
+
+
+class SearchViewTestCase(TestCase, MenuTesterMixin):
+    """Unit tests of the search view."""
+
+    fixtures = [
+        'clubs/tests/fixtures/default_user.json',
+        'clubs/tests/fixtures/other_users.json',
+        'clubs/tests/fixtures/default_club.json',
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.get(username='johndoe')
+        cls.club = Club.objects.get(name='PolecatChess')
+        cls.url = reverse('search')
+
+    def test_search_url(self):
+        self.assertEqual(self.url, '/search/')
+
+    def test_search_redirects_when_not_logged_in(self):
+        redirect_url = reverse_with_next('log_in', self.url)
+        response = self.client.get(self.url)
+        self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
+
+    def test_search_clubs_offers_to_apply(self):
+        self.client.login(email=self.user.email, password='Password123')
+        response = self.client.get(self.url, {'q': 'polecat'})
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, 'home_templates/search.html')
+        self.assert_logged_in_menu(response)
+        self.assertEqual(list(response.context['page']), [self.club])
+        with self.assertHTML(response, f'a[href="{reverse("application", kwargs={"club_id": self.club.id})}"]'):
+            pass
+
+    def test_search_clubs_links_to_own_club(self):
+        Membership.objects.create(user=self.user, club=self.club)
+        self.client.login(email=self.user.email, password='Password123')
+        response = self.client.get(self.url, {'q': 'polecat'})
+        with self.assertHTML(response, f'a[href="{reverse("club_home", kwargs={"club_id": self.club.id})}"]'):
+            pass
+
+    def test_search_users(self):
+        self.client.login(email=self.user.email, password='Password123')
+        response = self.client.get(self.url, {'q': 'pickles', 'kind': 'users'})
+        self.assertEqual({user.username for user in response.context['page']}, {'petrapickles', 'peterpickles'})
+        self.assertContains(response, 'petrapickles')
+
+    def test_search_without_results(self):
+        self.client.login(email=self.user.email, password='Password123')
+        response = self.client.get(self.url, {'q': 'nothing here', 'page': 'x'})
+        self.assertEqual(response.context['page'].number, 1)
+        self.assertContains(response, 'Nothing matches your search!')
@@ -0,0 +1,66 @@
+"""Tests of the show tournament view."""
+
+from django.test import TestCase
+from django.urls import reverse
+from clubs.models import User, Club, Membership, Tournament, enter_club_members
+from clubs.tests.helpers import MenuTesterMixin, reverse_with_next
+import datetime
+import pytz
+
+
+class ShowTournamentViewTestCase(TestCase, MenuTesterMixin):
+    """Unit tests of the show tournament view."""
+
+    fixtures = [
+        'clubs/tests/fixtures/default_user.json',
+        'clubs/tests/fixtures/other_users.json',
+        'clubs/tests/fixtures/default_club.json',
+        'clubs/tests/fixtures/other_clubs.json',
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.get(username='johndoe')
+        cls.club = Club.objects.get(name='PolecatChess')
+        for user in User.objects.all():
+            Membership.objects.create(user=user, club=cls.club)
+        cls.tournament = Tournament.objects.create(club=cls.club, name='Winter Open', location='Bush House', rounds=3)
+        enter_club_members(cls.tournament)
+        cls.tournament.pair_next_round(pytz.UTC.localize(datetime.datetime(2030, 9, 25, 10, 30)))
+        cls.url = reverse('show_tournament', kwargs={'club_id': cls.club.id, 'tournament_id': cls.tournament.id})
+
+    def test_show_tournament_url(self):
+        self.assertEqual(self.url, '/club/' + str(self.club.id) + '/tournament/' + str(self.tournament.id))
+
+    def test_get_show_tournament(self):
+        self.client.login(email=self.user.email, password='Password123')
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, 'club_templates/show_tournament.html')
+        self.assertEqual(len(response.context['standings']), 4)
+        self.assertEqual(len(response.context['matches']), 2)
+        self.assert_member_menu(response, self.club.id)
+        url = reverse('pair_tournament_round', kwargs={'club_id': self.club.id, 'tournament_id': self.tournament.id})
+        self.assertNotHTML(response, f'form[action="{url}"]')
+
+    def test_get_show_tournament_as_officer_shows_pair_option(self):
+        Membership.objects.filter(user=self.user).update(role=Membership.OFFICER)
+        self.client.login(email=self.user.email, password='Password123')
+        response = self.client.get(self.url)
+        url = reverse('pair_tournament_round', kwargs={'club_id': self.club.id, 'tournament_id': self.tournament.id})
+        with self.assertHTML(response, f'form[action="{url}"]'):
+            pass
+
+    def test_get_show_tournament_redirects_when_not_logged_in(self):
+        redirect_url = reverse_with_next('log_in', self.url)
+        response = self.client.get(self.url)
+        self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
+
+    def test_get_tournament_of_other_club_redirects(self):
+        other_club = Club.objects.get(name='PolecatChess_2')
+        other_tournament = Tournament.objects.create(club=other_club, name='Paris Open', location='Paris', rounds=3)
+        self.client.login(email=self.user.email, password='Password123')
+        url = reverse('show_tournament', kwargs={'club_id': self.club.id, 'tournament_id': other_tournament.id})
+        response = self.client.get(url)
+        redirect_url = reverse('tournament_list', kwargs={'club_id': self.club.id})
+        self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
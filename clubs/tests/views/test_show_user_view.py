@@ -18,27 +18,28 @@ class ShowUserTest(TestCase, MenuTesterMixin):
         'clubs/tests/fixtures/other_clubs.json'
     ]
 
-    def setUp(self):
-        self.utc = pytz.UTC
-        self.user = User.objects.get(username='johndoe')
-        self.club = Club.objects.get(name='PolecatChess')
-        self.target_user = User.objects.get(username='janedoe')
-        self.url = reverse('show_user',
+    @classmethod
+    def setUpTestData(cls):
+        cls.utc = pytz.UTC
+        cls.user = User.objects.get(username='johndoe')
+        cls.club = Club.objects.get(name='PolecatChess')
+        cls.target_user = User.objects.get(username='janedoe')
+        cls.url = reverse('show_user',
                            kwargs={
-                               'club_id': self.club.id,
-                               'user_id': self.target_user.id
+                               'club_id': cls.club.id,
+                               'user_id': cls.target_user.id
                            })
-        self.application = Application.objects.create(
-            user=self.user,
-            club=self.club,
+        cls.application = Application.objects.create(
+            user=cls.user,
+            club=cls.club,
             personal_statement="Personal statement",
             status=Application.ACCEPTED)
 
-        self.avaliable_options_in_dropbox = [
-            self._reverse_with_club_id_and_target('transfer_ownership'),
-            self._reverse_with_club_id_and_target('promote_member'),
-            self._reverse_with_club_id_and_target('demote_officer'),
-            self._reverse_with_club_id_and_target('delete_member'),
+        cls.avaliable_options_in_dropbox = [
+            cls._reverse_with_club_id_and_target('transfer_ownership'),
+            cls._reverse_with_club_id_and_target('promote_member'),
+            cls._reverse_with_club_id_and_target('demote_officer'),
+            cls._reverse_with_club_id_and_target('delete_member'),
         ]
 
     def test_show_user_url(self):
@@ -194,6 +195,21 @@ class ShowUserTest(TestCase, MenuTesterMixin):
         self.assertEquals(response.context['draws'], 0)
         self.assertEquals(response.context['losses'], 1)
 
+    def test_head_to_head_record_is_shown_from_the_logged_in_user_side(self):
+        self._set_up_matches()
+        response = self.client.get(self.url)
+        self.assertEqual(response.context['head_to_head'].games, 1)
+        self.assertEqual(response.context['head_to_head_wins'], 1)
+        self.assertEqual(response.context['head_to_head_losses'], 0)
+        self.assertContains(response, 'id="head-to-head"')
+
+    def test_head_to_head_record_is_not_shown_on_own_profile(self):
+        self._set_up_matches()
+        url = reverse('show_user', kwargs={'club_id': self.club.id, 'user_id': self.user.id})
+        response = self.client.get(url)
+        self.assertNotIn('head_to_head', response.context)
+        self.assertNotContains(response, 'id="head-to-head"')
+
     def test_memebr_clubs_are_correct_length_correctly(self):
         self._set_up_matches()
         url = reverse('show_user',
@@ -226,9 +242,6 @@ class ShowUserTest(TestCase, MenuTesterMixin):
                                    club=other_club,
                                    status=Application.ACCEPTED)
         Membership.objects.create(user=self.target_user, club=other_club)
-        Application.objects.create(user=self.target_user,
-                                   club=other_club,
-                                   status=Application.ACCEPTED)
         Match.objects.create(player_1=self.user,
                              player_2=self.target_user,
                              location='Bush House',
@@ -350,11 +363,12 @@ class ShowUserTest(TestCase, MenuTesterMixin):
             self._reverse_with_club_id_and_target('transfer_ownership'),
         ])
 
-    def _reverse_with_club_id_and_target(self, base_url):
+    @classmethod
+    def _reverse_with_club_id_and_target(cls, base_url):
         return reverse(base_url,
                        kwargs={
-                           'club_id': self.club.id,
-                           'user_id': self.target_user.id
+                           'club_id': cls.club.id,
+                           'user_id': cls.target_user.id
                        })
 
     def _assert_conatins_forms_with_urls(self, response, urls):
@@ -13,9 +13,10 @@ class SignUpViewTestCase(TestCase, LogInTester, MenuTesterMixin):
 
     fixtures = ['clubs/tests/fixtures/default_user.json']
 
-    def setUp(self):
-        self.url = reverse('sign_up')
-        self.form_input = {
+    @classmethod
+    def setUpTestData(cls):
+        cls.url = reverse('sign_up')
+        cls.form_input = {
             'first_name': 'Jane',
             'last_name': 'Doe',
             'username': 'janedoe',
@@ -25,7 +26,7 @@ class SignUpViewTestCase(TestCase, LogInTester, MenuTesterMixin):
             'new_password': 'Password123',
             'password_confirmation': 'Password123'
         }
-        self.user = User.objects.get(username='johndoe')
+        cls.user = User.objects.get(username='johndoe')
 
     def test_sign_up_url(self):
         self.assertEqual(self.url, '/sign_up/')
@@ -0,0 +1,56 @@
+"""Tests of the tournament list view."""
+
+from django.test import TestCase
+from django.urls import reverse
+from clubs.models import User, Club, Membership, Tournament
+from clubs.tests.helpers import MenuTesterMixin, reverse_with_next
+
+
+class TournamentListViewTestCase(TestCase, MenuTesterMixin):
+    """Unit tests of the tournament list view."""
+
+    fixtures = [
+        'clubs/tests/fixtures/default_user.json',
+        'clubs/tests/fixtures/default_club.json',
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.get(username='johndoe')
+        cls.club = Club.objects.get(name='PolecatChess')
+        cls.tournament = Tournament.objects.create(club=cls.club, name='Winter Open', location='Bush House', rounds=5)
+        cls.url = reverse('tournament_list', kwargs={'club_id': cls.club.id})
+
+    def test_tournament_list_url(self):
+        self.assertEqual(self.url, '/club/' + str(self.club.id) + '/tournaments/')
+
+    def test_get_tournament_list_as_member(self):
+        Membership.objects.create(user=self.user, club=self.club)
+        self.client.login(email=self.user.email, password='Password123')
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, 'club_templates/tournament_list.html')
+        self.assertEqual(list(response.context['tournaments']), [self.tournament])
+        self.assert_member_menu(response, self.club.id)
+        url = reverse('show_tournament', kwargs={'club_id': self.club.id, 'tournament_id': self.tournament.id})
+        with self.assertHTML(response, f'a[href="{url}"]'):
+            pass
+        self.assertNotHTML(response, f'a[href="{reverse("create_tournament", kwargs={"club_id": self.club.id})}"]')
+
+    def test_get_tournament_list_as_officer_shows_create_option(self):
+        Membership.objects.create(user=self.user, club=self.club, role=Membership.OFFICER)
+        self.client.login(email=self.user.email, password='Password123')
+        response = self.client.get(self.url)
+        url = reverse('create_tournament', kwargs={'club_id': self.club.id})
+        with self.assertHTML(response, f'a[href="{url}"]'):
+            pass
+
+    def test_get_tournament_list_redirects_when_not_logged_in(self):
+        redirect_url = reverse_with_next('log_in', self.url)
+        response = self.client.get(self.url)
+        self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
+
+    def test_get_tournament_list_redirects_when_not_a_member(self):
+        self.client.login(email=self.user.email, password='Password123')
+        response = self.client.get(self.url)
+        self.assertRedirects(response, reverse('applications'), status_code=302, target_status_code=200)
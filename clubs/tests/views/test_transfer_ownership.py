@@ -14,22 +14,23 @@ class TransferOwnershipViewTestCase(TestCase):
         'clubs/tests/fixtures/other_users.json'
     ]
 
-    def setUp(self):
-        self.club = Club.objects.get(name='PolecatChess')
-        self.user_one = User.objects.get(username='johndoe')
-        self.user_one_application = Application.objects.create(
-            user=self.user_one,
-            club=self.club,
+    @classmethod
+    def setUpTestData(cls):
+        cls.club = Club.objects.get(name='PolecatChess')
+        cls.user_one = User.objects.get(username='johndoe')
+        cls.user_one_application = Application.objects.create(
+            user=cls.user_one,
+            club=cls.club,
             personal_statement="User one personal statement")
-        self.user_two = User.objects.get(username='janedoe')
-        self.user_two_application = Application.objects.create(
-            user=self.user_two,
-            club=self.club,
+        cls.user_two = User.objects.get(username='janedoe')
+        cls.user_two_application = Application.objects.create(
+            user=cls.user_two,
+            club=cls.club,
             personal_statement="User two personal statement")
-        self.url = reverse('transfer_ownership',
+        cls.url = reverse('transfer_ownership',
                            kwargs={
-                               'club_id': self.club.id,
-                               'user_id': self.user_two.id
+                               'club_id': cls.club.id,
+                               'user_id': cls.user_two.id
                            })
 
     def test_transfer_ownership_url(self):
@@ -3,6 +3,8 @@
 from django.test import TestCase
 from django.urls import reverse
 from clubs.models import User, Match, Club, Application, Membership
+from clubs.archive import archive_matches
+from clubs.deletion import delete_club
 from clubs.tests.helpers import MenuTesterMixin, reverse_with_next
 import pytz
 import datetime
@@ -83,3 +85,27 @@ class ClubListTest(TestCase, MenuTesterMixin):
                              redirect_url,
                              status_code=302,
                              target_status_code=200)
+
+    def test_archived_matches_count_and_load_only_for_full_history(self):
+        archive_matches(days=0)
+        self.client.login(email=self.user1.email, password='Password123')
+        response = self.client.get(self.url)
+        self.assertEqual(response.context['wins'], 1)
+        self.assertNotContains(response, 'Bush House floor 7')
+        self.assertNotIn('archived_matches', response.context)
+        self.assertContains(response, 'id="full-history-link"')
+        response = self.client.get(self.url, {'history': 'full'})
+        self.assertContains(response, 'id="archived-matches"')
+        self.assertEqual(len(response.context['archived_matches']), 1)
+        self.assertNotContains(response, 'id="full-history-link"')
+
+    def test_matches_of_a_deleted_club_are_not_listed(self):
+        archive_matches(days=0)
+        delete_club(self.club)
+        self.client.login(email=self.user1.email, password='Password123')
+        response = self.client.get(self.url, {'history': 'full'})
+        self.assertNotContains(response, 'Bush House floor 6')
+        self.assertEqual(len(response.context['upcoming_matches']), 0)
+        self.assertNotIn('archived_matches', response.context)
+        self.assertNotContains(response, 'Bush House floor 7')
+        self.assertEqual(response.context['wins'], 0)
@@ -4,4 +4,5 @@ from .authentication_views import *
 from .club_views import *
 from .match_views import *
 from .account_views import *
+from .search_views import *
 from .club_views import *
@@ -5,13 +5,16 @@ from django.contrib.auth.hashers import check_password
 from django.shortcuts import redirect, render
 from clubs.forms import UserForm, PasswordForm
 from django.contrib import messages
-from django.contrib.auth import login
+from django.contrib.auth import login, logout
 from django.utils.decorators import method_decorator
 from django.contrib.auth import views as auth_views
 from django.contrib.auth.forms import PasswordResetForm
 from clubs.views import login_prohibited
 from django.views.generic.base import View
-from clubs.models import User, Club
+from clubs.models import User, Club, Membership
+from clubs.deletion import close_account
+from clubs.views.helpers import remove_membership
+from django.db import transaction
 from django.contrib.auth.mixins import LoginRequiredMixin
 
 """View of the change profile details page."""
@@ -114,7 +117,14 @@ class CloseAccountView(View):
         return render(request, 'account_templates/close_account.html', {'user': request.user.username})
 
     def post(self, request, *args, **kwargs):
-        """Handle account closure attempt."""
-        user = User.objects.get(username=request.user.username)
-        user.delete()
+        """Handle account closure attempt.
+
+        The user leaves their clubs and is deactivated at once, the rest of
+        their rows are handled by the purge_deleted command.
+        """
+        with transaction.atomic():
+            for membership in Membership.objects.select_for_update().filter(user=request.user):
+                remove_membership(membership)
+            close_account(request.user)
+        logout(request)
         return redirect('home')
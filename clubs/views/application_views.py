@@ -2,12 +2,13 @@
 
 from clubs.models import Application, Club
 from clubs.forms import ApplicationForm
-from django.views.generic import ListView
+from django.views.generic import TemplateView
 from django.shortcuts import render, redirect
 from django.contrib import messages
 from django.views import View
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.core.exceptions import ObjectDoesNotExist
+from clubs.views.helpers import application_list_context
 
 
 class NewApplicationView(LoginRequiredMixin, View):
@@ -20,25 +21,17 @@ class NewApplicationView(LoginRequiredMixin, View):
 
     def get(self, request, *args, **kwargs):
         """Get application form."""
-        try:
-            club_name = (Club.objects.get(id=kwargs['club_id'])).name
-            self.form = ApplicationForm(initial={'club': club_name})
-        except:
-            self.form = ApplicationForm()
+        self.form = ApplicationForm(initial={'club': kwargs.get('club_id')})
         return self.render()
 
     def post(self, request, *args, **kwargs):
         """Handle new application attempt."""
         self.form = ApplicationForm(request.POST)
-        user = request.user
-        for application in Application.objects.filter(user=user):
-            if (application.club.name == request.POST.get('club')) and (
-                    application.is_pending() or application.is_accepted()):
+        if self.form.is_valid():
+            if self.form.save(request.user) is None:
                 messages.add_message(request, messages.ERROR, 'Application for this club has already been submitted')
                 self.form = ApplicationForm()
                 return self.render()
-        if self.form.is_valid():
-            self.form.save(user)
             messages.add_message(request, messages.SUCCESS, 'Application has been submitted')
             return redirect('applications')
         else:
@@ -49,15 +42,15 @@ class NewApplicationView(LoginRequiredMixin, View):
         return render(self.request, 'application_templates/new_application.html', {'form': self.form})
 
 
-class ApplicationListView(LoginRequiredMixin, ListView):
-    """View that displays user's list of applications."""
-    model = Application
+class ApplicationListView(LoginRequiredMixin, TemplateView):
+    """View that displays user's pending applications, and their processed applications on request."""
     template_name = "application_templates/application_list.html"
-    context_object_name = 'applications'
 
-    def get_queryset(self):
-        """Return the logged in user's applications."""
-        return Application.objects.filter(user=self.request.user)
+    def get_context_data(self, *args, **kwargs):
+        """Generate context data to be shown in the template."""
+        context = super().get_context_data(*args, **kwargs)
+        context.update(application_list_context(self.request))
+        return context
 
 
 class CancelApplicationView(LoginRequiredMixin, View):
@@ -88,5 +81,4 @@ class CancelApplicationView(LoginRequiredMixin, View):
         except ObjectDoesNotExist:
             messages.add_message(self.request, messages.INFO,
                                  'The application you are trying to cancel does not exist.')
-        applications_list = Application.objects.filter(user=self.request.user)
-        return render(self.request, 'application_templates/application_list.html', {'applications': applications_list})
+        return render(self.request, 'application_templates/application_list.html', application_list_context(self.request))
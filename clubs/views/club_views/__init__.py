@@ -1,4 +1,7 @@
 from .club_home_views import *
 from .club_application_views import *
 from .club_member_views import *
-from .club_match_views import *
\ No newline at end of file
+from .club_match_views import *
+from .club_tournament_views import *
+from .club_export_views import *
+from .club_import_views import *
\ No newline at end of file
@@ -1,36 +1,52 @@
 """Views that deal with applications for a club."""
 
 from django.views.generic.base import TemplateView, View
-from clubs.models import Application, Membership, Club
+from clubs.models import Application, Membership, User, application_queue
 from django.shortcuts import redirect
 from django.contrib import messages
 from django.core.exceptions import ObjectDoesNotExist
+from django.db import IntegrityError, transaction
 from clubs.views.helpers import OfficerRequiredMixin
 
 class ClubApplicationsView(OfficerRequiredMixin, TemplateView):
-    """View to display pending applications for a club."""
+    """View to display pending applications for a club, a page at a time.
+
+    ?after= holds the cursor of the next page and ?experience= an experience
+    level to filter the applicants by.
+    """
 
     template_name = "club_templates/club_application_list.html"
 
     def get_context_data(self, *args, **kwargs):
         """Generate context data to be shown in the template."""
         context = super().get_context_data(*args,**kwargs)
-        club = Club.objects.get(id=self.kwargs['club_id'])
-        context['applications'] = Application.objects.filter(club=club, status=Application.PENDING)
+        experience = self.request.GET.get('experience', '')
+        if experience not in dict(User.EXPERIENCE_LEVELS):
+            experience = ''
+        page = application_queue(self.kwargs['club_id'], self.request.GET.get('after'), experience)
+        context['page'] = page
+        context['applications'] = page.applications
+        context['experience'] = experience
+        context['experience_levels'] = User.EXPERIENCE_LEVELS
         return context
 
 class ChangeApplication(OfficerRequiredMixin, View):
     """Class to extend for views that change application status."""
 
     def post(self, request, *args, **kwargs):
-        """Handle the acceptence of the application."""
+        """Handle the acceptence of the application.
+
+        The application row is locked until the change commits, so officers
+        handling the same application at once are served one after the other.
+        """
         try:
-            application = Application.objects.get(id=kwargs['application_id'], club=kwargs['club_id'])
+            with transaction.atomic():
+                application = Application.objects.select_for_update().get(id=kwargs['application_id'], club=kwargs['club_id'])
+                self.handle(application)
         except ObjectDoesNotExist:
             messages.add_message(request, messages.ERROR, 'That application does not exist')
-            return redirect('club_application_list', kwargs['club_id'])
-        else:
-            self.handle(application)
+        except IntegrityError:
+            messages.add_message(request, messages.ERROR, 'That application has already been handled')
         return redirect('club_application_list', kwargs['club_id'])
 
 class AcceptApplicationView(ChangeApplication):
@@ -40,8 +56,8 @@ class AcceptApplicationView(ChangeApplication):
         """ Sets the application status to accepted if it is pending. """
         if application.status == Application.PENDING:
             application.status = Application.ACCEPTED
-            application.save()
-            Membership.objects.create(user=application.user, club=application.club)
+            application.save(update_fields=['status'])
+            Membership.objects.create(user_id=application.user_id, club_id=application.club_id)
             messages.add_message(self.request, messages.SUCCESS, 'Application accepted!')
         else:
             messages.add_message(self.request, messages.ERROR, 'You cannot accept that application!')
@@ -53,7 +69,7 @@ class RejectApplicationView(ChangeApplication):
         """Sets the application status to rejected if it is pending."""
         if application.status == Application.PENDING:
             application.status = Application.REJECTED
-            application.save()
+            application.save(update_fields=['status'])
             messages.add_message(self.request, messages.SUCCESS, 'Application rejected!')
         else:
             messages.add_message(self.request, messages.ERROR, 'You cannot reject that application!')
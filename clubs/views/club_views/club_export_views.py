@@ -0,0 +1,27 @@
+"""Views that export the data of a club."""
+
+from django.contrib import messages
+from django.http import StreamingHttpResponse
+from django.shortcuts import redirect
+from django.views.generic.base import View
+from clubs.exports import EXPORTS, FORMATS, CSV, export_rows
+from clubs.models import Club
+from clubs.views.helpers import OfficerRequiredMixin
+
+class ClubExportView(OfficerRequiredMixin, View):
+    """View that streams the members, applications or matches of a club as a file."""
+
+    http_method_names = ['get']
+
+    def get(self, request, *args, **kwargs):
+        """Stream the export, redirect to the members list if it does not exist."""
+        kind = kwargs['kind']
+        export_format = request.GET.get('format', CSV)
+        if kind not in EXPORTS or export_format not in FORMATS:
+            messages.add_message(request, messages.ERROR, 'That export does not exist!')
+            return redirect('members_list', kwargs['club_id'])
+        club = Club.objects.get(id=kwargs['club_id'])
+        response = StreamingHttpResponse(export_rows(kind, club.id, export_format), content_type=FORMATS[export_format])
+        filename = f'{club.name}-{kind}.{export_format}'.replace(' ', '_').replace('"', '')
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
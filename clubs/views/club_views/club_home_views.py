@@ -1,8 +1,11 @@
 """Views for the club home page."""
 
+from django.conf import settings
 from django.db.models import Q
-from django.views.generic.base import TemplateView
-from clubs.models import Club, Membership, Match
+from django.http import JsonResponse
+from django.template.loader import render_to_string
+from django.views.generic.base import TemplateView, View
+from clubs.models import Club, Membership, Match, match_events_after, latest_match_event_id
 from clubs.views.helpers import MembershipRequiredMixin
 
 class ClubHomeView(MembershipRequiredMixin, TemplateView):
@@ -15,5 +18,45 @@ class ClubHomeView(MembershipRequiredMixin, TemplateView):
         context['club'] = Club.objects.get(id=self.kwargs['club_id'])
         membership = Membership.objects.filter(role=Membership.OWNER, user=self.request.user)
         context['owned_clubs'] = Club.objects.filter(membership__in=membership)
-        context['matches'] = Match.objects.filter(club=context['club'])
+        context['matches'] = Match.objects.filter(club=context['club']).for_display()
+        context['last_match_event_id'] = latest_match_event_id(self.kwargs['club_id'])
+        context['match_event_poll_milliseconds'] = settings.MATCH_EVENT_POLL_MILLISECONDS
         return context
+
+class ClubMatchEventsView(MembershipRequiredMixin, View):
+    """View that returns the match changes of a club published after ?after= as JSON.
+
+    The club home page polls it every few seconds. Each request returns at
+    once, so no worker is held by an open page.
+    """
+
+    http_method_names = ['get']
+
+    # Events returned per request, a page further behind catches up over the next polls
+    EVENTS_PER_REQUEST = 50
+
+    def get(self, request, *args, **kwargs):
+        """Return the events after the last one the client has seen, and the id to ask from next."""
+        after = self.last_event_id()
+        events = list(match_events_after(self.kwargs['club_id'], after)[:self.EVENTS_PER_REQUEST])
+        return JsonResponse({
+            'last_event_id': events[-1].id if events else after,
+            'events': [self.event_data(event) for event in events],
+        })
+
+    def last_event_id(self):
+        """Returns the id sent by the client, or the latest event if there is none."""
+        try:
+            return int(self.request.GET.get('after'))
+        except (TypeError, ValueError):
+            return latest_match_event_id(self.kwargs['club_id'])
+
+    def event_data(self, event):
+        """Returns the event with the updated match card."""
+        return {
+            'id': event.id,
+            'kind': event.kind.lower(),
+            'match_id': event.match_id,
+            'status': event.match.status,
+            'html': render_to_string('partials/match.html', {'match': event.match}, request=self.request),
+        }
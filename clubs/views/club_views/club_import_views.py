@@ -0,0 +1,53 @@
+"""Views that import members and matches into a club."""
+
+import io
+from django.contrib import messages
+from django.shortcuts import render, redirect
+from django.views import View
+from clubs.forms import ImportForm
+from clubs.imports import MEMBERS, ImportFileError, import_members, import_matches
+from clubs.models import Club
+from clubs.views.helpers import OfficerRequiredMixin
+
+class ClubImportView(OfficerRequiredMixin, View):
+    """View that imports a CSV file of members or matches uploaded by an officer."""
+
+    http_method_names = ['get', 'post']
+
+    def get(self, request, *args, **kwargs):
+        """Render the upload form."""
+        self.club = Club.objects.get(id=kwargs['club_id'])
+        self.form = ImportForm()
+        return self.render()
+
+    def post(self, request, *args, **kwargs):
+        """Import the file, show its row errors if any row is invalid."""
+        self.club = Club.objects.get(id=kwargs['club_id'])
+        self.form = ImportForm(data=request.POST, files=request.FILES)
+        self.result = None
+        if self.form.is_valid():
+            importer = import_members if self.form.cleaned_data['kind'] == MEMBERS else import_matches
+            csv_file = io.TextIOWrapper(self.form.cleaned_data['file'].file, encoding='utf-8-sig')
+            try:
+                self.result = importer(self.club, csv_file)
+            except ImportFileError as error:
+                messages.add_message(request, messages.ERROR, str(error))
+            except UnicodeDecodeError:
+                messages.add_message(request, messages.ERROR, 'The file must be a CSV file encoded as UTF-8.')
+            else:
+                if self.result.is_valid():
+                    message = f'Imported {self.result.created} {self.form.cleaned_data["kind"]}, skipped {self.result.skipped} already in the club.'
+                    if self.result.invited:
+                        message += f' {self.result.invited} existing users were given a pending application instead.'
+                    messages.add_message(request, messages.SUCCESS, message)
+                    return redirect('members_list', kwargs['club_id'])
+        return self.render()
+
+    def render(self):
+        """Display the import template."""
+        context = {
+            'form': self.form,
+            'result': getattr(self, 'result', None),
+            'club_id': self.kwargs['club_id'],
+        }
+        return render(self.request, 'club_templates/import.html', context)
@@ -2,7 +2,7 @@
 
 from django.shortcuts import render, redirect
 from clubs.forms import CreateMatchForm
-from clubs.models import  Club, Match
+from clubs.models import  Club, Match, MatchEvent
 from django.views import View
 from clubs.views.helpers import ChangeMatchOutcome, OfficerRequiredMixin
 from django.contrib import messages
@@ -28,7 +28,8 @@ class CreateMatchView(OfficerRequiredMixin, View):
         self.club = (Club.objects.get(id=kwargs['club_id']))
         self.form = CreateMatchForm(self.club, data=self.request.POST)
         if self.form.is_valid():
-            self.form.save(self.club)
+            match = self.form.save(self.club)
+            MatchEvent.publish(match, MatchEvent.CREATED)
             messages.add_message(request, messages.SUCCESS, 'Match has been created')
             return redirect('club_home', kwargs['club_id'])
         else:
@@ -38,8 +39,6 @@ class CreateMatchView(OfficerRequiredMixin, View):
     def render(self, *args, **kwargs):
         """Display create match template."""
         context = {
-                'logged_in_user_is_officer' : self.request.user.is_officer_of(self.club),
-                'logged_in_user_is_owner' : self.request.user.is_owner_of(self.club),
                 'form': self.form, 
                 'club_id': self.kwargs['club_id']
             }
@@ -65,7 +64,8 @@ class UpdateMatchOutcomeView(OfficerRequiredMixin, ChangeMatchOutcome):
         """Handle update match attempt."""
         self.form = UpdateMatchOutcomeForm(request.POST)
         if self.form.is_valid():
-            post = self.form.save(self.match.id)
+            match = self.form.save(self.match.id)
+            MatchEvent.publish(match, MatchEvent.UPDATED)
             messages.add_message(request, messages.SUCCESS, 'Match outcome has been updated')
             return self.redirect()
         else:
@@ -74,14 +74,10 @@ class UpdateMatchOutcomeView(OfficerRequiredMixin, ChangeMatchOutcome):
 
     def render(self):
         """Render update match form with correct match details."""
-        club = Club.objects.get(id=self.kwargs['club_id'])
-
         context = {
             'match': self.match,
             'form': self.form,
             'club_id': self.kwargs['club_id'],
-            'logged_in_user_is_officer' : self.request.user.is_officer_of(club),
-            'logged_in_user_is_owner' : self.request.user.is_owner_of(club),
         }
         
         return render(self.request, 'club_templates/update_match.html', context)
@@ -112,6 +108,7 @@ class CancelMatchView(OfficerRequiredMixin, ChangeMatchOutcome):
     def cancel_match(self, *args, **kwargs):
         self.match.status = Match.CANCELLED
         self.match.save()
+        MatchEvent.publish(self.match, MatchEvent.CANCELLED)
         return self.redirect()
 
     def redirect(self):
@@ -1,11 +1,13 @@
 """Views that handle members in the club."""
 
 from django.core.exceptions import ObjectDoesNotExist
+from django.db import transaction
 from django.views.generic.base import TemplateView, View
-from clubs.models import User, Application, Match, Membership, Club
+from clubs.models import User, Application, Match, Membership, Club, head_to_head
 from django.shortcuts import redirect, render
 from django.contrib import messages
-from clubs.views.helpers import MembershipRequiredMixin, OfficerRequiredMixin, OwnerRequiredMixin
+from clubs.views.helpers import MembershipRequiredMixin, OfficerRequiredMixin, OwnerRequiredMixin, archive_history_context, remove_membership
+from clubs.exports import EXPORTS
 
 class MembersListView(MembershipRequiredMixin, TemplateView):
 	"""View that shows a list of all members."""
@@ -15,6 +17,7 @@ class MembersListView(MembershipRequiredMixin, TemplateView):
 		context = super().get_context_data(*args,**kwargs)
 		club = Club.objects.get(id=self.kwargs['club_id'])
 		context['members'] = Membership.objects.filter(club=club).order_by('user')
+		context['export_kinds'] = EXPORTS.keys()
 		return context
 
 
@@ -37,33 +40,36 @@ class ShowUserView(MembershipRequiredMixin, View):
             context = {
                 'user': user,
                 'personal_statement' : personal_statement,
-                'logged_in_user_is_member' : self.request.user.is_member_of(club),
-                'logged_in_user_is_officer' : self.request.user.is_officer_of(club),
-                'logged_in_user_is_owner' : self.request.user.is_owner_of(club),
                 'shown_user_is_member' : user.is_member_of(club),
                 'shown_user_is_officer' : user.is_officer_of(club),
                 'shown_user_is_owner' : user.is_owner_of(club),
-                'upcoming_matches' : matches.filter(status = Match.PENDING),
-                'previous_matches' : matches.exclude(status = Match.PENDING),
-                'wins' : len(matches.filter(player_1 = user, status = Match.PLAYER1)) + len(matches.filter(player_2 = user, status = Match.PLAYER2)),
-                'losses' : len(matches.filter(player_2 = user, status = Match.PLAYER1)) + len(matches.filter(player_1 = user, status = Match.PLAYER2)),
-                'draws' : len(matches.filter(status = Match.DRAW)),
+                'upcoming_matches' : matches.filter(status = Match.PENDING).for_display(),
+                'previous_matches' : matches.exclude(status = Match.PENDING).for_display(),
                 'club_id' : self.kwargs['club_id'],
             }
+            context.update(archive_history_context(request, user, club))
+            archived = context['archived_results']
+            context['wins'] = len(matches.filter(player_1 = user, status = Match.PLAYER1)) + len(matches.filter(player_2 = user, status = Match.PLAYER2)) + archived['wins']
+            context['losses'] = len(matches.filter(player_2 = user, status = Match.PLAYER1)) + len(matches.filter(player_1 = user, status = Match.PLAYER2)) + archived['losses']
+            context['draws'] = len(matches.filter(status = Match.DRAW)) + archived['draws']
+            if user != request.user:
+                record = head_to_head(club.id, request.user.id, user.id)
+                context['head_to_head'] = record
+                context['head_to_head_wins'] = record.wins_for(request.user.id)
+                context['head_to_head_losses'] = record.losses_for(request.user.id)
             return render(request, 'club_templates/show_user.html', context)
 
 class ChangeMemberPermissions(View):
     """Class to extend for views that change member status."""
     def post(self, request, *args, **kwargs):
+        """Change the membership, locked until the change commits."""
         try:
-            target_user = User.objects.get(id=self.kwargs['user_id'])
-            club = Club.objects.get(id=self.kwargs['club_id'])
-            member = Membership.objects.get(user=target_user, club=club)
+            with transaction.atomic():
+                member = Membership.objects.select_for_update().select_related('user', 'club').get(
+                    user_id=self.kwargs['user_id'], club_id=self.kwargs['club_id'])
+                self.handle(request, member.user, member.club, member, *args, **kwargs)
         except ObjectDoesNotExist:
             messages.add_message(request, messages.ERROR, 'The provided ID does not match any existing members!')
-            return redirect('members_list', self.kwargs['club_id'])
-        else:
-            self.handle(request, target_user, club, member, *args, **kwargs)
         return redirect('members_list', self.kwargs['club_id'])
 
 class PromoteMemberView(OfficerRequiredMixin, ChangeMemberPermissions):
@@ -95,13 +101,10 @@ class DeleteMemberView(OfficerRequiredMixin, ChangeMemberPermissions):
 
     def handle(self, request, target_user, club, officer, *args, **kwargs):
         """Delete a member from the club."""
-        if target_user.is_officer_of(club) and (not request.user.is_owner_of(club)): 
+        if officer.role == Membership.OFFICER and (not request.user.is_owner_of(club)): 
             messages.add_message(request, messages.SUCCESS, 'You are not authorized to procced!')
-        elif not target_user.is_owner_of(club):
-            application = Application.objects.get(user=target_user, club=club, status=Application.ACCEPTED)
-            application.status = Application.REJECTED
-            application.save()
-            Membership.objects.get(user=target_user, club=club).delete()
+        elif officer.role != Membership.OWNER:
+            remove_membership(officer)
             messages.add_message(request, messages.SUCCESS, 'Member Deleted!')
         else:
             messages.add_message(request, messages.ERROR, 'An error occured while trying to deleted this member!')
@@ -128,9 +131,6 @@ class TransferOwnershipView(OwnerRequiredMixin, View):
             context = {
                 'user_id': self.kwargs['user_id'],
                 'user': user,
-                'logged_in_user_is_member' : self.request.user.is_member_of(club),
-                'logged_in_user_is_officer' : self.request.user.is_officer_of(club),
-                'logged_in_user_is_owner' : self.request.user.is_owner_of(club),
                 'club_id' : self.kwargs['club_id'],
             }
 
@@ -0,0 +1,108 @@
+"""Views that deal with club tournaments."""
+
+from django.core.exceptions import ObjectDoesNotExist
+from django.shortcuts import render, redirect
+from django.views import View
+from django.views.generic.base import TemplateView
+from django.contrib import messages
+from clubs.forms import CreateTournamentForm, PairRoundForm
+from clubs.models import Club, Tournament, Match
+from clubs.scheduling import PairingError
+from clubs.views.helpers import MembershipRequiredMixin, OfficerRequiredMixin
+
+class TournamentListView(MembershipRequiredMixin, TemplateView):
+    """View that displays the tournaments of a club."""
+    template_name = "club_templates/tournament_list.html"
+
+    def get_context_data(self, *args, **kwargs):
+        """Generate context data to be shown in the template."""
+        context = super().get_context_data(*args, **kwargs)
+        context['tournaments'] = Tournament.objects.filter(club_id=self.kwargs['club_id'])
+        return context
+
+class CreateTournamentView(OfficerRequiredMixin, View):
+    """View that handles creating a new tournament."""
+
+    http_method_names = ['get', 'post']
+
+    def get(self, request, *args, **kwargs):
+        """Render the form for create tournament."""
+        self.club = Club.objects.get(id=kwargs['club_id'])
+        self.form = CreateTournamentForm(initial={'location': self.club.location})
+        return self.render()
+
+    def post(self, request, *args, **kwargs):
+        """Handle tournament creation."""
+        self.club = Club.objects.get(id=kwargs['club_id'])
+        self.form = CreateTournamentForm(data=request.POST)
+        if self.form.is_valid():
+            try:
+                tournament = self.form.save(self.club)
+            except PairingError as error:
+                messages.add_message(request, messages.ERROR, str(error))
+            else:
+                messages.add_message(request, messages.SUCCESS, 'Tournament has been created')
+                return redirect('show_tournament', kwargs['club_id'], tournament.id)
+        return self.render()
+
+    def render(self):
+        """Display create tournament template."""
+        context = {
+            'form': self.form,
+            'club_id': self.kwargs['club_id'],
+        }
+        return render(self.request, 'club_templates/create_tournament.html', context)
+
+class TournamentMixin:
+    """Mixin for views of a single tournament, to be used after a permission mixin."""
+
+    def dispatch(self, request, *args, **kwargs):
+        """Load the tournament, redirect to the tournament list if it does not exist."""
+        try:
+            self.tournament = Tournament.objects.get(id=kwargs['tournament_id'], club_id=kwargs['club_id'])
+        except ObjectDoesNotExist:
+            messages.add_message(request, messages.ERROR, 'That tournament does not exist')
+            return redirect('tournament_list', kwargs['club_id'])
+        return super().dispatch(request, *args, **kwargs)
+
+class ShowTournamentView(MembershipRequiredMixin, TournamentMixin, TemplateView):
+    """View that displays the standings and rounds of a tournament."""
+    template_name = "club_templates/show_tournament.html"
+
+    def get_context_data(self, *args, **kwargs):
+        """Generate context data to be shown in the template."""
+        context = super().get_context_data(*args, **kwargs)
+        context['tournament'] = self.tournament
+        context['standings'] = self.tournament.standings()
+        context['round'] = self.shown_round()
+        context['round_numbers'] = range(1, self.tournament.current_round + 1)
+        context['matches'] = Match.objects.filter(tournament=self.tournament, round=context['round']).for_display()
+        context['form'] = PairRoundForm(initial={'date_time': self.tournament.round_date(self.tournament.current_round + 1)})
+        return context
+
+    def shown_round(self):
+        """Returns the round picked with ?round=, or the current round."""
+        try:
+            round_number = int(self.request.GET.get('round', self.tournament.current_round))
+        except ValueError:
+            return self.tournament.current_round
+        return min(max(round_number, 1), self.tournament.current_round)
+
+class PairTournamentRoundView(OfficerRequiredMixin, TournamentMixin, View):
+    """View that pairs the next round of a tournament."""
+
+    http_method_names = ['post']
+
+    def post(self, request, *args, **kwargs):
+        """Handle the pairing attempt of the next round."""
+        form = PairRoundForm(data=request.POST)
+        if not form.is_valid():
+            messages.add_message(request, messages.ERROR, 'Date/time must be in future!')
+        else:
+            try:
+                matches = self.tournament.pair_next_round(form.cleaned_data.get('date_time'))
+            except PairingError as error:
+                messages.add_message(request, messages.ERROR, str(error))
+            else:
+                messages.add_message(request, messages.SUCCESS, f'Round {self.tournament.current_round} has been paired with {len(matches)} matches')
+        return redirect('show_tournament', kwargs['club_id'], kwargs['tournament_id'])
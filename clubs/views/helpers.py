@@ -5,7 +5,9 @@ from django.contrib.auth.decorators import login_required
 from django.shortcuts import redirect
 from django.utils.decorators import method_decorator
 from django.contrib import messages
-from clubs.models import Club, Match
+from clubs.models import Application, Club, Match, Membership, archived_matches_of, archived_results, withdraw_from_club_matches
+from django.db import transaction
+from django.core.paginator import Paginator
 from django.views import View
 from django.core.exceptions import ObjectDoesNotExist
 
@@ -28,9 +30,6 @@ class LoginProhibitedMixin:
 class PermissionContextMixin:
     def get_context_data(self, *args, **kwargs):
         context = super().get_context_data(*args, **kwargs)
-        context['logged_in_user_is_member'] = _is_member(self.request, self.kwargs['club_id'])
-        context['logged_in_user_is_officer'] = _is_officer(self.request, self.kwargs['club_id'])
-        context['logged_in_user_is_owner'] = _is_owner(self.request, self.kwargs['club_id'])
         context['club_id'] = self.kwargs['club_id']
         return context
 
@@ -87,22 +86,72 @@ class ChangeMatchOutcome(View):
         """Redirect to club home of match cannot be changed, dispatch as normal otherwise."""
         self.kwargs = kwargs
         try:
-            self.match = Match.objects.get(id=kwargs['match_id'])
+            self.match = Match.objects.in_open_clubs().for_display().get(id=kwargs['match_id'])
             self.handle(request, *args, **kwargs)
         except ObjectDoesNotExist:
             messages.add_message(request, messages.ERROR, 'That match does not exist')
             return self.redirect()
-        if self.match.club.id == kwargs['club_id']:
+        if self.match.club_id == kwargs['club_id']:
             return super().dispatch(request, *args, **kwargs)
         else:
             messages.add_message(request, messages.ERROR, 'You are not in the right club to access this match')
             return self.redirect()
 
+# Archived matches shown per page of a full history
+ARCHIVE_PAGE_SIZE = 50
+
+def archive_history_context(request, user, club=None):
+    """Returns the archived results of a user, and their archived matches only when the full history is asked for."""
+    results = archived_results(user, club)
+    context = {'archived_results': results, 'full_history': request.GET.get('history') == 'full'}
+    if context['full_history'] and results['games']:
+        paginator = Paginator(archived_matches_of(user, club), ARCHIVE_PAGE_SIZE)
+        context['archived_matches'] = paginator.get_page(request.GET.get('page'))
+    return context
+
+# Applications shown per page of the applications of a user, and of their history
+APPLICATIONS_PAGE_SIZE = 25
+
+def application_list_context(request):
+    """Returns a page of the pending applications of the logged in user, and their processed
+    applications only when the history is asked for, each with its club loaded by the same query."""
+    applications = Application.objects.filter(user=request.user).select_related('user', 'club')
+    processed = applications.exclude(status=Application.PENDING)
+    context = {
+        'applications': Paginator(applications.filter(status=Application.PENDING), APPLICATIONS_PAGE_SIZE).get_page(request.GET.get('page')),
+        'full_history': request.GET.get('history') == 'full',
+    }
+    if context['full_history']:
+        context['history'] = Paginator(processed, APPLICATIONS_PAGE_SIZE).get_page(request.GET.get('history_page'))
+        context['history_count'] = context['history'].paginator.count
+    else:
+        context['history_count'] = processed.count()
+    return context
+
+def remove_membership(membership):
+    """Removes a member from their club, rejects their accepted application and resolves
+    their pending matches, in one transaction."""
+    with transaction.atomic():
+        Application.objects.filter(user_id=membership.user_id, club_id=membership.club_id,
+            status=Application.ACCEPTED).update(status=Application.REJECTED)
+        withdraw_from_club_matches(membership.club_id, membership.user_id)
+        membership.delete()
+
+def membership_role(request, club_id):
+    """Returns the role of the logged in user in the club, or None, with at most one query per club and request."""
+    roles = request.__dict__.setdefault('_membership_roles', {})
+    if club_id not in roles:
+        roles[club_id] = None
+        if request.user.is_authenticated:
+            roles[club_id] = (Membership.objects.filter(user_id=request.user.id, club_id=club_id)
+                .values_list('role', flat=True).first())
+    return roles[club_id]
+
 def _is_member(request, club_id):
-    return request.user.is_member_of(Club.objects.get(id=club_id)) or _is_officer(request, club_id)
+    return membership_role(request, club_id) is not None
 
 def _is_officer(request, club_id):
-    return request.user.is_officer_of(Club.objects.get(id=club_id)) or _is_owner(request, club_id)
+    return membership_role(request, club_id) in (Membership.OFFICER, Membership.OWNER)
 
 def _is_owner(request, club_id):
-    return request.user.is_owner_of(Club.objects.get(id=club_id))
+    return membership_role(request, club_id) == Membership.OWNER
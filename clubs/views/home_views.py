@@ -4,12 +4,14 @@ from django.shortcuts import render
 from clubs.views.helpers import login_prohibited
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.views.generic.base import TemplateView, View
-from clubs.models import Application, Membership, Club, User
+from clubs.models import Application, Membership, Club, nearest_clubs
+from clubs.geo import geocode
 from django.shortcuts import redirect, render
 from django.contrib import messages
-from clubs.views.helpers import MembershipRequiredMixin, OwnerRequiredMixin
+from clubs.views.helpers import MembershipRequiredMixin, OwnerRequiredMixin, remove_membership
 from clubs.forms import CreateClubForm
-from django.core.mail import EmailMessage
+from clubs.deletion import delete_club
+from django.db import transaction
 
 
 @login_prohibited
@@ -39,18 +41,14 @@ class LeaveClubView(MembershipRequiredMixin, View):
 
     def post(self, request, *args, **kwargs):
         """Removes user from club"""
-        club = Club.objects.get(id=self.kwargs['club_id'])
-        member = Membership.objects.get(user=request.user, club=club)
-        if member.role == Membership.OWNER:
-            messages.warning(request, "Owners are not allowed to leave their club.")
-            return redirect('club_home', self.kwargs['club_id'])
-        else:
-            application = Application.objects.get(status=Application.ACCEPTED, club=club, user=member.user)
-            application.status = Application.REJECTED
-            application.save()
-            member.delete()
-            messages.success(request, "You have successfully left the club")
-            return redirect('dashboard')
+        with transaction.atomic():
+            member = Membership.objects.select_for_update().get(user=request.user, club_id=self.kwargs['club_id'])
+            if member.role == Membership.OWNER:
+                messages.warning(request, "Owners are not allowed to leave their club.")
+                return redirect('club_home', self.kwargs['club_id'])
+            remove_membership(member)
+        messages.success(request, "You have successfully left the club")
+        return redirect('dashboard')
 
 class CreateClubView(LoginRequiredMixin, View):
     """View that handles creating a new club."""
@@ -93,29 +91,42 @@ class DeleteClubView(OwnerRequiredMixin, View):
         return render(request, 'home_templates/delete_club.html', {'club': club})
 
     def post(self, request, *args, **kwargs):
-        """Handle delete club attempt."""
+        """Handle delete club attempt.
+
+        The club is hidden at once, its rows are purged and its members
+        emailed by the purge_deleted command.
+        """
         club = Club.objects.get(id=kwargs['club_id'])
-        self.send_emails(club)
-        club.delete()
+        delete_club(club)
         messages.add_message(self.request, messages.SUCCESS, 'You have successfully deleted your club')
         return redirect('dashboard')
 
-    def send_emails(self, club):
-        """Send email about club deletion"""
-        membership = Membership.objects.filter(club = club)
-        members = User.objects.filter(membership__in = membership)
-
-        emails = []
-        for member in members:
-            emails.append(member.email)
-        email = EmailMessage(
-            'Club Deleted',
-            f'You are recieving this email because the {club.name} club was recently deleted.'
-            '\nAs a former member of this club, you will no longer be able to access its home page.'
-            '\nWe are sorry if this causes any inconveniences.'
-            '\n'
-            '\nThe Polecat Chess Team',
-            'polecatchess@gmail.com',
-            bcc=emails
-        )
-        email.send()
+class NearbyClubsView(LoginRequiredMixin, TemplateView):
+    """View that displays the clubs closest to a place or to the user's position."""
+    template_name = 'home_templates/nearby_clubs.html'
+
+    NEARBY_CLUB_COUNT = 10
+
+    def get_context_data(self, *args, **kwargs):
+        context = super().get_context_data(*args, **kwargs)
+        context['near'] = self.request.GET.get('near', '').strip()
+        coordinates = self.coordinates(context['near'])
+        if coordinates is None:
+            if context['near']:
+                messages.add_message(self.request, messages.ERROR, 'That place could not be found!')
+            return context
+        context['searched'] = True
+        context['clubs'] = nearest_clubs(*coordinates, count=self.NEARBY_CLUB_COUNT)
+        context['my_club_ids'] = set(Membership.objects.filter(user=self.request.user).values_list('club_id', flat=True))
+        return context
+
+    def coordinates(self, near):
+        """Returns the position sent by the browser, or the coordinates of the place typed in."""
+        try:
+            latitude = float(self.request.GET['latitude'])
+            longitude = float(self.request.GET['longitude'])
+        except (KeyError, ValueError):
+            return geocode(near) if near else None
+        if -90 <= latitude <= 90 and -180 <= longitude <= 180:
+            return latitude, longitude
+        return None
@@ -1,11 +1,12 @@
 """Views for user matches."""
 
-from clubs.models import Match
+from django.db.models import Q
+from clubs.models import Match, MatchEvent
 from django.views.generic.base import TemplateView
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.shortcuts import redirect
 from django.contrib import messages
-from clubs.views.helpers import ChangeMatchOutcome
+from clubs.views.helpers import ChangeMatchOutcome, archive_history_context
 
 class UserMatchesView(LoginRequiredMixin, TemplateView):
     """ View for displaying the user's list of matches """
@@ -13,14 +14,16 @@ class UserMatchesView(LoginRequiredMixin, TemplateView):
 
     def get_context_data(self, *args, **kwargs):
         context = super().get_context_data(**kwargs)
-        matches = Match.objects.filter(player_1=self.request.user) | Match.objects.filter(player_2=self.request.user)
-        context['upcoming_matches'] = matches.filter(status=Match.PENDING).order_by('-date_time')
-        context['previous_matches'] = matches.exclude(status=Match.PENDING).order_by('-date_time')
-        context['wins'] = len(Match.objects.filter(player_1=self.request.user, status=Match.PLAYER1)) + len(
-            Match.objects.filter(player_2=self.request.user, status=Match.PLAYER2))
-        context['losses'] = len(Match.objects.filter(player_2=self.request.user, status=Match.PLAYER1)) + len(
-            Match.objects.filter(player_1=self.request.user, status=Match.PLAYER2))
-        context['draws'] = len(matches.filter(status=Match.DRAW))
+        matches = Match.objects.in_open_clubs().filter(Q(player_1=self.request.user) | Q(player_2=self.request.user))
+        context['upcoming_matches'] = matches.filter(status=Match.PENDING).order_by('-date_time').for_display()
+        context['previous_matches'] = matches.exclude(status=Match.PENDING).order_by('-date_time').for_display()
+        context.update(archive_history_context(self.request, self.request.user))
+        archived = context['archived_results']
+        context['wins'] = len(matches.filter(player_1=self.request.user, status=Match.PLAYER1)) + len(
+            matches.filter(player_2=self.request.user, status=Match.PLAYER2)) + archived['wins']
+        context['losses'] = len(matches.filter(player_2=self.request.user, status=Match.PLAYER1)) + len(
+            matches.filter(player_1=self.request.user, status=Match.PLAYER2)) + archived['losses']
+        context['draws'] = len(matches.filter(status=Match.DRAW)) + archived['draws']
         return context
 
 
@@ -40,10 +43,12 @@ class ForfeitMatchView(LoginRequiredMixin, ChangeMatchOutcome):
         if self.request.user == self.match.player_1:
             self.match.status = Match.PLAYER2
             self.match.save()
+            MatchEvent.publish(self.match, MatchEvent.FORFEITED)
             messages.add_message(request, messages.SUCCESS, 'Match has been successfully forfeited')
         elif self.request.user == self.match.player_2:
             self.match.status = Match.PLAYER1
             self.match.save()
+            MatchEvent.publish(self.match, MatchEvent.FORFEITED)
             messages.add_message(request, messages.SUCCESS, 'Match has been successfully forfeited')
         else:
             messages.add_message(request, messages.ERROR, 'You cannot forfeit this match')
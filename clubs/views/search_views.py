@@ -0,0 +1,49 @@
+"""Views for searching clubs and users."""
+
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.http import JsonResponse
+from django.views.generic.base import TemplateView, View
+from clubs.search import autocomplete_clubs, autocomplete_members, search_clubs, search_users
+from clubs.views.helpers import MembershipRequiredMixin
+
+class SearchView(LoginRequiredMixin, TemplateView):
+    """View that displays the clubs and users matching a query, best matches first."""
+    template_name = 'home_templates/search.html'
+
+    # Kinds of results that can be searched for
+    CLUBS = 'clubs'
+    USERS = 'users'
+
+    def get_context_data(self, *args, **kwargs):
+        """Generate context data to be shown in the template."""
+        context = super().get_context_data(*args, **kwargs)
+        query = self.request.GET.get('q', '').strip()
+        kind = self.USERS if self.request.GET.get('kind') == self.USERS else self.CLUBS
+        try:
+            page = int(self.request.GET.get('page', 1))
+        except ValueError:
+            page = 1
+        search = search_users if kind == self.USERS else search_clubs
+        context['query'] = query
+        context['kind'] = kind
+        context['page'] = search(query, page)
+        context['my_club_ids'] = set(self.request.user.membership_set.values_list('club_id', flat=True))
+        return context
+
+class ClubAutocompleteView(LoginRequiredMixin, View):
+    """View that returns the clubs whose name starts with ?q= as JSON, for autocomplete widgets."""
+
+    http_method_names = ['get']
+
+    def get(self, request, *args, **kwargs):
+        """Return the id and name of the matching clubs."""
+        return JsonResponse({'results': autocomplete_clubs(request.GET.get('q', ''))})
+
+class MemberAutocompleteView(MembershipRequiredMixin, View):
+    """View that returns the members of a club whose name or username starts with ?q= as JSON."""
+
+    http_method_names = ['get']
+
+    def get(self, request, *args, **kwargs):
+        """Return the id and label of the matching members."""
+        return JsonResponse({'results': autocomplete_members(kwargs['club_id'], request.GET.get('q', ''))})
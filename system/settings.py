@@ -68,6 +68,8 @@ TEMPLATES = [
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
+                'clubs.context_processors.club_roles',
+                'clubs.context_processors.my_clubs',
             ],
         },
     },
@@ -119,6 +121,19 @@ REDIRECT_URL_WHEN_MEMBERSHIP_REQUIRED = 'applications'
 # The redirection url when the user is not a member but the view is membership required
 REDIRECT_URL_WHEN_PERMISSIONS_ARE_NOT_HIGH_ENOUGH = 'club_home'
 
+# Live match events, the club home page asks for new ones at this interval
+MATCH_EVENT_POLL_MILLISECONDS = 5000
+
+# Match events older than this many hours are deleted by prune_match_events,
+# this many per transaction, a page only asks for the events since it loaded
+MATCH_EVENT_RETENTION_HOURS = 24
+MATCH_EVENT_CLEANUP_BATCH_SIZE = 1000
+
+# Finished matches and rejected applications older than these numbers of days
+# are moved to the archive tables by the archive_history command
+ARCHIVE_MATCHES_AFTER_DAYS = 365
+ARCHIVE_APPLICATIONS_AFTER_DAYS = 90
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/3.2/topics/i18n/
@@ -144,6 +159,11 @@ STATICFILES_DIRS = [
     os.path.join(BASE_DIR, 'static')
 ]
 
+# collectstatic stores every file under a name with a hash of its content and
+# writes gzip and brotli variants next to it, WhiteNoise serves the hashed
+# files with a far-future immutable Cache-Control header
+STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/3.2/ref/settings/#default-auto-field
 
@@ -155,6 +175,50 @@ MESSAGE_TAGS = {
     message_constants.ERROR: 'danger',
 }
 
+# CACHE_LOCATION points every worker process at one memcached server (the
+# pymemcache package is then needed). Without it each process has a local
+# memory cache of its own, which the others never see, so nothing that has
+# to be invalidated across requests is kept in it.
+CACHE_LOCATION = os.environ.get('CACHE_LOCATION')
+SHARED_CACHE = bool(CACHE_LOCATION)
+if SHARED_CACHE:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.memcached.PyMemcacheCache',
+            'LOCATION': CACHE_LOCATION,
+        }
+    }
+
+# With a shared cache sessions are read from it and written through to the
+# database by default, so a request only queries the session table on a
+# cache miss. Without one they are read from the database, as a session
+# flushed by one worker must not live on in the cache of another.
+# SESSION_BACKEND=signed_cookies keeps them in a signed cookie instead and
+# SESSION_BACKEND=db always reads the database.
+SESSION_BACKENDS = {
+    'db': 'django.contrib.sessions.backends.db',
+    'cached_db': 'django.contrib.sessions.backends.cached_db',
+    'signed_cookies': 'django.contrib.sessions.backends.signed_cookies',
+}
+SESSION_ENGINE = SESSION_BACKENDS[os.environ.get('SESSION_BACKEND', 'cached_db' if SHARED_CACHE else 'db')]
+
+# Messages are kept in a cookie so adding one never loads or saves the
+# session, MESSAGE_BACKEND=fallback moves them to the session when they
+# do not fit in the cookie
+MESSAGE_BACKENDS = {
+    'cookie': 'django.contrib.messages.storage.cookie.CookieStorage',
+    'fallback': 'django.contrib.messages.storage.fallback.FallbackStorage',
+    'session': 'django.contrib.messages.storage.session.SessionStorage',
+}
+MESSAGE_STORAGE = MESSAGE_BACKENDS[os.environ.get('MESSAGE_BACKEND', 'cookie')]
+
+# Expired sessions deleted per transaction by clear_expired_sessions
+SESSION_CLEANUP_BATCH_SIZE = 1000
+
+# With a shared cache the "My clubs" menu of each user is cached for this
+# many seconds, a change to their memberships replaces it sooner
+CLUB_MENU_CACHE_SECONDS = 60 * 60 * 24
+
 # Backend for email testing in console
 # EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
 
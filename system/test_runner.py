@@ -0,0 +1,96 @@
+"""Test runner that can report the time taken by each test module."""
+
+import json
+import os
+import sys
+import time
+import unittest
+from collections import defaultdict
+from django.test.runner import DiscoverRunner
+
+class TimingTextTestResult(unittest.TextTestResult):
+    """Test result that adds up the time of the tests of each module.
+
+    The time between the end of a test and the end of the next one is given
+    to the module of the next test, so class level setup such as loading
+    fixtures counts towards the module that needs it.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.module_seconds = defaultdict(float)
+        self.module_tests = defaultdict(int)
+        self._last_stop = None
+
+    def startTestRun(self):
+        super().startTestRun()
+        self._last_stop = time.perf_counter()
+
+    def stopTest(self, test):
+        super().stopTest(test)
+        now = time.perf_counter()
+        module = type(test).__module__
+        self.module_seconds[module] += now - self._last_stop
+        self.module_tests[module] += 1
+        self._last_stop = now
+
+class TimingTestRunner(DiscoverRunner):
+    """Test runner with a --timing-report option writing the time of each module to a JSON file.
+
+    When the file already holds a report, the speedup of each module against
+    it is printed before the file is replaced.
+    """
+
+    def __init__(self, timing_report=None, **kwargs):
+        super().__init__(**kwargs)
+        self.timing_report = timing_report
+        if self.timing_report and self.parallel > 1:
+            sys.stderr.write("The timing report is not available with --parallel, run the tests in one process for it.\n")
+            self.timing_report = None
+
+    @classmethod
+    def add_arguments(cls, parser):
+        super().add_arguments(parser)
+        parser.add_argument(
+            '--timing-report', metavar='FILE', default=None,
+            help='Write the time of each test module to FILE and compare it with the report already there.',
+        )
+
+    def get_resultclass(self):
+        resultclass = super().get_resultclass()
+        if self.timing_report and resultclass is None:
+            return TimingTextTestResult
+        return resultclass
+
+    def run_suite(self, suite, **kwargs):
+        result = super().run_suite(suite, **kwargs)
+        if isinstance(result, TimingTextTestResult):
+            self.write_timing_report(result)
+        return result
+
+    def write_timing_report(self, result):
+        """Prints the time of each module, slowest first, with its speedup, and saves the report."""
+        previous = {}
+        if os.path.exists(self.timing_report):
+            with open(self.timing_report) as report_file:
+                previous = json.load(report_file)
+        report = {
+            module: {'tests': result.module_tests[module], 'seconds': round(seconds, 4)}
+            for module, seconds in result.module_seconds.items()
+        }
+        lines = [f"{'Module':<70} {'Tests':>5} {'Seconds':>8} {'Before':>8} {'Speedup':>8}"]
+        for module, timing in sorted(report.items(), key=lambda item: -item[1]['seconds']):
+            lines.append(f"{module:<70} {timing['tests']:>5} {timing['seconds']:>8.3f}" + self._comparison(timing, previous.get(module)))
+        total = sum(timing['seconds'] for timing in report.values())
+        previous_total = sum(timing['seconds'] for timing in previous.values()) if previous else None
+        lines.append(f"{'Total':<70} {sum(result.module_tests.values()):>5} {total:>8.3f}"
+            + self._comparison({'seconds': total}, {'seconds': previous_total} if previous_total else None))
+        sys.stderr.write('\n' + '\n'.join(lines) + '\n')
+        with open(self.timing_report, 'w') as report_file:
+            json.dump(report, report_file, indent=2, sort_keys=True)
+
+    def _comparison(self, timing, previous):
+        """Returns the previous time and the speedup columns of a line of the report."""
+        if not previous or not timing['seconds']:
+            return ''
+        return f" {previous['seconds']:>8.3f} {previous['seconds'] / timing['seconds']:>7.1f}x"
@@ -0,0 +1,26 @@
+"""Settings used to run the tests.
+
+They are the project settings with the parts that only cost time in a test
+run swapped for cheap ones. manage.py uses them for the test command.
+"""
+
+from .settings import *
+
+# Hashing with PBKDF2 dominates the tests that log in, the user fixtures
+# store MD5 hashes of their password
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+]
+
+TEST_RUNNER = 'system.test_runner.TimingTestRunner'
+
+# The tests do not run collectstatic, so there is no manifest of hashed names
+STATICFILES_STORAGE = 'django.contrib.staticfiles.storage.StaticFilesStorage'
+
+# Tests roll back the database but not a cache, so nothing is cached between
+# them, the tests of caching use a local memory cache of their own
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
+    }
+}
@@ -23,6 +23,9 @@ urlpatterns = [
     path('sign_up/', views.sign_up, name="sign_up"),
     path('log_in/', views.LogInView.as_view(), name="log_in"),
     path('dashboard/', views.ClubListView.as_view(), name="dashboard"),
+    path('search/', views.SearchView.as_view(), name="search"),
+    path('autocomplete/clubs/', views.ClubAutocompleteView.as_view(), name="club_autocomplete"),
+    path('nearby_clubs/', views.NearbyClubsView.as_view(), name="nearby_clubs"),
     path('applications/', views.ApplicationListView.as_view(), name="applications"),
     path('log_out/', views.log_out, name='log_out'),
     path('application/', views.NewApplicationView.as_view(), name="application"),
@@ -37,7 +40,11 @@ urlpatterns = [
     path('password_reset/complete/', views.PasswordResetCompleteView.as_view(), name='password_reset_complete'),
     path('create_club/', views.CreateClubView.as_view(), name="create_club"),
     path('club/<int:club_id>', views.ClubHomeView.as_view(), name="club_home"),
+    path('club/<int:club_id>/match_events', views.ClubMatchEventsView.as_view(), name="club_match_events"),
     path('club/<int:club_id>/members/', views.MembersListView.as_view(), name='members_list'),
+    path('club/<int:club_id>/autocomplete/members/', views.MemberAutocompleteView.as_view(), name='member_autocomplete'),
+    path('club/<int:club_id>/export/<str:kind>', views.ClubExportView.as_view(), name='club_export'),
+    path('club/<int:club_id>/import', views.ClubImportView.as_view(), name='club_import'),
     path('club/<int:club_id>/applications/', views.ClubApplicationsView.as_view(), name="club_application_list"),
     path('club/<int:club_id>/accept_application/<int:application_id>', views.AcceptApplicationView.as_view(), name='accept_application'),
     path('club/<int:club_id>/reject_application/<int:application_id>', views.RejectApplicationView.as_view(), name='reject_application'),   
@@ -53,6 +60,9 @@ urlpatterns = [
     path('club/<int:club_id>/update_match/<int:match_id>', views.UpdateMatchOutcomeView.as_view(), name="update_match"),
     path('club/<int:club_id>/forfeit_match/<int:match_id>', views.ForfeitMatchView.as_view(), name='forfeit_match'),
     path('club/<int:club_id>/cancel_match/<int:match_id>', views.CancelMatchView.as_view(), name="cancel_match"),
-
+    path('club/<int:club_id>/tournaments/', views.TournamentListView.as_view(), name="tournament_list"),
+    path('club/<int:club_id>/create_tournament', views.CreateTournamentView.as_view(), name="create_tournament"),
+    path('club/<int:club_id>/tournament/<int:tournament_id>', views.ShowTournamentView.as_view(), name="show_tournament"),
+    path('club/<int:club_id>/tournament/<int:tournament_id>/pair_round', views.PairTournamentRoundView.as_view(), name="pair_tournament_round"),
 ]
 